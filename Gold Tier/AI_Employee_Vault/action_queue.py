@@ -0,0 +1,236 @@
+"""
+Action Queue - Priority-ordered dispatch of /Needs_Action/ items
+Orders action files by their frontmatter `priority` (or a default per
+`type`), oldest `received` first within a priority.
+
+Dispatch order:
+1. Priority tiers, most urgent first: high, normal, low.
+2. Aging: an item that has waited QUEUE_AGING_MINUTES moves up one tier
+   (two tiers after twice as long), so a steady stream of normal mail
+   cannot starve a low-priority file drop forever. An aged item goes behind
+   every native item of the tier it joins, so it never overtakes a fresh
+   item that was tagged with that priority.
+3. Quotas, within each tier only: each dispatch round takes at most a
+   per-source quota of items of one type, so a burst from one watcher does
+   not push the other sources of the same tier to the back. Quotas never
+   let an item overtake a more urgent tier.
+
+Frontmatter is only re-read when a file's mtime or size changes.
+"""
+
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+VAULT_PATH = Path(__file__).parent
+NEEDS_ACTION = VAULT_PATH / 'Needs_Action'
+
+# Priority levels, most urgent first
+PRIORITIES = ('high', 'normal', 'low')
+# Other spellings used in frontmatter
+PRIORITY_ALIASES = {'urgent': 'high', 'critical': 'high', 'medium': 'normal', 'routine': 'low'}
+# Priority of items whose frontmatter has none, by type
+TYPE_PRIORITY = {'scheduler_trigger': 'low'}
+DEFAULT_PRIORITY = 'normal'
+# Types that are instructions to the AI rather than queued work (left out of queue depth)
+CONTROL_TYPES = {'scheduler_trigger'}
+
+# Minutes of waiting that promote an item one priority level (0 = no aging)
+AGING_MINUTES = float(os.getenv('QUEUE_AGING_MINUTES', '240'))
+# Items of one source (type) per dispatch round (0 = unlimited)
+SOURCE_QUOTA = int(os.getenv('QUEUE_SOURCE_QUOTA', '3'))
+# Per-source overrides, e.g. "email=5,whatsapp=2"
+SOURCE_QUOTAS = os.getenv('QUEUE_SOURCE_QUOTAS', '')
+# Only the frontmatter at the top of a note is read
+FRONTMATTER_BYTES = 2048
+
+
+def parse_quotas(spec: str) -> Dict[str, int]:
+    """Parse "type=n,type=n" into a dict (malformed entries are ignored)."""
+    quotas = {}
+    for entry in spec.split(','):
+        name, _, value = entry.partition('=')
+        try:
+            quotas[name.strip()] = int(value)
+        except ValueError:
+            continue
+    return quotas
+
+
+def normalize_priority(value: Optional[str], item_type: Optional[str] = None) -> str:
+    """Map a frontmatter priority (or, without one, the item type) to a level in PRIORITIES."""
+    if value:
+        value = value.strip().strip('"\'').lower()
+        value = PRIORITY_ALIASES.get(value, value)
+        if value in PRIORITIES:
+            return value
+    return TYPE_PRIORITY.get(item_type, DEFAULT_PRIORITY)
+
+
+def read_frontmatter(path: Path) -> Dict[str, str]:
+    """Key/value pairs from a note's frontmatter ({} if it has none)."""
+    try:
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            head = f.read(FRONTMATTER_BYTES)
+    except OSError:
+        return {}
+    if not head.startswith('---'):
+        return {}
+    fields = {}
+    for line in head.splitlines()[1:]:
+        if line.strip() == '---':
+            break
+        key, sep, value = line.partition(':')
+        if sep and key and not key.startswith(' '):
+            fields[key.strip()] = value.strip().strip('"\'')
+    return fields
+
+
+def read_trigger_manifest(path: Path) -> List[str]:
+    """Item paths (relative to the vault) still unchecked ("- [ ] ...") in a scheduler trigger file."""
+    return [line[6:].strip() for line in path.read_text(encoding='utf-8').splitlines()
+            if line.startswith('- [ ] ')]
+
+
+def _parse_received(value: Optional[str], fallback: float) -> float:
+    """Timestamp of a `received` value, or the fallback if missing or unparseable."""
+    if value:
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            pass
+    return fallback
+
+
+class ActionQueue:
+    """Priority, aging and per-source quota ordering over a folder of action files."""
+
+    def __init__(self, aging_minutes: float = AGING_MINUTES, source_quota: int = SOURCE_QUOTA,
+                 source_quotas: Optional[Dict[str, int]] = None):
+        self.aging_seconds = aging_minutes * 60
+        self.source_quota = source_quota
+        self.source_quotas = parse_quotas(SOURCE_QUOTAS) if source_quotas is None else source_quotas
+        self._lock = threading.Lock()
+        # path -> ((mtime_ns, size), item)
+        self._items: Dict[str, tuple] = {}
+        self.stats = {'parses': 0, 'cache_hits': 0}
+
+    def item(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Queue metadata of an action file: path, type, priority, received (None if it's gone)."""
+        try:
+            st = path.stat()
+        except OSError:
+            with self._lock:
+                self._items.pop(str(path), None)
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._items.get(str(path))
+            if cached and cached[0] == signature:
+                self.stats['cache_hits'] += 1
+                return cached[1]
+        fields = read_frontmatter(path)
+        item_type = fields.get('type') or 'unknown'
+        item = {
+            'path': path,
+            'type': item_type,
+            'priority': normalize_priority(fields.get('priority'), item_type),
+            'received': _parse_received(fields.get('received'), st.st_mtime),
+        }
+        with self._lock:
+            self._items[str(path)] = (signature, item)
+            self.stats['parses'] += 1
+        return item
+
+    def rank(self, item: Dict[str, Any], now: float) -> tuple:
+        """
+        (tier, aged) of an item: its priority level after aging, and whether it
+        got there by aging (aged items queue behind the tier's native items).
+        """
+        level = PRIORITIES.index(item['priority'])
+        promotions = 0
+        if self.aging_seconds > 0:
+            promotions = min(level, int(max(0.0, now - item['received']) // self.aging_seconds))
+        return level - promotions, promotions > 0
+
+    def quota_for(self, source: str) -> int:
+        """Items of a source allowed per dispatch round (0 = unlimited)."""
+        return self.source_quotas.get(source, self.source_quota)
+
+    def order(self, paths: Iterable[Path], now: Optional[float] = None) -> List[Path]:
+        """
+        Dispatch order for action files.
+
+        Items are ranked by tier (native items before aged ones), then by when
+        they were received. Each tier is then cut into rounds in which each
+        source contributes at most its quota; items over quota move to the
+        tier's next round instead of being dropped.
+        """
+        now = datetime.now().timestamp() if now is None else now
+        tiers: Dict[tuple, List[Dict[str, Any]]] = {}
+        for item in (self.item(Path(path)) for path in paths):
+            if item:
+                tiers.setdefault(self.rank(item, now), []).append(item)
+        ordered = []
+        for tier in sorted(tiers):
+            remaining = sorted(tiers[tier], key=lambda item: (item['received'], item['path'].name))
+            while remaining:
+                taken = Counter()
+                deferred = []
+                for item in remaining:
+                    quota = self.quota_for(item['type'])
+                    if quota <= 0 or taken[item['type']] < quota:
+                        taken[item['type']] += 1
+                        ordered.append(item['path'])
+                    else:
+                        deferred.append(item)
+                remaining = deferred
+        return ordered
+
+    def depth_by_priority(self, paths: Iterable[Path]) -> Dict[str, int]:
+        """Number of action files at each priority level (as tagged, before aging)."""
+        depth = dict.fromkeys(PRIORITIES, 0)
+        for path in paths:
+            item = self.item(Path(path))
+            if item and item['type'] not in CONTROL_TYPES:
+                depth[item['priority']] += 1
+        return depth
+
+    def retain(self, paths: Iterable[Path]):
+        """Drop cached metadata for files not in paths."""
+        keep = {str(path) for path in paths}
+        with self._lock:
+            for key in [key for key in self._items if key not in keep]:
+                del self._items[key]
+
+
+# Singleton instance
+_action_queue = None
+
+
+def get_action_queue() -> ActionQueue:
+    """Get the singleton action queue instance."""
+    global _action_queue
+    if _action_queue is None:
+        _action_queue = ActionQueue()
+    return _action_queue
+
+
+def dispatch_order(folder: Path = NEEDS_ACTION, exclude_prefix: Optional[str] = None,
+                   work_only: bool = False) -> List[Path]:
+    """
+    The .md files in a folder in dispatch order.
+
+    Names starting with exclude_prefix are skipped, and with work_only so are
+    control files (CONTROL_TYPES, e.g. scheduler triggers), which are
+    instructions to the AI rather than items to plan.
+    """
+    queue = get_action_queue()
+    paths = [path for path in folder.glob('*.md')
+             if not (exclude_prefix and path.name.startswith(exclude_prefix))]
+    if work_only:
+        paths = [path for path in paths if (queue.item(path) or {}).get('type') not in CONTROL_TYPES]
+    return queue.order(paths)
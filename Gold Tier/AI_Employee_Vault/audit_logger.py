@@ -1,16 +1,29 @@
 # audit_logger.py
 # Gold Tier: Comprehensive audit logging system
-# Logs every action to /Logs/audit/YYYY-MM-DD.json
-# Keeps logs for 90 days
-# Provides weekly summary for briefings
+# Logs every action to /Logs/audit/YYYY-MM-DD.<shard>.jsonl (append-only, one shard per process)
+# Old journals are compacted into /Logs/audit/YYYY-MM-DD.json
+# Keeps logs for 90 days; optionally rolls older days into compressed monthly archives
+# Provides weekly summary for briefings from per-day rollups in /Logs/audit/rollup/
+# Optional async writer mode group-commits entries from a background thread
 
 import os
+import re
+import sys
+import csv
 import json
+import argparse
+import time
+import zlib
+import gzip
+import queue
+import atexit
 import logging
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple, Iterator, Callable, TextIO
 
 # Load environment variables
 load_dotenv()
@@ -20,10 +33,56 @@ VAULT_PATH = Path(os.getenv('VAULT_PATH', './AI_Employee_Vault'))
 LOGS_PATH = VAULT_PATH / 'Logs'
 AUDIT_PATH = LOGS_PATH / 'audit'
 ERRORS_PATH = LOGS_PATH / 'errors'
-RETENTION_DAYS = 90
+# Retention tiers: hot JSON/JSONL files -> warm compressed monthly archive -> delete
+RETENTION_DAYS = int(os.getenv('AUDIT_RETENTION_DAYS', '90'))
+AUDIT_ARCHIVE = os.getenv('AUDIT_ARCHIVE', 'false').lower() == 'true'
+AUDIT_HOT_DAYS = int(os.getenv('AUDIT_HOT_DAYS', '14'))
+# archive/YYYY-MM.jsonl.gz holds one gzip member per day, archive/YYYY-MM.index.json
+# maps each day to its byte offset/length so a single day can be read without the month
+ARCHIVE_PATH = AUDIT_PATH / 'archive'
+ARCHIVE_READ_CHUNK = 64 * 1024
+
+EXPORT_CSV_COLUMNS = ['timestamp', 'action_type', 'actor', 'result', 'details', 'metadata']
+
+# Journal settings
+# AUDIT_FORMAT: 'jsonl' appends one entry per line, 'json' rewrites the whole day
+# (legacy, single-process only: concurrent processes overwrite each other)
+AUDIT_FORMAT = os.getenv('AUDIT_FORMAT', 'jsonl').lower()
+# Journals older than this many days are compacted into YYYY-MM-DD.json (0 = never)
+AUDIT_COMPACT_AFTER_DAYS = int(os.getenv('AUDIT_COMPACT_AFTER_DAYS', '1'))
+COMPACT_LOCK = AUDIT_PATH / '.compact.lock'
+
+# Rollup index: per-day counters (by result/type/actor/hour) kept next to the journals
+# rollup/YYYY-MM-DD.<shard>.json is maintained live by each process,
+# rollup/YYYY-MM-DD.json is the final day-level rollup written at compaction
+ROLLUP_PATH = AUDIT_PATH / 'rollup'
+ROLLUP_SAVE_INTERVAL = float(os.getenv('AUDIT_ROLLUP_SAVE_INTERVAL', '5'))
+
+# Each process appends to its own journal shard (YYYY-MM-DD.<shard>.jsonl) with
+# O_APPEND, so services never contend for or rewrite each other's files.
+# Readers merge all shards of a day by timestamp.
+AUDIT_SHARD_ID = re.sub(
+    r'[^A-Za-z0-9_-]', '_',
+    os.getenv('AUDIT_SHARD_ID') or f"{Path(sys.argv[0] or 'python').stem}-{os.getpid()}"
+)
+
+# Writer settings
+# AUDIT_WRITER_MODE: 'async' (fire-and-forget, background flusher) or 'sync' (write inside log())
+AUDIT_WRITER_MODE = os.getenv('AUDIT_WRITER_MODE', 'async').lower()
+AUDIT_QUEUE_SIZE = int(os.getenv('AUDIT_QUEUE_SIZE', '10000'))
+AUDIT_FLUSH_INTERVAL_MS = int(os.getenv('AUDIT_FLUSH_INTERVAL_MS', '200'))
+AUDIT_FLUSH_BATCH_SIZE = int(os.getenv('AUDIT_FLUSH_BATCH_SIZE', '500'))
+# How long log() may block on a full queue before writing the entry itself
+AUDIT_ENQUEUE_TIMEOUT = float(os.getenv('AUDIT_ENQUEUE_TIMEOUT', '1.0'))
+# AUDIT_FSYNC: 'none', 'batch' (fsync once per group commit) or 'entry' (fsync every entry)
+AUDIT_FSYNC = os.getenv('AUDIT_FSYNC', 'none').lower()
+# Recent entries kept in memory for date-less queries (ring buffer)
+AUDIT_RECENT_ENTRIES = int(os.getenv('AUDIT_RECENT_ENTRIES', '1000'))
 
 # Ensure directories exist
 AUDIT_PATH.mkdir(parents=True, exist_ok=True)
+ROLLUP_PATH.mkdir(parents=True, exist_ok=True)
+ARCHIVE_PATH.mkdir(parents=True, exist_ok=True)
 ERRORS_PATH.mkdir(parents=True, exist_ok=True)
 
 # Setup logging
@@ -38,36 +97,369 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+_journal_lock = threading.Lock()
+
+
+def _write_journal_lines(journal_file: Path, lines: List[str], fsync_policy: str = AUDIT_FSYNC):
+    """
+    Append lines to a journal shard with O_APPEND, honouring the fsync policy.
+    
+    The file is reopened per call so a shard renamed away by compaction is
+    simply recreated on the next write.
+    """
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+    with _journal_lock:
+        fd = os.open(journal_file, flags, 0o644)
+        try:
+            if fsync_policy == 'entry':
+                for line in lines:
+                    os.write(fd, line.encode('utf-8'))
+                    os.fsync(fd)
+            else:
+                os.write(fd, ''.join(lines).encode('utf-8'))
+                if fsync_policy == 'batch':
+                    os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _journal_date(journal_file: Path) -> str:
+    """Extract YYYY-MM-DD from an audit file name (any shard or suffix)."""
+    return journal_file.name[:10]
+
+
+def _empty_rollup(date_str: str) -> Dict[str, Any]:
+    """Return an empty per-day rollup."""
+    return {
+        'date': date_str,
+        'total_actions': 0,
+        'by_result': {},
+        'by_type': {},
+        'by_actor': {},
+        'by_hour': {}
+    }
+
+
+def _add_to_rollup(rollup: Dict[str, Any], entry: Dict[str, Any]):
+    """Count a single entry into a rollup."""
+    result = entry.get('result', 'unknown')
+    action_type = entry.get('action_type', 'unknown')
+    actor = entry.get('actor', 'unknown')
+    hour = entry.get('timestamp', '')[11:13] or 'unknown'
+    
+    rollup['total_actions'] += 1
+    rollup['by_result'][result] = rollup['by_result'].get(result, 0) + 1
+    rollup['by_type'][action_type] = rollup['by_type'].get(action_type, 0) + 1
+    rollup['by_actor'][actor] = rollup['by_actor'].get(actor, 0) + 1
+    rollup['by_hour'][hour] = rollup['by_hour'].get(hour, 0) + 1
+
+
+def _merge_rollup(target: Dict[str, Any], source: Dict[str, Any]):
+    """Add the counters of one rollup into another."""
+    target['total_actions'] += source.get('total_actions', 0)
+    for key in ('by_result', 'by_type', 'by_actor', 'by_hour'):
+        for name, count in source.get(key, {}).items():
+            target[key][name] = target[key].get(name, 0) + count
+
+
+def _entry_matches(entry: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Check an entry against action_type/actor/result/metadata filters."""
+    for field in ('action_type', 'actor', 'result'):
+        wanted = filters.get(field)
+        if wanted is None:
+            continue
+        values = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+        if entry.get(field) not in values:
+            return False
+    
+    metadata = entry.get('metadata') or {}
+    for key, value in (filters.get('metadata') or {}).items():
+        if str(metadata.get(key)) != str(value):
+            return False
+    
+    return True
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any], indent: Optional[int] = None):
+    """Write JSON via a temp file and atomic rename."""
+    tmp_file = path.with_name(path.name + '.tmp')
+    tmp_file.write_text(json.dumps(data, indent=indent), encoding='utf-8')
+    os.replace(tmp_file, path)
+
+
+class AsyncAuditWriter:
+    """
+    Background group-commit writer for audit journal lines.
+    
+    log() only enqueues; a flusher thread collects entries for up to
+    AUDIT_FLUSH_INTERVAL_MS or AUDIT_FLUSH_BATCH_SIZE entries and writes
+    them with a single open/write(/fsync) per journal file.
+    """
+    
+    def __init__(
+        self,
+        queue_size: int = AUDIT_QUEUE_SIZE,
+        flush_interval_ms: int = AUDIT_FLUSH_INTERVAL_MS,
+        batch_size: int = AUDIT_FLUSH_BATCH_SIZE,
+        fsync_policy: str = AUDIT_FSYNC,
+        enqueue_timeout: float = AUDIT_ENQUEUE_TIMEOUT
+    ):
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.batch_size = max(batch_size, 1)
+        self.fsync_policy = fsync_policy
+        self.enqueue_timeout = enqueue_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self.stats = {
+            'enqueued': 0,
+            'written': 0,
+            'batches': 0,
+            'last_batch_size': 0,
+            'max_queue_depth': 0,
+            'queue_full_events': 0,
+            'blocked_seconds': 0.0,
+            'sync_fallbacks': 0,
+            'write_errors': 0,
+        }
+        self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+        self._thread.start()
+    
+    def submit(self, journal_file: Path, line: str):
+        """Queue a journal line; blocks briefly and then writes inline if the queue stays full."""
+        if self._closed:
+            _write_journal_lines(journal_file, [line], self.fsync_policy)
+            return
+        
+        item = (journal_file, line)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            started = time.monotonic()
+            with self._stats_lock:
+                self.stats['queue_full_events'] += 1
+                full_events = self.stats['queue_full_events']
+            if full_events == 1 or full_events % 100 == 0:
+                logger.warning(f"Audit queue full ({self._queue.maxsize} entries), applying backpressure")
+            try:
+                self._queue.put(item, timeout=self.enqueue_timeout)
+            except queue.Full:
+                # Never drop audit records: write this one on the caller's thread
+                _write_journal_lines(journal_file, [line], self.fsync_policy)
+                with self._stats_lock:
+                    self.stats['sync_fallbacks'] += 1
+            with self._stats_lock:
+                self.stats['blocked_seconds'] += time.monotonic() - started
+        
+        with self._stats_lock:
+            self.stats['enqueued'] += 1
+            self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], self._queue.qsize())
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued before this call is on disk."""
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put((None, done))
+        return done.wait(timeout)
+    
+    def close(self):
+        """Flush pending entries and stop the flusher thread."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put((None, None))
+        self._thread.join(timeout=5)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return writer and backpressure metrics."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['queue_depth'] = self._queue.qsize()
+        stats['queue_capacity'] = self._queue.maxsize
+        stats['fsync_policy'] = self.fsync_policy
+        return stats
+    
+    def _run(self):
+        """Flusher loop: collect a batch, group-commit it, repeat."""
+        while True:
+            batch: List[Tuple[Path, str]] = []
+            markers: List[Optional[threading.Event]] = []
+            
+            first = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            item = first
+            while True:
+                journal_file, payload = item
+                if journal_file is None:
+                    markers.append(payload)
+                    # Flush requests and shutdown commit immediately
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            if batch:
+                self._commit(batch)
+            
+            for marker in markers:
+                if marker is None:
+                    return
+                marker.set()
+    
+    def _commit(self, batch: List[Tuple[Path, str]]):
+        """Write a batch, grouping lines by journal file."""
+        by_file: Dict[Path, List[str]] = {}
+        for journal_file, line in batch:
+            by_file.setdefault(journal_file, []).append(line)
+        
+        written = 0
+        for journal_file, lines in by_file.items():
+            try:
+                _write_journal_lines(journal_file, lines, self.fsync_policy)
+                written += len(lines)
+            except Exception as e:
+                logger.error(f"Error writing audit batch to {journal_file.name}: {e}")
+                with self._stats_lock:
+                    self.stats['write_errors'] += 1
+        
+        with self._stats_lock:
+            self.stats['written'] += written
+            self.stats['batches'] += 1
+            self.stats['last_batch_size'] = len(batch)
+
+
 class AuditLogger:
     """Comprehensive audit logging for Gold Tier AI Employee."""
     
     def __init__(self):
-        self.current_date = datetime.now().strftime('%Y-%m-%d')
-        self.audit_file = AUDIT_PATH / f"{self.current_date}.json"
+        self.writer: Optional[AsyncAuditWriter] = None
+        self._rollup_lock = threading.Lock()
+        self._rollover_lock = threading.Lock()
+        self._rollup_dirty = False
+        self._rollup_saved_at = 0.0
+        self._set_current_date(datetime.now().strftime('%Y-%m-%d'))
+        if AUDIT_WRITER_MODE == 'async' and AUDIT_FORMAT == 'jsonl':
+            self.writer = AsyncAuditWriter()
+            atexit.register(self.close)
+        if AUDIT_COMPACT_AFTER_DAYS > 0:
+            self.compact_journals()
         self._initialize_audit_file()
     
+    def _set_current_date(self, date_str: str):
+        """Point the logger at the files for a given day."""
+        self.current_date = date_str
+        self.audit_file = AUDIT_PATH / f"{date_str}.json"
+        self.journal_file = AUDIT_PATH / f"{date_str}.{AUDIT_SHARD_ID}.jsonl"
+        self.rollup_file = ROLLUP_PATH / f"{date_str}.{AUDIT_SHARD_ID}.json"
+        self.rollup = _empty_rollup(date_str)
+    
+    def _rollover(self, date_str: str):
+        """Switch to a new day: persist the old day's rollup and start fresh files."""
+        with self._rollover_lock:
+            if date_str == self.current_date:
+                return
+            self._save_rollup()
+            previous = self.current_date
+            with self._rollup_lock:
+                self._set_current_date(date_str)
+                self._rollup_dirty = False
+            self.entries.clear()
+            logger.info(f"Audit log rolled over from {previous} to {date_str}")
+    
     def _initialize_audit_file(self):
-        """Initialize or load today's audit file."""
+        """Load the most recent of today's entries into the in-memory ring buffer."""
+        self.entries = deque(self.iter_entries_for_date(self.current_date), maxlen=AUDIT_RECENT_ENTRIES)
+    
+    def _save_audit_file(self, entry: Dict[str, Any]):
+        """Append an entry by rewriting the whole day file (legacy json format)."""
+        entries = []
         if self.audit_file.exists():
             try:
-                data = json.loads(self.audit_file.read_text(encoding='utf-8'))
-                self.entries = data.get('entries', [])
+                entries = json.loads(self.audit_file.read_text(encoding='utf-8')).get('entries', [])
             except Exception as e:
                 logger.warning(f"Error loading audit file: {e}")
-                self.entries = []
-        else:
-            self.entries = []
-    
-    def _save_audit_file(self):
-        """Save audit entries to file."""
+        entries.append(entry)
         data = {
             'date': self.current_date,
             'created_at': datetime.now().isoformat(),
-            'total_entries': len(self.entries),
-            'entries': self.entries
+            'total_entries': len(entries),
+            'entries': entries
         }
         self.audit_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
     
+    def _append_journal(self, entry: Dict[str, Any]):
+        """Append a single entry to today's JSONL journal (queued in async mode)."""
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        if self.writer is not None:
+            self.writer.submit(self.journal_file, line)
+        else:
+            _write_journal_lines(self.journal_file, [line])
+    
+    def _update_rollup(self, entry: Dict[str, Any]):
+        """Count an entry into this process's live rollup, persisting it periodically."""
+        with self._rollup_lock:
+            _add_to_rollup(self.rollup, entry)
+            self._rollup_dirty = True
+        if time.monotonic() - self._rollup_saved_at >= ROLLUP_SAVE_INTERVAL:
+            self._save_rollup()
+    
+    def _save_rollup(self):
+        """Persist this process's live rollup for the current day."""
+        with self._rollup_lock:
+            if not self._rollup_dirty:
+                return
+            data = json.loads(json.dumps(self.rollup))
+            self._rollup_dirty = False
+            self._rollup_saved_at = time.monotonic()
+        try:
+            _write_json_atomic(self.rollup_file, data)
+        except Exception as e:
+            logger.error(f"Error saving audit rollup: {e}")
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued entries and the live rollup are written."""
+        self._save_rollup()
+        if self.writer is None:
+            return True
+        return self.writer.flush(timeout)
+    
+    def close(self):
+        """Flush and stop the background writer (registered with atexit)."""
+        self._save_rollup()
+        if self.writer is not None:
+            self.writer.close()
+    
+    def get_writer_stats(self) -> Dict[str, Any]:
+        """Get writer throughput and backpressure metrics."""
+        if self.writer is None:
+            return {'mode': 'sync', 'fsync_policy': AUDIT_FSYNC}
+        stats = self.writer.get_stats()
+        stats['mode'] = 'async'
+        return stats
+    
+    def _read_journal(self, journal_file: Path) -> List[Dict[str, Any]]:
+        """Read entries from a JSONL journal, skipping torn or corrupt lines."""
+        entries = []
+        with open(journal_file, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt line {line_no} in {journal_file.name}")
+        return entries
+    
     def log(
         self,
         action_type: str,
@@ -89,8 +481,13 @@ class AuditLogger:
         Returns:
             The created audit entry
         """
+        now = datetime.now()
+        date_str = now.strftime('%Y-%m-%d')
+        if date_str != self.current_date:
+            self._rollover(date_str)
+        
         entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'action_type': action_type,
             'actor': actor,
             'result': result,
@@ -99,7 +496,11 @@ class AuditLogger:
         }
         
         self.entries.append(entry)
-        self._save_audit_file()
+        if AUDIT_FORMAT == 'json':
+            self._save_audit_file(entry)
+        else:
+            self._append_journal(entry)
+            self._update_rollup(entry)
         
         logger.info(f"[AUDIT] {action_type} by {actor}: {result} - {details}")
         
@@ -149,18 +550,184 @@ class AuditLogger:
         """Log a dry run action."""
         return self.log(action_type, 'dry_run', actor, details, metadata)
     
+    def _journal_files(self, date_str: str) -> List[Path]:
+        """
+        List every journal shard for a date, including shards mid-compaction
+        (but not those already merged into the compacted file).
+        """
+        files = list(AUDIT_PATH.glob(f"{date_str}*.jsonl"))
+        compacting = list(AUDIT_PATH.glob(f"{date_str}*.jsonl.compacting"))
+        if compacting:
+            merged = self._compacted_shards(date_str)
+            files.extend(f for f in compacting if f.name not in merged)
+        return sorted(files)
+    
+    def _compacted_shards(self, date_str: str) -> Set[str]:
+        """Names of the shards merged into a day's compacted file."""
+        try:
+            data = json.loads((AUDIT_PATH / f"{date_str}.json").read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return set()
+        return set(data.get('compacted_shards', []))
+    
+    def _remove_shards(self, shards: List[Path]):
+        """Delete merged journal shards and their shard rollups."""
+        for journal_file in shards:
+            shard_rollup = ROLLUP_PATH / (journal_file.name[:-len('.jsonl.compacting')] + '.json')
+            shard_rollup.unlink(missing_ok=True)
+            journal_file.unlink(missing_ok=True)
+    
+    def _write_day_rollup(self, date_str: str, entries: List[Dict[str, Any]]):
+        """Write the exact rollup of a compacted day."""
+        rollup = _empty_rollup(date_str)
+        for entry in entries:
+            _add_to_rollup(rollup, entry)
+        _write_json_atomic(ROLLUP_PATH / f"{date_str}.json", rollup)
+    
+    def _recover_compaction(self, date_str: str):
+        """
+        Finish the day's previous compaction: delete the shards it merged if an
+        interrupted run left them behind, then drop its record of them (the
+        next shards of the day reuse their names).
+        """
+        audit_file = AUDIT_PATH / f"{date_str}.json"
+        try:
+            data = json.loads(audit_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        merged = set(data.pop('compacted_shards', []))
+        if not merged:
+            return
+        leftovers = [f for f in AUDIT_PATH.glob(f"{date_str}*.jsonl.compacting") if f.name in merged]
+        if leftovers:
+            self._write_day_rollup(date_str, data.get('entries', []))
+            self._remove_shards(leftovers)
+            logger.warning(f"Finished interrupted compaction of {date_str} ({len(leftovers)} merged shard(s) removed)")
+        _write_json_atomic(audit_file, data, indent=2)
+    
     def get_entries_for_date(self, date_str: str) -> List[Dict[str, Any]]:
-        """Get all audit entries for a specific date."""
+        """Get all audit entries for a specific date (hot files, else the warm archive)."""
+        entries = self._get_hot_entries(date_str)
+        if not entries and self._archive_location(date_str):
+            entries = list(self._iter_archived_day(date_str))
+        return entries
+    
+    def iter_entries_for_date(self, date_str: str) -> Iterator[Dict[str, Any]]:
+        """Stream entries for a date; archived days are decompressed chunk by chunk."""
+        entries = self._get_hot_entries(date_str)
+        if entries:
+            yield from entries
+        elif self._archive_location(date_str):
+            yield from self._iter_archived_day(date_str)
+    
+    def _get_hot_entries(self, date_str: str) -> List[Dict[str, Any]]:
+        """Get entries from the compacted file and all journal shards of a date."""
+        self.flush()
+        entries = []
+        audit_file = AUDIT_PATH / f"{date_str}.json"
+        
+        if audit_file.exists():
+            try:
+                data = json.loads(audit_file.read_text(encoding='utf-8'))
+                entries.extend(data.get('entries', []))
+            except Exception as e:
+                logger.error(f"Error reading audit file for {date_str}: {e}")
+        
+        journal_entries = []
+        for journal_file in self._journal_files(date_str):
+            try:
+                journal_entries.extend(self._read_journal(journal_file))
+            except Exception as e:
+                logger.error(f"Error reading audit journal {journal_file.name}: {e}")
+        
+        # Interleave shards from different processes in time order
+        journal_entries.sort(key=lambda e: e.get('timestamp', ''))
+        entries.extend(journal_entries)
+        
+        return entries
+    
+    def compact_journal(self, date_str: str) -> int:
+        """
+        Compact a day's JSONL journal shards into the YYYY-MM-DD.json format.
+        
+        Shards are first renamed to *.compacting so a process still writing
+        that day starts a fresh shard instead of appending to a file that is
+        about to be removed. The merged file is written to a temp file and
+        atomically renamed before the shards are deleted, and it records the
+        shards it merged: if the process dies before they are deleted, readers
+        skip them and the next compaction deletes them instead of merging
+        their entries twice.
+        
+        Returns:
+            Number of entries in the compacted file
+        """
+        # Leftovers of an interrupted run go first: a live shard may be about to take their name
+        self._recover_compaction(date_str)
+        for journal_file in AUDIT_PATH.glob(f"{date_str}*.jsonl"):
+            os.replace(journal_file, journal_file.with_name(journal_file.name + '.compacting'))
+        
+        compacting = list(AUDIT_PATH.glob(f"{date_str}*.jsonl.compacting"))
+        if not compacting:
+            return 0
+        
+        entries = self.get_entries_for_date(date_str)
+        data = {
+            'date': date_str,
+            'created_at': datetime.now().isoformat(),
+            'total_entries': len(entries),
+            'compacted_shards': sorted(f.name for f in compacting),
+            'entries': entries
+        }
+        
         audit_file = AUDIT_PATH / f"{date_str}.json"
-        if not audit_file.exists():
-            return []
+        _write_json_atomic(audit_file, data, indent=2)
+        
+        # The day is final now: replace the live shard rollups with one exact day rollup
+        self._write_day_rollup(date_str, entries)
+        self._remove_shards(compacting)
+        
+        logger.info(f"Compacted {len(compacting)} audit journal shard(s) for {date_str} ({len(entries)} entries)")
+        return len(entries)
+    
+    def compact_journals(self, older_than_days: Optional[int] = None) -> int:
+        """
+        Compact all journals older than the given number of days.
+        
+        Uses a lock file so concurrent processes don't compact the same day twice.
+        
+        Returns:
+            Number of days compacted
+        """
+        if older_than_days is None:
+            older_than_days = max(AUDIT_COMPACT_AFTER_DAYS, 1)
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).strftime('%Y-%m-%d')
+        
+        # A lock left behind by a crashed process is considered stale after 10 minutes
+        if COMPACT_LOCK.exists() and time.time() - COMPACT_LOCK.stat().st_mtime > 600:
+            COMPACT_LOCK.unlink(missing_ok=True)
         
         try:
-            data = json.loads(audit_file.read_text(encoding='utf-8'))
-            return data.get('entries', [])
-        except Exception as e:
-            logger.error(f"Error reading audit file for {date_str}: {e}")
-            return []
+            lock_fd = os.open(COMPACT_LOCK, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            logger.debug("Audit compaction already running in another process")
+            return 0
+        
+        compacted = 0
+        try:
+            journal_files = list(AUDIT_PATH.glob('*.jsonl')) + list(AUDIT_PATH.glob('*.jsonl.compacting'))
+            for date_str in sorted({_journal_date(f) for f in journal_files}):
+                if date_str > cutoff:
+                    continue
+                try:
+                    self.compact_journal(date_str)
+                    compacted += 1
+                except Exception as e:
+                    logger.error(f"Error compacting audit journals for {date_str}: {e}")
+        finally:
+            os.close(lock_fd)
+            COMPACT_LOCK.unlink(missing_ok=True)
+        
+        return compacted
     
     def get_entries_for_period(
         self,
@@ -168,26 +735,31 @@ class AuditLogger:
         end_date: datetime
     ) -> List[Dict[str, Any]]:
         """Get all audit entries for a date range."""
-        entries = []
+        return list(self.iter_entries_for_period(start_date, end_date))
+    
+    def iter_entries_for_period(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream audit entries for a date range, one day at a time."""
         current = start_date
         
-        while current <= end_date:
+        while current.date() <= end_date.date():
             date_str = current.strftime('%Y-%m-%d')
-            entries.extend(self.get_entries_for_date(date_str))
+            yield from self.iter_entries_for_date(date_str)
             current += timedelta(days=1)
-        
-        return entries
     
     def get_entries_by_type(
         self,
         action_type: str,
         date_str: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get all entries of a specific action type."""
+        """Get entries of a specific action type (recent in-memory entries if no date)."""
         if date_str:
             entries = self.get_entries_for_date(date_str)
         else:
-            entries = self.entries
+            entries = list(self.entries)
         
         return [e for e in entries if e.get('action_type') == action_type]
     
@@ -196,36 +768,107 @@ class AuditLogger:
         actor: str,
         date_str: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get all entries by a specific actor."""
+        """Get entries by a specific actor (recent in-memory entries if no date)."""
         if date_str:
             entries = self.get_entries_for_date(date_str)
         else:
-            entries = self.entries
+            entries = list(self.entries)
         
         return [e for e in entries if e.get('actor') == actor]
     
+    def get_rollup_for_date(self, date_str: str) -> Dict[str, Any]:
+        """
+        Get the per-day counters for a date without re-parsing its entries.
+        
+        Uses the final day rollup (written at compaction) plus the live shard
+        rollups of any journals still open. Legacy days without a rollup are
+        computed once from their compacted file and persisted.
+        """
+        self.flush()
+        rollup = _empty_rollup(date_str)
+        
+        day_rollup = ROLLUP_PATH / f"{date_str}.json"
+        audit_file = AUDIT_PATH / f"{date_str}.json"
+        if day_rollup.exists():
+            try:
+                _merge_rollup(rollup, json.loads(day_rollup.read_text(encoding='utf-8')))
+            except Exception as e:
+                logger.error(f"Error reading audit rollup for {date_str}: {e}")
+        elif audit_file.exists():
+            backfill = _empty_rollup(date_str)
+            try:
+                data = json.loads(audit_file.read_text(encoding='utf-8'))
+                for entry in data.get('entries', []):
+                    _add_to_rollup(backfill, entry)
+                # Only past days are final; today's file may still change in legacy json mode
+                if date_str < datetime.now().strftime('%Y-%m-%d'):
+                    _write_json_atomic(day_rollup, backfill)
+            except Exception as e:
+                logger.error(f"Error building audit rollup for {date_str}: {e}")
+            _merge_rollup(rollup, backfill)
+        elif self._archive_location(date_str):
+            backfill = _empty_rollup(date_str)
+            for entry in self._iter_archived_day(date_str):
+                _add_to_rollup(backfill, entry)
+            _write_json_atomic(day_rollup, backfill)
+            _merge_rollup(rollup, backfill)
+        
+        for journal_file in self._journal_files(date_str):
+            shard = journal_file.name.split('.jsonl')[0]
+            shard_rollup = ROLLUP_PATH / f"{shard}.json"
+            try:
+                if shard != date_str and shard_rollup.exists():
+                    _merge_rollup(rollup, json.loads(shard_rollup.read_text(encoding='utf-8')))
+                else:
+                    # Shard written before rollups existed: count it directly
+                    for entry in self._read_journal(journal_file):
+                        _add_to_rollup(rollup, entry)
+            except Exception as e:
+                logger.error(f"Error reading audit rollup {shard_rollup.name}: {e}")
+        
+        return rollup
+    
     def get_summary_for_date(self, date_str: Optional[str] = None) -> Dict[str, Any]:
-        """Get a summary of audit entries for a date."""
+        """Get a summary of audit entries for a date (defaults to today, all processes)."""
         if date_str is None:
-            entries = self.entries
-        else:
-            entries = self.get_entries_for_date(date_str)
+            date_str = datetime.now().strftime('%Y-%m-%d')
+        rollup = self.get_rollup_for_date(date_str)
         
+        return {
+            'total_actions': rollup['total_actions'],
+            'by_result': rollup['by_result'],
+            'by_type': rollup['by_type'],
+            'by_actor': rollup['by_actor'],
+            'by_hour': rollup['by_hour']
+        }
+    
+    def get_summary_for_range(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, Any]:
+        """Get a summary for an arbitrary date range in O(days) from the rollup index."""
         summary = {
-            'total_actions': len(entries),
+            'period': {
+                'start': start_date.strftime('%Y-%m-%d'),
+                'end': end_date.strftime('%Y-%m-%d')
+            },
+            'total_actions': 0,
             'by_result': {},
             'by_type': {},
-            'by_actor': {}
+            'by_actor': {},
+            'by_hour': {},
+            'daily_breakdown': {}
         }
         
-        for entry in entries:
-            result = entry.get('result', 'unknown')
-            action_type = entry.get('action_type', 'unknown')
-            actor = entry.get('actor', 'unknown')
-            
-            summary['by_result'][result] = summary['by_result'].get(result, 0) + 1
-            summary['by_type'][action_type] = summary['by_type'].get(action_type, 0) + 1
-            summary['by_actor'][actor] = summary['by_actor'].get(actor, 0) + 1
+        current = start_date
+        while current.date() <= end_date.date():
+            date_str = current.strftime('%Y-%m-%d')
+            rollup = self.get_rollup_for_date(date_str)
+            if rollup['total_actions']:
+                _merge_rollup(summary, rollup)
+                summary['daily_breakdown'][date_str] = rollup['total_actions']
+            current += timedelta(days=1)
         
         return summary
     
@@ -233,46 +876,150 @@ class AuditLogger:
         """Get a summary of audit entries for the past 7 days."""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=7)
+        return self.get_summary_for_range(start_date, end_date)
+    
+    def get_monthly_summary(self, year: Optional[int] = None, month: Optional[int] = None) -> Dict[str, Any]:
+        """Get a summary of audit entries for a calendar month (defaults to the current month)."""
+        now = datetime.now()
+        start_date = datetime(year or now.year, month or now.month, 1)
+        next_month = (start_date + timedelta(days=32)).replace(day=1)
+        return self.get_summary_for_range(start_date, next_month - timedelta(days=1))
+    
+    def _load_archive_index(self, month: str) -> Dict[str, Any]:
+        """Load the day offset index of a monthly archive segment."""
+        index_file = ARCHIVE_PATH / f"{month}.index.json"
+        if not index_file.exists():
+            return {'month': month, 'days': {}}
+        try:
+            return json.loads(index_file.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.error(f"Error reading archive index {index_file.name}: {e}")
+            return {'month': month, 'days': {}}
+    
+    def _archive_location(self, date_str: str) -> Optional[Dict[str, Any]]:
+        """Return the {offset, length, entries} of an archived day, if any."""
+        return self._load_archive_index(date_str[:7])['days'].get(date_str)
+    
+    def _iter_archived_day(self, date_str: str) -> Iterator[Dict[str, Any]]:
+        """Stream a day's entries from its gzip member without reading the rest of the month."""
+        location = self._archive_location(date_str)
+        if not location:
+            return
         
-        entries = self.get_entries_for_period(start_date, end_date)
+        segment = ARCHIVE_PATH / f"{date_str[:7]}.jsonl.gz"
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        pending = b''
+        with open(segment, 'rb') as f:
+            f.seek(location['offset'])
+            remaining = location['length']
+            while remaining > 0:
+                chunk = f.read(min(ARCHIVE_READ_CHUNK, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                pending += decompressor.decompress(chunk)
+                *lines, pending = pending.split(b'\n')
+                for line in lines:
+                    if line.strip():
+                        yield json.loads(line)
+        pending += decompressor.flush()
+        if pending.strip():
+            yield json.loads(pending)
+    
+    def archive_day(self, date_str: str) -> int:
+        """
+        Move a compacted day into its monthly compressed archive segment.
         
-        summary = {
-            'period': {
-                'start': start_date.strftime('%Y-%m-%d'),
-                'end': end_date.strftime('%Y-%m-%d')
-            },
-            'total_actions': len(entries),
-            'by_result': {},
-            'by_type': {},
-            'by_actor': {},
-            'daily_breakdown': {}
-        }
+        The day is appended as its own gzip member and the index is updated
+        atomically before the hot file is removed. A day that is already
+        indexed (e.g. after a crash) is not appended twice.
         
-        for entry in entries:
-            result = entry.get('result', 'unknown')
-            action_type = entry.get('action_type', 'unknown')
-            actor = entry.get('actor', 'unknown')
-            timestamp = entry.get('timestamp', '')[:10]  # YYYY-MM-DD
+        Returns:
+            Number of entries archived
+        """
+        audit_file = AUDIT_PATH / f"{date_str}.json"
+        if not audit_file.exists() or self._journal_files(date_str):
+            return 0
+        
+        month = date_str[:7]
+        index = self._load_archive_index(month)
+        
+        # Make sure the rollup exists before the day leaves the hot tier
+        self.get_rollup_for_date(date_str)
+        
+        if date_str not in index['days']:
+            data = json.loads(audit_file.read_text(encoding='utf-8'))
+            entries = data.get('entries', [])
+            payload = ''.join(json.dumps(e, ensure_ascii=False) + '\n' for e in entries)
+            member = gzip.compress(payload.encode('utf-8'))
             
-            summary['by_result'][result] = summary['by_result'].get(result, 0) + 1
-            summary['by_type'][action_type] = summary['by_type'].get(action_type, 0) + 1
-            summary['by_actor'][actor] = summary['by_actor'].get(actor, 0) + 1
+            segment = ARCHIVE_PATH / f"{month}.jsonl.gz"
+            with open(segment, 'ab') as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(member)
+                f.flush()
+                os.fsync(f.fileno())
             
-            if timestamp not in summary['daily_breakdown']:
-                summary['daily_breakdown'][timestamp] = 0
-            summary['daily_breakdown'][timestamp] += 1
+            index['days'][date_str] = {
+                'offset': offset,
+                'length': len(member),
+                'entries': len(entries)
+            }
+            _write_json_atomic(ARCHIVE_PATH / f"{month}.index.json", index, indent=2)
         
-        return summary
+        archived = index['days'][date_str]['entries']
+        audit_file.unlink()
+        logger.info(f"Archived audit log {date_str} ({archived} entries) to {month}.jsonl.gz")
+        return archived
+    
+    def archive_old_logs(self) -> int:
+        """Move hot days older than AUDIT_HOT_DAYS into the warm archive tier."""
+        cutoff = (datetime.now() - timedelta(days=AUDIT_HOT_DAYS)).strftime('%Y-%m-%d')
+        archived_days = 0
+        
+        for audit_file in sorted(AUDIT_PATH.glob('*.json')):
+            date_str = _journal_date(audit_file)
+            if date_str >= cutoff:
+                continue
+            try:
+                if self.archive_day(date_str) > 0:
+                    archived_days += 1
+            except Exception as e:
+                logger.error(f"Error archiving {audit_file.name}: {e}")
+        
+        return archived_days
     
     def cleanup_old_logs(self):
-        """Remove audit logs older than retention period."""
+        """Apply the retention tiers: compact, archive (if enabled), then delete expired logs."""
         cutoff_date = datetime.now() - timedelta(days=RETENTION_DAYS)
         removed_count = 0
         
-        for audit_file in AUDIT_PATH.glob('*.json'):
+        if AUDIT_COMPACT_AFTER_DAYS > 0:
+            self.compact_journals()
+        
+        if AUDIT_ARCHIVE:
+            self.archive_old_logs()
+        
+        # Monthly segments are dropped once their last day is past retention
+        for index_file in ARCHIVE_PATH.glob('*.index.json'):
+            month = index_file.name[:7]
+            try:
+                month_start = datetime.strptime(month, '%Y-%m')
+                month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+                if month_end < cutoff_date:
+                    (ARCHIVE_PATH / f"{month}.jsonl.gz").unlink(missing_ok=True)
+                    index_file.unlink()
+                    removed_count += 1
+                    logger.info(f"Removed old audit archive: {month}.jsonl.gz")
+            except Exception as e:
+                logger.error(f"Error processing {index_file.name}: {e}")
+        
+        old_files = list(AUDIT_PATH.glob('*.json')) + list(AUDIT_PATH.glob('*.jsonl'))
+        old_files.extend(ROLLUP_PATH.glob('*.json'))
+        for audit_file in old_files:
             try:
                 # Extract date from filename
-                date_str = audit_file.stem  # YYYY-MM-DD
+                date_str = _journal_date(audit_file)  # YYYY-MM-DD
                 file_date = datetime.strptime(date_str, '%Y-%m-%d')
                 
                 if file_date < cutoff_date:
@@ -293,28 +1040,118 @@ class AuditLogger:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> int:
-        """Export audit trail to a file."""
+        """
+        Export audit trail to a JSON file.
+        
+        Entries are streamed day by day (including archived days) and written
+        as they are read; total_entries is written after the entry list.
+        """
         if start_date is None:
             start_date = datetime.now() - timedelta(days=30)
         if end_date is None:
             end_date = datetime.now()
         
-        entries = self.get_entries_for_period(start_date, end_date)
-        
-        export_data = {
+        header = {
             'export_date': datetime.now().isoformat(),
             'period': {
                 'start': start_date.strftime('%Y-%m-%d'),
                 'end': end_date.strftime('%Y-%m-%d')
-            },
-            'total_entries': len(entries),
-            'entries': entries
+            }
         }
         
-        output_path.write_text(json.dumps(export_data, indent=2), encoding='utf-8')
-        logger.info(f"Exported {len(entries)} audit entries to {output_path}")
+        count = 0
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header, indent=2)[:-2] + ',\n  "entries": [')
+            for entry in self.iter_entries_for_period(start_date, end_date):
+                f.write(',' if count else '')
+                f.write('\n    ' + json.dumps(entry))
+                count += 1
+            f.write(f'\n  ],\n  "total_entries": {count}\n}}\n')
         
-        return len(entries)
+        logger.info(f"Exported {count} audit entries to {output_path}")
+        
+        return count
+    
+    def iter_filtered_entries(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        filters: Optional[Dict[str, Any]] = None,
+        progress: Optional[Callable[[str, int, int, int], None]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entries in a period that match the given filters.
+        
+        Args:
+            start_date: First day (and, if it has a time, the earliest timestamp)
+            end_date: Last day (and, if it has a time, the latest timestamp)
+            filters: Optional keys 'action_type', 'actor', 'result' (value or list of
+                values) and 'metadata' (dict of key -> required value)
+            progress: Called after each day as progress(date_str, day_no, total_days, matched)
+        
+        Yields:
+            Matching audit entries in time order
+        """
+        filters = filters or {}
+        since = start_date.isoformat()
+        until = end_date.isoformat()
+        total_days = (end_date.date() - start_date.date()).days + 1
+        matched = 0
+        
+        for day_no in range(total_days):
+            date_str = (start_date + timedelta(days=day_no)).strftime('%Y-%m-%d')
+            for entry in self.iter_entries_for_date(date_str):
+                timestamp = entry.get('timestamp', '')
+                if timestamp < since or timestamp > until:
+                    continue
+                if _entry_matches(entry, filters):
+                    matched += 1
+                    yield entry
+            if progress:
+                progress(date_str, day_no + 1, total_days, matched)
+    
+    def stream_export(
+        self,
+        output: TextIO,
+        start_date: datetime,
+        end_date: datetime,
+        fmt: str = 'jsonl',
+        filters: Optional[Dict[str, Any]] = None,
+        progress: Optional[Callable[[str, int, int, int], None]] = None
+    ) -> int:
+        """
+        Write matching entries to an open text stream as JSONL or CSV.
+        
+        Entries are written as they are read, so memory use stays constant
+        regardless of the period length.
+        
+        Returns:
+            Number of entries written
+        """
+        entries = self.iter_filtered_entries(start_date, end_date, filters, progress)
+        count = 0
+        
+        if fmt == 'csv':
+            writer = csv.writer(output)
+            writer.writerow(EXPORT_CSV_COLUMNS)
+            for entry in entries:
+                writer.writerow([
+                    entry.get('timestamp', ''),
+                    entry.get('action_type', ''),
+                    entry.get('actor', ''),
+                    entry.get('result', ''),
+                    entry.get('details', ''),
+                    json.dumps(entry.get('metadata', {}), ensure_ascii=False)
+                ])
+                count += 1
+        elif fmt == 'jsonl':
+            for entry in entries:
+                output.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                count += 1
+        else:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        
+        return count
 
 
 # Global instance for easy import
@@ -382,18 +1219,98 @@ def log_dry_run(
     return get_audit_logger().log_dry_run(action_type, actor, details, metadata)
 
 
+def flush_audit_log(timeout: Optional[float] = None) -> bool:
+    """Wait for queued audit entries to reach disk."""
+    return get_audit_logger().flush(timeout)
+
+
 def get_weekly_summary() -> Dict[str, Any]:
     """Get weekly audit summary."""
     return get_audit_logger().get_weekly_summary()
 
 
+def get_summary_for_range(start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    """Get audit summary for a date range."""
+    return get_audit_logger().get_summary_for_range(start_date, end_date)
+
+
 def cleanup_old_logs() -> int:
     """Clean up old audit logs."""
     return get_audit_logger().cleanup_old_logs()
 
 
-# Main entry point for testing
-def main():
+def archive_old_logs() -> int:
+    """Move old audit logs into the compressed archive tier."""
+    return get_audit_logger().archive_old_logs()
+
+
+def export_audit_log(
+    output: TextIO,
+    start_date: datetime,
+    end_date: datetime,
+    fmt: str = 'jsonl',
+    filters: Optional[Dict[str, Any]] = None
+) -> int:
+    """Stream a filtered audit export to an open text stream."""
+    return get_audit_logger().stream_export(output, start_date, end_date, fmt, filters)
+
+
+def _parse_cli_datetime(value: str) -> datetime:
+    """Parse YYYY-MM-DD or a full ISO timestamp from the command line."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date: {value} (use YYYY-MM-DD or ISO format)")
+
+
+def _parse_cli_end_datetime(value: str) -> datetime:
+    """Parse an end date; a bare YYYY-MM-DD covers the whole day."""
+    parsed = _parse_cli_datetime(value)
+    if len(value) == 10:
+        parsed = parsed.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return parsed
+
+
+def _parse_cli_meta(value: str) -> Tuple[str, str]:
+    """Parse a KEY=VALUE metadata filter from the command line."""
+    key, sep, meta_value = value.partition('=')
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"Invalid metadata filter: {value} (use KEY=VALUE)")
+    return key, meta_value
+
+
+def _run_export_command(args: argparse.Namespace) -> int:
+    """Handle `audit_logger.py export`."""
+    end_date = args.end or datetime.now()
+    start_date = args.start or (end_date - timedelta(days=30))
+    
+    filters: Dict[str, Any] = {}
+    if args.action_type:
+        filters['action_type'] = args.action_type
+    if args.actor:
+        filters['actor'] = args.actor
+    if args.result:
+        filters['result'] = args.result
+    if args.meta:
+        filters['metadata'] = dict(args.meta)
+    
+    def report(date_str: str, day_no: int, total_days: int, matched: int):
+        if not args.quiet:
+            print(f"\r[{day_no}/{total_days}] {date_str}: {matched} matching entries", end='', file=sys.stderr)
+    
+    if args.output == '-':
+        count = get_audit_logger().stream_export(sys.stdout, start_date, end_date, args.format, filters, report)
+    else:
+        newline = '' if args.format == 'csv' else None
+        with open(args.output, 'w', encoding='utf-8', newline=newline) as f:
+            count = get_audit_logger().stream_export(f, start_date, end_date, args.format, filters, report)
+    
+    if not args.quiet:
+        print(f"\nExported {count} audit entries", file=sys.stderr)
+    return count
+
+
+def run_self_test():
     """Test the audit logger."""
     logger = get_audit_logger()
     
@@ -446,5 +1363,32 @@ def main():
     print("\nAudit logger test complete!")
 
 
+# Main entry point
+def main():
+    """Command line interface; runs the self test when no command is given."""
+    parser = argparse.ArgumentParser(description='Gold Tier audit log tools')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    export_parser = subparsers.add_parser('export', help='Stream audit entries to JSONL or CSV')
+    export_parser.add_argument('--start', type=_parse_cli_datetime, help='Start date/time (default: 30 days ago)')
+    export_parser.add_argument('--end', type=_parse_cli_end_datetime, help='End date/time (default: now)')
+    export_parser.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl')
+    export_parser.add_argument('--output', '-o', default='-', help='Output file, or - for stdout')
+    export_parser.add_argument('--action-type', action='append', help='Filter by action type (repeatable)')
+    export_parser.add_argument('--actor', action='append', help='Filter by actor (repeatable)')
+    export_parser.add_argument('--result', action='append', help='Filter by result (repeatable)')
+    export_parser.add_argument('--meta', action='append', type=_parse_cli_meta, metavar='KEY=VALUE', help='Filter by metadata value (repeatable)')
+    export_parser.add_argument('--quiet', '-q', action='store_true', help='Do not report progress')
+    
+    subparsers.add_parser('test', help='Run the audit logger self test')
+    
+    args = parser.parse_args()
+    
+    if args.command == 'export':
+        _run_export_command(args)
+    else:
+        run_self_test()
+
+
 if __name__ == '__main__':
     main()
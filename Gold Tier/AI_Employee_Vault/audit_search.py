@@ -0,0 +1,411 @@
+# audit_search.py
+# Gold Tier: Indexed search over the audit trail
+# Keeps a SQLite index in /Logs/audit/search_index.db:
+# - inverted index on `details` tokens
+# - exact-match index on metadata keys (filename, partner, post_id, recipient, ...)
+# The index catches up incrementally from journal shards (byte offsets), compacted
+# day files and the compressed archive, so queries never scan the audit files.
+#
+# Usage:
+#   python audit_search.py "invoice failed" --meta partner=ACME --days 90
+#   python audit_search.py --meta filename=FILE_whatapp.md
+
+import re
+import sys
+import json
+import sqlite3
+import logging
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Iterable
+
+from audit_logger import (
+    AUDIT_PATH,
+    ARCHIVE_PATH,
+    RETENTION_DAYS,
+    get_audit_logger,
+    _parse_cli_meta,
+)
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_DB = AUDIT_PATH / 'search_index.db'
+TOKEN_PATTERN = re.compile(r'[a-z0-9_]+')
+MAX_META_VALUE_LENGTH = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    day TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    action_type TEXT,
+    actor TEXT,
+    result TEXT,
+    details TEXT,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_day ON entries(day);
+CREATE INDEX IF NOT EXISTS idx_entries_timestamp ON entries(timestamp);
+CREATE TABLE IF NOT EXISTS tokens (
+    token TEXT NOT NULL,
+    entry_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tokens_token ON tokens(token);
+CREATE INDEX IF NOT EXISTS idx_tokens_entry ON tokens(entry_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    entry_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_meta_key_value ON meta(key, value);
+CREATE INDEX IF NOT EXISTS idx_meta_entry ON meta(entry_id);
+-- Byte offset reached in each journal shard
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    offset INTEGER NOT NULL
+);
+-- Days indexed from a sealed source (compacted file or archive)
+CREATE TABLE IF NOT EXISTS sealed_days (
+    day TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    signature TEXT NOT NULL
+);
+"""
+
+
+def tokenize(text: str) -> List[str]:
+    """Split free text into lowercase search tokens."""
+    return sorted(set(TOKEN_PATTERN.findall((text or '').lower())))
+
+
+class AuditSearchIndex:
+    """Incrementally maintained search index over audit entries."""
+
+    def __init__(self, db_path: Path = SEARCH_INDEX_DB):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(str(db_path), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+        self.audit_logger = get_audit_logger()
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def _insert_entries(self, day: str, entries: Iterable[Dict[str, Any]]) -> int:
+        """Insert entries with their token and metadata postings."""
+        count = 0
+        for entry in entries:
+            metadata = entry.get('metadata') or {}
+            cursor = self.conn.execute(
+                'INSERT INTO entries (day, timestamp, action_type, actor, result, details, metadata) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (
+                    day,
+                    entry.get('timestamp', ''),
+                    entry.get('action_type'),
+                    entry.get('actor'),
+                    entry.get('result'),
+                    entry.get('details', ''),
+                    json.dumps(metadata, ensure_ascii=False)
+                )
+            )
+            entry_id = cursor.lastrowid
+            self.conn.executemany(
+                'INSERT INTO tokens (token, entry_id) VALUES (?, ?)',
+                [(token, entry_id) for token in tokenize(entry.get('details', ''))]
+            )
+            self.conn.executemany(
+                'INSERT INTO meta (key, value, entry_id) VALUES (?, ?, ?)',
+                [
+                    (key, str(value)[:MAX_META_VALUE_LENGTH], entry_id)
+                    for key, value in metadata.items()
+                    if isinstance(value, (str, int, float, bool))
+                ]
+            )
+            count += 1
+        return count
+
+    def _delete_day(self, day: str):
+        """Remove every indexed entry of a day."""
+        self.conn.execute('DELETE FROM tokens WHERE entry_id IN (SELECT id FROM entries WHERE day = ?)', (day,))
+        self.conn.execute('DELETE FROM meta WHERE entry_id IN (SELECT id FROM entries WHERE day = ?)', (day,))
+        self.conn.execute('DELETE FROM entries WHERE day = ?', (day,))
+
+    def _sealed_signature(self, day: str) -> Optional[str]:
+        """Get the signature the day was last sealed with."""
+        row = self.conn.execute('SELECT signature FROM sealed_days WHERE day = ?', (day,)).fetchone()
+        return row['signature'] if row else None
+
+    def _seal_day(self, day: str, source: str, signature: str, entries: Iterable[Dict[str, Any]]) -> int:
+        """Re-index a day from a sealed source and reset its journal offsets."""
+        self._delete_day(day)
+        count = self._insert_entries(day, entries)
+        self.conn.execute(
+            'INSERT OR REPLACE INTO sealed_days (day, source, signature) VALUES (?, ?, ?)',
+            (day, source, signature)
+        )
+        # Journals still present for a sealed day were written after compaction
+        self.conn.execute('UPDATE sources SET offset = 0 WHERE day = ?', (day,))
+        return count
+
+    def _ingest_journal(self, journal_file: Path) -> int:
+        """Index the complete lines appended to a journal shard since the last refresh."""
+        day = journal_file.name[:10]
+        row = self.conn.execute('SELECT offset FROM sources WHERE path = ?', (journal_file.name,)).fetchone()
+        offset = row['offset'] if row else 0
+
+        size = journal_file.stat().st_size
+        if size < offset:
+            # Shard was replaced (compaction renamed the old one away): start over
+            offset = 0
+        if size == offset:
+            return 0
+
+        with open(journal_file, 'rb') as f:
+            f.seek(offset)
+            data = f.read(size - offset)
+
+        # Only consume whole lines; a torn last line is picked up next time
+        end = data.rfind(b'\n') + 1
+        entries = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping corrupt line in {journal_file.name}")
+
+        count = self._insert_entries(day, entries)
+        self.conn.execute(
+            'INSERT OR REPLACE INTO sources (path, day, offset) VALUES (?, ?, ?)',
+            (journal_file.name, day, offset + end)
+        )
+        return count
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the audit trail.
+
+        Only new journal bytes, newly compacted days and newly archived days
+        are read; everything else is already in the index.
+
+        Returns:
+            Number of entries added
+        """
+        self.audit_logger.flush()
+        cutoff = (datetime.now() - timedelta(days=RETENTION_DAYS)).strftime('%Y-%m-%d')
+        added = 0
+
+        with self.conn:
+            self.conn.execute('BEGIN IMMEDIATE')
+
+            # Warm tier: archived days are sealed once from their gzip member
+            for index_file in sorted(ARCHIVE_PATH.glob('*.index.json')):
+                try:
+                    days = json.loads(index_file.read_text(encoding='utf-8')).get('days', {})
+                except Exception as e:
+                    logger.error(f"Error reading archive index {index_file.name}: {e}")
+                    continue
+                for day, location in days.items():
+                    signature = f"archive:{location['offset']}:{location['length']}"
+                    if day < cutoff or self._sealed_signature(day) == signature:
+                        continue
+                    added += self._seal_day(day, 'archive', signature, self.audit_logger.iter_entries_for_date(day))
+
+            # Hot tier: compacted day files
+            for audit_file in sorted(AUDIT_PATH.glob('????-??-??.json')):
+                day = audit_file.name[:10]
+                stat = audit_file.stat()
+                signature = f"json:{stat.st_mtime_ns}:{stat.st_size}"
+                if day < cutoff or self._sealed_signature(day) == signature:
+                    continue
+                data = json.loads(audit_file.read_text(encoding='utf-8'))
+                added += self._seal_day(day, 'json', signature, data.get('entries', []))
+
+            # Hot tier: live journal shards
+            for journal_file in sorted(AUDIT_PATH.glob('*.jsonl')):
+                if journal_file.name[:10] < cutoff:
+                    continue
+                try:
+                    added += self._ingest_journal(journal_file)
+                except FileNotFoundError:
+                    # Renamed away by a concurrent compaction
+                    continue
+
+            # Retention
+            for table in ('tokens', 'meta'):
+                self.conn.execute(
+                    f'DELETE FROM {table} WHERE entry_id IN (SELECT id FROM entries WHERE day < ?)', (cutoff,)
+                )
+            self.conn.execute('DELETE FROM entries WHERE day < ?', (cutoff,))
+            self.conn.execute('DELETE FROM sealed_days WHERE day < ?', (cutoff,))
+            self.conn.execute('DELETE FROM sources WHERE day < ?', (cutoff,))
+
+        if added:
+            logger.info(f"Audit search index refreshed: {added} new entries")
+        return added
+
+    def rebuild(self) -> int:
+        """Drop and rebuild the whole index."""
+        with self.conn:
+            for table in ('entries', 'tokens', 'meta', 'sources', 'sealed_days'):
+                self.conn.execute(f'DELETE FROM {table}')
+        return self.refresh()
+
+    def search(
+        self,
+        text: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        action_type: Optional[str] = None,
+        actor: Optional[str] = None,
+        result: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        refresh: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Find audit entries across the retention window.
+
+        Args:
+            text: Words that must all appear in `details`
+            metadata: Exact metadata matches, e.g. {'partner': 'ACME', 'post_id': '123'}
+            action_type / actor / result: Exact field matches
+            start_date / end_date: Timestamp window
+            limit: Maximum number of entries (newest first)
+            refresh: Catch up with new audit entries before querying
+
+        Returns:
+            Matching entries, newest first
+        """
+        if refresh:
+            self.refresh()
+
+        clauses = []
+        params: List[Any] = []
+
+        tokens = tokenize(text or '')
+        if tokens:
+            placeholders = ','.join('?' * len(tokens))
+            clauses.append(
+                f'id IN (SELECT entry_id FROM tokens WHERE token IN ({placeholders}) '
+                f'GROUP BY entry_id HAVING COUNT(DISTINCT token) = ?)'
+            )
+            params.extend(tokens)
+            params.append(len(tokens))
+
+        for key, value in (metadata or {}).items():
+            clauses.append('id IN (SELECT entry_id FROM meta WHERE key = ? AND value = ?)')
+            params.extend([key, str(value)])
+
+        for column, value in (('action_type', action_type), ('actor', actor), ('result', result)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+
+        if start_date is not None:
+            clauses.append('timestamp >= ?')
+            params.append(start_date.isoformat())
+        if end_date is not None:
+            clauses.append('timestamp <= ?')
+            params.append(end_date.isoformat())
+
+        where = ' AND '.join(clauses) if clauses else '1 = 1'
+        rows = self.conn.execute(
+            f'SELECT timestamp, action_type, actor, result, details, metadata FROM entries '
+            f'WHERE {where} ORDER BY timestamp DESC LIMIT ?',
+            params + [limit]
+        ).fetchall()
+
+        return [
+            {
+                'timestamp': row['timestamp'],
+                'action_type': row['action_type'],
+                'actor': row['actor'],
+                'result': row['result'],
+                'details': row['details'],
+                'metadata': json.loads(row['metadata'] or '{}')
+            }
+            for row in rows
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size information."""
+        return {
+            'entries': self.conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0],
+            'tokens': self.conn.execute('SELECT COUNT(*) FROM tokens').fetchone()[0],
+            'metadata_values': self.conn.execute('SELECT COUNT(*) FROM meta').fetchone()[0],
+            'days': self.conn.execute('SELECT COUNT(DISTINCT day) FROM entries').fetchone()[0],
+        }
+
+
+# Global instance for easy import
+_search_index: Optional[AuditSearchIndex] = None
+
+
+def get_search_index() -> AuditSearchIndex:
+    """Get or create the global search index instance."""
+    global _search_index
+    if _search_index is None:
+        _search_index = AuditSearchIndex()
+    return _search_index
+
+
+def search_audit_log(
+    text: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """Search the audit trail (see AuditSearchIndex.search)."""
+    return get_search_index().search(text, metadata, **kwargs)
+
+
+def main():
+    """Command line search over the audit trail."""
+    parser = argparse.ArgumentParser(description='Search the Gold Tier audit trail')
+    parser.add_argument('text', nargs='?', help='Words that must appear in the entry details')
+    parser.add_argument('--meta', action='append', type=_parse_cli_meta, metavar='KEY=VALUE',
+                        help='Exact metadata match, e.g. partner=ACME (repeatable)')
+    parser.add_argument('--action-type', help='Filter by action type')
+    parser.add_argument('--actor', help='Filter by actor')
+    parser.add_argument('--result', help='Filter by result')
+    parser.add_argument('--days', type=int, help='Only search the last N days')
+    parser.add_argument('--limit', type=int, default=50, help='Maximum results (default: 50)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSONL')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the index before searching')
+    args = parser.parse_args()
+
+    index = get_search_index()
+    if args.rebuild:
+        print(f"Rebuilt index: {index.rebuild()} entries", file=sys.stderr)
+
+    metadata = dict(args.meta) if args.meta else None
+    start_date = datetime.now() - timedelta(days=args.days) if args.days else None
+
+    results = index.search(
+        text=args.text,
+        metadata=metadata,
+        action_type=args.action_type,
+        actor=args.actor,
+        result=args.result,
+        start_date=start_date,
+        limit=args.limit
+    )
+
+    for entry in results:
+        if args.json:
+            print(json.dumps(entry, ensure_ascii=False))
+        else:
+            print(f"{entry['timestamp'][:19]}  {entry['result']:<8} {entry['action_type']:<20} "
+                  f"{entry['actor']:<18} {entry['details']}")
+
+    print(f"\n{len(results)} match(es)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
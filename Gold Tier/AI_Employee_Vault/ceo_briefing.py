@@ -2,7 +2,7 @@
 # Gold Tier: Weekly CEO Briefing Generator
 # Runs every Sunday at 9:00 PM automatically
 # Reads Business_Goals.md
-# Checks /Done/ folder for completed tasks this week
+# Reads the completion ledger for tasks moved to /Done/ this week
 # Reads /Accounting/ for transactions
 # Checks /Logs/audit/ for actions taken
 # Generates briefing in /Briefings/CEO_Briefing_YYYY-MM-DD.md
@@ -19,6 +19,8 @@ from dotenv import load_dotenv
 from typing import Dict, Any, List, Optional
 
 from dashboard_manager import get_dashboard_manager
+from rolling_counters import get_rolling_counters
+from completion_ledger import get_completion_ledger
 
 # Import audit logger
 from audit_logger import get_audit_logger
@@ -54,8 +56,6 @@ APPROVED_ODOO_PATH = VAULT_PATH / 'Approved' / 'ODOO'
 AUDIT_PATH = LOGS_PATH / 'audit'
 FACEBOOK_LOG = LOGS_PATH / 'facebook_posts.json'
 ODOO_LOG = LOGS_PATH / 'odoo_actions.json'
-EMAIL_LOG = LOGS_PATH / 'sent_emails.json'
-LINKEDIN_LOG = LOGS_PATH / 'linkedin_posts.json'
 
 
 class CEOBriefingGenerator:
@@ -64,6 +64,8 @@ class CEOBriefingGenerator:
     def __init__(self):
         self.audit_logger = get_audit_logger()
         self.dashboard = get_dashboard_manager()
+        self.counters = get_rolling_counters()
+        self.ledger = get_completion_ledger()
         self._initialize()
 
     def _initialize(self):
@@ -109,24 +111,11 @@ class CEOBriefingGenerator:
             return {'revenue_target': 10000, 'objectives': [], 'metrics': {}}
 
     def _count_completed_tasks(self, week_start: datetime, week_end: datetime) -> List[Dict[str, Any]]:
-        """Count and list completed tasks for the week from /Done folder."""
+        """List completed tasks for the week from the completion ledger (newest first)."""
         completed_tasks = []
 
         try:
-            if DONE_PATH.exists():
-                for filepath in DONE_PATH.rglob('*.md'):
-                    try:
-                        mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
-                        if week_start.date() <= mtime.date() <= week_end.date():
-                            completed_tasks.append({
-                                'name': filepath.stem,
-                                'path': str(filepath.relative_to(VAULT_PATH)),
-                                'completed_at': mtime.isoformat()
-                            })
-                    except:
-                        continue
-
-            completed_tasks.sort(key=lambda x: x['completed_at'], reverse=True)
+            completed_tasks = self.ledger.list_range(week_start, week_end)
 
         except Exception as e:
             logger.error(f"Error counting completed tasks: {e}")
@@ -138,19 +127,8 @@ class CEOBriefingGenerator:
         activity = {'emails_processed': 0, 'replies_sent': 0}
 
         try:
-            if EMAIL_LOG.exists():
-                data = json.loads(EMAIL_LOG.read_text(encoding='utf-8'))
-                emails = data.get('sent_emails', [])
-
-                for email in emails:
-                    sent_at = email.get('sent_at', '')
-                    if sent_at:
-                        email_date = datetime.fromisoformat(sent_at).date()
-                        if week_start.date() <= email_date <= week_end.date():
-                            activity['emails_processed'] += 1
-                            if 'reply' in email.get('subject', '').lower() or 're:' in email.get('subject', '').lower():
-                                activity['replies_sent'] += 1
-
+            activity['emails_processed'] = self.counters.count_range('emails_sent', week_start, week_end)
+            activity['replies_sent'] = self.counters.count_range('email_replies_sent', week_start, week_end)
         except Exception as e:
             logger.error(f"Error getting Gmail activity: {e}")
 
@@ -161,31 +139,9 @@ class CEOBriefingGenerator:
         activity = {'posts_published': 0, 'last_post': None}
 
         try:
-            # Check LinkedIn log
-            if LINKEDIN_LOG.exists():
-                data = json.loads(LINKEDIN_LOG.read_text(encoding='utf-8'))
-                posts = data.get('posts', [])
-
-                for post in posts:
-                    posted_at = post.get('posted_at', '')
-                    if posted_at:
-                        post_date = datetime.fromisoformat(posted_at).date()
-                        if week_start.date() <= post_date <= week_end.date():
-                            activity['posts_published'] += 1
-                            activity['last_post'] = posted_at
-
-            # Also check LinkedIn_Posted folder
-            linkedin_posted = SOCIAL_PATH / 'LinkedIn_Posted'
-            if linkedin_posted.exists():
-                for filepath in linkedin_posted.glob('*.md'):
-                    try:
-                        mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
-                        if week_start.date() <= mtime.date() <= week_end.date():
-                            activity['posts_published'] += 1
-                            activity['last_post'] = mtime.isoformat()
-                    except:
-                        continue
-
+            activity['posts_published'] = self.counters.count_range('linkedin_posts', week_start, week_end)
+            if activity['posts_published']:
+                activity['last_post'] = self.dashboard.state.get('linkedin_last_post')
         except Exception as e:
             logger.error(f"Error getting LinkedIn activity: {e}")
 
@@ -276,25 +232,11 @@ class CEOBriefingGenerator:
         summary = {'total_actions': 0, 'by_type': {}, 'by_result': {}}
 
         try:
-            if AUDIT_PATH.exists():
-                for audit_file in AUDIT_PATH.glob('*.json'):
-                    try:
-                        date_str = audit_file.stem  # YYYY-MM-DD
-                        file_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-
-                        if week_start.date() <= file_date <= week_end.date():
-                            data = json.loads(audit_file.read_text(encoding='utf-8'))
-                            entries = data.get('entries', [])
-                            summary['total_actions'] += len(entries)
-
-                            for entry in entries:
-                                action_type = entry.get('action_type', 'unknown')
-                                result = entry.get('result', 'unknown')
-                                summary['by_type'][action_type] = summary['by_type'].get(action_type, 0) + 1
-                                summary['by_result'][result] = summary['by_result'].get(result, 0) + 1
-
-                    except:
-                        continue
+            # Per-day rollups: O(days) instead of re-parsing every entry
+            rollup = self.audit_logger.get_summary_for_range(week_start, week_end)
+            summary['total_actions'] = rollup['total_actions']
+            summary['by_type'] = rollup['by_type']
+            summary['by_result'] = rollup['by_result']
 
         except Exception as e:
             logger.error(f"Error getting audit summary: {e}")
@@ -0,0 +1,248 @@
+"""
+Completion Ledger - Append-only record of items moved to /Done/
+Every service that completes an item appends one row (path, type,
+completed_at, source) to the shared metrics database. Rows are indexed by
+day, so "completed today", "completed this week" and "recent N" are answered
+from the ledger instead of globbing and stat-ing the whole Done archive.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, date
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Set
+
+from metrics_store import METRICS_DB
+
+VAULT_PATH = Path(__file__).parent
+DONE_PATH = VAULT_PATH / 'Done'
+# Only the frontmatter at the top of a note is read to find its type
+FRONTMATTER_BYTES = 2048
+
+
+def _day(when: datetime) -> int:
+    """Ordinal day number used by the date index."""
+    return when.date().toordinal()
+
+
+def _as_date(value) -> date:
+    """Accept a date or datetime."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _relative_path(path: Path) -> str:
+    """Vault-relative path (e.g. Done/ODOO/invoice.md), whatever vault root the caller uses."""
+    parts = Path(path).parts
+    if 'Done' in parts:
+        index = len(parts) - 1 - parts[::-1].index('Done')
+        return Path(*parts[index:]).as_posix()
+    try:
+        return Path(path).resolve().relative_to(VAULT_PATH.resolve()).as_posix()
+    except ValueError:
+        return Path(path).as_posix()
+
+
+def read_note_type(path: Path) -> Optional[str]:
+    """Get the frontmatter `type:` of a note, if it has one."""
+    try:
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            head = f.read(FRONTMATTER_BYTES)
+    except OSError:
+        return None
+    if not head.startswith('---'):
+        return None
+    for line in head.splitlines()[1:]:
+        if line.strip() == '---':
+            break
+        if line.startswith('type:'):
+            return line.split(':', 1)[1].strip().strip('"\'') or None
+    return None
+
+
+class CompletionLedger:
+    """Append-only completions with a per-day index."""
+
+    def __init__(self, db_path: Path = METRICS_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS completions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT NOT NULL,
+                type TEXT,
+                completed_at TEXT NOT NULL,
+                day INTEGER NOT NULL,
+                source TEXT NOT NULL
+            )
+        """)
+        self.conn.execute('CREATE INDEX IF NOT EXISTS completions_day ON completions (day, completed_at)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS completions_path ON completions (path)')
+        self.conn.commit()
+        self._backfill()
+
+    def _backfill(self):
+        """Load the existing Done archive into an empty ledger (first run only)."""
+        with self._lock:
+            if self.conn.execute('SELECT 1 FROM completions LIMIT 1').fetchone():
+                return
+        if not DONE_PATH.exists():
+            return
+        rows = []
+        for filepath in DONE_PATH.rglob('*.md'):
+            if filepath.name.endswith('.plan.md'):
+                continue
+            try:
+                when = datetime.fromtimestamp(filepath.stat().st_mtime)
+            except OSError:
+                continue
+            rows.append((_relative_path(filepath), read_note_type(filepath),
+                         when.isoformat(), _day(when), 'backfill'))
+        if not rows:
+            return
+        # Another process may have backfilled while we scanned: re-check and
+        # insert in one write transaction so only one of them fills the ledger
+        with self._lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                if not self.conn.execute('SELECT 1 FROM completions LIMIT 1').fetchone():
+                    self.conn.executemany(
+                        'INSERT INTO completions (path, type, completed_at, day, source) VALUES (?, ?, ?, ?, ?)',
+                        rows
+                    )
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+    def _insert(self, rows: List[tuple]):
+        """Append rows of (path, type, completed_at, day, source)."""
+        if not rows:
+            return
+        with self._lock, self.conn:
+            self.conn.executemany(
+                'INSERT INTO completions (path, type, completed_at, day, source) VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+
+    def record(self, path: Path, source: str, item_type: Optional[str] = None,
+               completed_at: Optional[datetime] = None):
+        """
+        Record an item moved to Done.
+
+        Args:
+            path: Where the item now lives (its type is read from its frontmatter if not given)
+            source: Service that completed it (e.g. 'scheduler', 'email_mcp')
+            item_type: Item type, e.g. 'email' or 'odoo_invoice'
+            completed_at: Completion time (default: now)
+        """
+        when = completed_at or datetime.now()
+        if item_type is None:
+            item_type = read_note_type(path)
+        self._insert([(_relative_path(path), item_type, when.isoformat(), _day(when), source)])
+
+    def record_missing(self, paths: Iterable[Path], source: str) -> int:
+        """
+        Record items found in Done that no service reported (e.g. moved by hand).
+
+        Returns:
+            Number of items added
+        """
+        candidates = {_relative_path(path): path for path in paths}
+        if not candidates:
+            return 0
+        with self._lock:
+            missing = [(rel, path) for rel, path in candidates.items() if not self.conn.execute(
+                'SELECT 1 FROM completions WHERE path = ? LIMIT 1', (rel,)
+            ).fetchone()]
+        now = datetime.now()
+        self._insert([(rel, read_note_type(path), now.isoformat(), _day(now), source)
+                      for rel, path in missing])
+        return len(missing)
+
+    def count(self) -> int:
+        """Number of completions ever recorded."""
+        with self._lock:
+            return self.conn.execute('SELECT COUNT(*) FROM completions').fetchone()[0]
+
+    def recorded_names(self, folder: str = 'Done') -> Set[str]:
+        """Names of the files directly in a vault folder that already have a completion."""
+        prefix = f"{folder.rstrip('/')}/"
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT DISTINCT path FROM completions WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+            ).fetchall()
+        return {path[len(prefix):] for (path,) in rows if '/' not in path[len(prefix):]}
+
+    def count_range(self, start, end) -> int:
+        """Number of completions between two dates (inclusive)."""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT COUNT(*) FROM completions WHERE day BETWEEN ? AND ?',
+                (_as_date(start).toordinal(), _as_date(end).toordinal())
+            ).fetchone()
+        return row[0]
+
+    def completed_on(self, day) -> int:
+        """Number of completions on a given day."""
+        return self.count_range(day, day)
+
+    def completed_today(self) -> int:
+        """Number of completions today."""
+        return self.completed_on(date.today())
+
+    def list_range(self, start, end, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Completions between two dates (inclusive), newest first."""
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT path, type, completed_at, source FROM completions '
+                'WHERE day BETWEEN ? AND ? ORDER BY day DESC, completed_at DESC LIMIT ?',
+                (_as_date(start).toordinal(), _as_date(end).toordinal(), -1 if limit is None else limit)
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def recent(self, limit: int = 5, until=None) -> List[Dict[str, Any]]:
+        """The newest completions (up to and including a given date, if set)."""
+        last_day = _as_date(until).toordinal() if until else date.max.toordinal()
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT path, type, completed_at, source FROM completions WHERE day <= ? '
+                'ORDER BY day DESC, completed_at DESC LIMIT ?',
+                (last_day, limit)
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def _row_to_dict(self, row: tuple) -> Dict[str, Any]:
+        """Ledger row as a dict (name is the note's stem)."""
+        path, item_type, completed_at, source = row
+        return {
+            'name': Path(path).stem,
+            'path': path,
+            'type': item_type,
+            'completed_at': completed_at,
+            'source': source,
+        }
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+# Singleton instance
+_completion_ledger = None
+
+
+def get_completion_ledger() -> CompletionLedger:
+    """Get the singleton completion ledger instance."""
+    global _completion_ledger
+    if _completion_ledger is None:
+        _completion_ledger = CompletionLedger()
+    return _completion_ledger
+
+
+def record_completion(path: Path, source: str, item_type: Optional[str] = None):
+    """Record an item moved to Done."""
+    get_completion_ledger().record(path, source, item_type)
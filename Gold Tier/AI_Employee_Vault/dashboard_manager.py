@@ -1,32 +1,182 @@
 """
 Dashboard Manager - Centralized Dashboard Update System
 Updates the Gold Tier Dashboard.md with real-time status from all services.
+
+State lives in the shared SQLite metrics store (metrics_store.py), so every
+service process sees and updates the same counters. Updates only mark the
+dashboard dirty; rendering is coalesced and happens at most once per
+DASHBOARD_RENDER_DELAY_MS (or once at the end of a `with dashboard.batch():`
+block). Each section is cached against the values it depends on, and the file
+is only rewritten (atomically) when its content actually changed.
+
+With DASHBOARD_HTTP_ENABLED=true (or `python dashboard_manager.py --serve`) a
+local HTTP server also exposes the state as JSON, an HTML view and a
+server-sent event stream; Markdown then becomes a throttled secondary sink.
 """
 
+import os
 import json
+import time
+import queue
+import atexit
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from metrics_store import MetricsStore
+from rolling_counters import get_rolling_counters
+from folder_counts import get_folder_counts
+from completion_ledger import get_completion_ledger
+from job_journal import next_run_time
+from action_queue import get_action_queue, PRIORITIES
+
 VAULT_PATH = Path(__file__).parent
 DASHBOARD_PATH = VAULT_PATH / 'Dashboard.md'
+# Legacy state file, imported once into the metrics store
 STATE_FILE = VAULT_PATH / '.dashboard_state.json'
+# Coalescing window for Dashboard.md renders (0 = render on every update)
+RENDER_DELAY_MS = int(os.getenv('DASHBOARD_RENDER_DELAY_MS', '500'))
+
+# Optional live HTTP view (JSON API + server-sent events)
+HTTP_ENABLED = os.getenv('DASHBOARD_HTTP_ENABLED', 'false').lower() == 'true'
+HTTP_HOST = os.getenv('DASHBOARD_HTTP_HOST', '127.0.0.1')
+HTTP_PORT = int(os.getenv('DASHBOARD_HTTP_PORT', '8765'))
+# How often the server picks up changes made by other service processes
+HTTP_POLL_MS = int(os.getenv('DASHBOARD_HTTP_POLL_MS', '1000'))
+# Minimum gap between Dashboard.md writes while the HTTP server is running
+MARKDOWN_INTERVAL_MS = int(os.getenv('DASHBOARD_MARKDOWN_INTERVAL_MS', '10000'))
+SSE_KEEPALIVE_SECONDS = 15
+SSE_QUEUE_SIZE = 1000
+
+# Event metrics backed by rolling counters; exposed in state as
+# <metric>_today, <metric>_week (last 7 days), <metric>_month and <metric>_total
+COUNTER_METRICS = ('emails_processed', 'emails_sent', 'linkedin_posts', 'facebook_posts', 'odoo_invoices')
+
+# CEO briefing schedule (ceo_briefing.py): Sunday 9:00 PM
+CEO_BRIEFING_SCHEDULE = (6, '21:00')
+
+# Service status keys shown in Live Status (their store timestamps are "Last Active")
+STATUS_KEYS = (
+    'gmail_status', 'whatsapp_status', 'linkedin_status', 'facebook_status',
+    'email_mcp_status', 'odoo_status', 'scheduler_status', 'error_recovery_status',
+)
+
+# Dashboard sections in display order, each with the state/context values it depends on.
+# A section is only re-rendered when one of its inputs changed.
+SECTIONS = (
+    ('executive_summary', (
+        'emails_processed_today', 'emails_processed_week', 'emails_processed_total',
+        'emails_sent_today', 'emails_sent_week', 'emails_sent_total',
+        'linkedin_posts_today', 'linkedin_posts_week', 'linkedin_posts_total',
+        'facebook_posts_today', 'facebook_posts_week', 'facebook_posts_total',
+        'odoo_invoices_today', 'odoo_invoices_week', 'odoo_invoices_total',
+        'tasks_completed_today', 'tasks_completed_week', 'tasks_completed_total',
+    )),
+    ('live_status', STATUS_KEYS + ('gmail_last_checked', 'whatsapp_last_checked', 'status_times')),
+    ('action_queue', ('action_queue', 'queue_depth', 'today')),
+    ('task_progress', ('plan_progress',)),
+    ('gmail', (
+        'gmail_last_checked', 'gmail_new_emails', 'gmail_processed_hour',
+        'gmail_replies_drafted', 'gmail_replies_sent', 'gmail_status',
+    )),
+    ('whatsapp', (
+        'whatsapp_last_checked', 'whatsapp_urgent', 'whatsapp_keywords',
+        'whatsapp_total', 'whatsapp_status',
+    )),
+    ('linkedin', (
+        'linkedin_last_post', 'linkedin_posts_week', 'linkedin_queue',
+        'linkedin_posts_total', 'linkedin_status', 'linkedin_dry_run',
+    )),
+    ('facebook', ('facebook_status', 'facebook_reason', 'facebook_posts_week')),
+    ('odoo', (
+        'odoo_status', 'odoo_url', 'odoo_db', 'odoo_draft_invoices', 'odoo_paid_week',
+        'odoo_revenue_mtd', 'odoo_actions_today', 'odoo_dry_run',
+    )),
+    ('recent_activity', ('last_activity',)),
+    ('alerts', ('alerts',)),
+    ('scheduled_tasks', ('folder_check_time', 'scheduled_jobs', 'last_briefing_date', 'ceo_next_run')),
+    ('ceo_briefing', ('last_briefing_date', 'today')),
+    ('security', ('last_security_check', 'today')),
+    ('footer', ()),
+)
+
+
+class DashboardState(dict):
+    """
+    Local snapshot of the metrics store.
+    
+    Item assignment (`dashboard.state['key'] = value`) writes through to the
+    store so existing callers keep working and other processes see the change.
+    """
+    
+    def __init__(self, store: MetricsStore, values: Dict[str, Any]):
+        super().__init__(values)
+        self._store = store
+    
+    def __setitem__(self, key: str, value: Any):
+        super().__setitem__(key, value)
+        self._store.set(key, value)
+    
+    def reload(self):
+        """Replace the snapshot with the store's current values."""
+        super().update(self._store.snapshot())
 
 
 class DashboardManager:
     """Manages the Gold Tier Dashboard with real-time updates."""
     
     def __init__(self):
+        self.store = MetricsStore()
+        self.counters = get_rolling_counters()
+        self.folders = get_folder_counts(VAULT_PATH)
+        self.ledger = get_completion_ledger()
+        self.queue = get_action_queue()
         self.state = self._load_state()
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._batch_depth = 0
+        self._timer: Optional[threading.Timer] = None
+        self._markdown_timer: Optional[threading.Timer] = None
+        self._markdown_rendered_at = 0.0
+        self.server: Optional['DashboardServer'] = None
+        self._section_cache: Dict[str, tuple] = {}
+        self._last_body: Optional[str] = None
+        self._started_at = self._get_datetime()
+        self._last_updated = self._started_at
+        self.stats = {
+            'updates': 0,
+            'renders': 0,
+            'writes': 0,
+            'writes_skipped': 0,
+            'sections_rendered': 0,
+            'sections_cached': 0,
+            'last_render_ms': 0.0,
+            'render_ms_total': 0.0,
+        }
+        atexit.register(self.flush)
     
-    def _load_state(self) -> Dict[str, Any]:
-        """Load persistent state from JSON file."""
-        if STATE_FILE.exists():
-            try:
-                return json.loads(STATE_FILE.read_text(encoding='utf-8'))
-            except:
-                pass
-        return self._default_state()
+    def _load_state(self) -> DashboardState:
+        """Load state from the metrics store (importing the legacy JSON file once)."""
+        self.store.import_legacy_state(STATE_FILE)
+        self.store.ensure_defaults(self._default_state())
+        state = DashboardState(self.store, self.store.snapshot())
+        # Counters start from the totals the old hand-maintained metrics reached
+        for metric in COUNTER_METRICS:
+            self.counters.seed_total(metric, state.get(f'{metric}_total') or 0)
+        self._apply_counters(state)
+        return state
+    
+    def _apply_counters(self, state: Dict[str, Any]):
+        """Overlay rolling counter values onto the local state snapshot."""
+        values = {}
+        for metric, counts in self.counters.get_all_counts(COUNTER_METRICS).items():
+            for period in ('today', 'week', 'month', 'total'):
+                values[f'{metric}_{period}'] = counts[period]
+        dict.update(state, values)
     
     def _default_state(self) -> Dict[str, Any]:
         """Return default state structure."""
@@ -49,6 +199,7 @@ class DashboardManager:
             'pending_actions': 0,
             'in_progress': 0,
             'pending_approvals': 0,
+            'plan_progress': {},
             'gmail_last_checked': None,
             'gmail_new_emails': 0,
             'gmail_processed_hour': 0,
@@ -80,16 +231,10 @@ class DashboardManager:
             'last_activity': None,
             'alerts': [],
             'last_briefing_date': None,
+            'scheduled_jobs': {},
             'last_security_check': None,
         }
     
-    def _save_state(self):
-        """Save state to JSON file."""
-        try:
-            STATE_FILE.write_text(json.dumps(self.state, indent=2), encoding='utf-8')
-        except Exception as e:
-            print(f"[WARN] Could not save dashboard state: {e}")
-    
     def _get_timestamp(self) -> str:
         """Get current timestamp in HH:MM format."""
         return datetime.now().strftime('%H:%M')
@@ -114,267 +259,718 @@ class DashboardManager:
         else:
             return '⚪'
     
-    def _count_files(self, path: Path) -> int:
-        """Count files in a directory."""
-        if not path.exists():
-            return 0
-        return len(list(path.glob('*.md')))
-    
     def _get_action_queue(self) -> tuple:
-        """Get action queue counts from folders."""
-        needs_action = VAULT_PATH / 'Needs_Action'
-        in_progress = VAULT_PATH / 'In_Progress'
-        pending_approval = VAULT_PATH / 'Pending_Approval'
-        done = VAULT_PATH / 'Done'
-        
-        high = self._count_files(needs_action)
-        medium = self._count_files(in_progress)
-        low = self._count_files(pending_approval)
-        done_today = self._count_files(done)
+        """Get action queue counts from the shared folder count cache and completion ledger."""
+        high = self.folders.count('Needs_Action')
+        medium = self.folders.count('In_Progress')
+        low = self.folders.count('Pending_Approval')
+        done_today = self.ledger.completed_today()
         
         return high, medium, low, done_today
     
+    def _get_queue_depth(self) -> tuple:
+        """Items waiting for the AI (Needs_Action + In_Progress) at each priority, most urgent first."""
+        paths = [VAULT_PATH / folder / name
+                 for folder in ('Needs_Action', 'In_Progress') for name in self.folders.names(folder)]
+        self.queue.retain(paths)
+        depth = self.queue.depth_by_priority(paths)
+        return tuple(depth[priority] for priority in PRIORITIES)
+    
+    def _mark_dirty(self):
+        """Record a state change and schedule a coalesced save + render."""
+        with self._lock:
+            self._dirty = True
+            self.stats['updates'] += 1
+            if self._batch_depth > 0:
+                return
+            if RENDER_DELAY_MS <= 0:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(RENDER_DELAY_MS / 1000.0, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    @contextmanager
+    def batch(self):
+        """Group several updates into a single save and render."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    self.flush()
+    
+    def flush(self):
+        """Render Dashboard.md now if anything changed."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self.state.reload()
+            self._apply_counters(self.state)
+            if self.server is not None:
+                self.server.publish_changes(self.get_live_state()['state'])
+            self._render_markdown()
+    
+    def reload(self):
+        """Pick up changes written by other processes and publish them."""
+        with self._lock:
+            self._dirty = True
+            self.flush()
+    
+    def _render_markdown(self):
+        """Render Dashboard.md, throttled while the HTTP server is the primary view."""
+        with self._lock:
+            if self.server is None or MARKDOWN_INTERVAL_MS <= 0:
+                self._render()
+                return
+            wait = MARKDOWN_INTERVAL_MS / 1000.0 - (time.time() - self._markdown_rendered_at)
+            if wait <= 0:
+                if self._markdown_timer is not None:
+                    self._markdown_timer.cancel()
+                    self._markdown_timer = None
+                self._markdown_rendered_at = time.time()
+                self._render()
+            elif self._markdown_timer is None:
+                self._markdown_timer = threading.Timer(wait, self._render_markdown_due)
+                self._markdown_timer.daemon = True
+                self._markdown_timer.start()
+    
+    def _render_markdown_due(self):
+        """Deferred (throttled) Dashboard.md render."""
+        with self._lock:
+            self._markdown_timer = None
+            self._render_markdown()
+    
+    def get_live_state(self) -> Dict[str, Any]:
+        """Current state, action queue and render stats for the HTTP API."""
+        with self._lock:
+            state = dict(self.state)
+            high, medium, low, done_today = self._get_action_queue()
+            state.update({f'queue_{priority}': count
+                          for priority, count in zip(PRIORITIES, self._get_queue_depth())})
+            state.update({
+                'queue_needs_action': high,
+                'queue_in_progress': medium,
+                'queue_pending_approval': low,
+                'queue_completed_today': done_today,
+            })
+            return {
+                'generated_at': datetime.now().isoformat(),
+                'state': state,
+                'render_stats': self.get_render_stats(),
+            }
+    
+    def start_server(self, host: str = HTTP_HOST, port: int = HTTP_PORT) -> 'DashboardServer':
+        """Start the local HTTP server (JSON API, HTML view, SSE stream)."""
+        with self._lock:
+            if self.server is None:
+                server = DashboardServer(self, host, port)
+                self.server = server
+                server.start()
+            return self.server
+    
+    def stop_server(self):
+        """Stop the HTTP server; Markdown goes back to being rendered on every flush."""
+        with self._lock:
+            if self.server is not None:
+                self.server.stop()
+                self.server = None
+    
     def update_service(self, service: str, data: Dict[str, Any]):
         """Update state with data from a service."""
-        for key, value in data.items():
-            self.state[key] = value
-        self._save_state()
-        self.refresh()
+        with self._lock:
+            self.store.set_many(data)
+            dict.update(self.state, data)
+            self._mark_dirty()
     
     def increment_metric(self, metric: str, amount: int = 1):
-        """Increment a metric counter."""
-        if metric in self.state:
-            self.state[metric] += amount
-            self._save_state()
-            self.refresh()
+        """Atomically increment a metric counter (shared across processes)."""
+        with self._lock:
+            if metric in self.state:
+                dict.__setitem__(self.state, metric, self.store.increment(metric, amount))
+                self._mark_dirty()
+    
+    def record_event(self, metric: str, amount: int = 1):
+        """Record events for a rolling counter metric (e.g. 'emails_sent')."""
+        if amount <= 0:
+            return
+        with self._lock:
+            self.counters.record(metric, amount)
+            self._mark_dirty()
     
     def add_alert(self, alert: str, level: str = 'error'):
         """Add an alert to the dashboard."""
-        self.state['alerts'].append({
-            'message': alert,
-            'level': level,
-            'time': self._get_datetime()
-        })
-        # Keep only last 10 alerts
-        self.state['alerts'] = self.state['alerts'][-10:]
-        self._save_state()
-        self.refresh()
+        with self._lock:
+            # Keep only last 10 alerts
+            alerts = self.store.append_to_list('alerts', {
+                'message': alert,
+                'level': level,
+                'time': self._get_datetime()
+            }, 10)
+            dict.__setitem__(self.state, 'alerts', alerts)
+            self._mark_dirty()
     
     def clear_alerts(self):
         """Clear all alerts."""
-        self.state['alerts'] = []
-        self._save_state()
-        self.refresh()
+        with self._lock:
+            self.state['alerts'] = []
+            self._mark_dirty()
     
     def log_activity(self, action: str, status: str = 'Success'):
         """Log a recent activity."""
-        self.state['last_activity'] = {
-            'time': self._get_datetime(),
-            'action': action,
-            'status': status
-        }
-        self._save_state()
-        self.refresh()
+        with self._lock:
+            self.state['last_activity'] = {
+                'time': self._get_datetime(),
+                'action': action,
+                'status': status
+            }
+            self._mark_dirty()
+    
+    def get_metric_info(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a metric's value with its last update time and writer."""
+        return self.store.get_key_info(key)
     
     def refresh(self):
-        """Refresh the Dashboard.md with current state."""
+        """Request a Dashboard.md refresh (coalesced with other pending updates)."""
+        self._mark_dirty()
+    
+    def get_render_stats(self) -> Dict[str, Any]:
+        """Get render counters and timings."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats['avg_render_ms'] = round(stats['render_ms_total'] / stats['renders'], 2) if stats['renders'] else 0.0
+        return stats
+    
+    def _render(self):
+        """Write Dashboard.md from the current state if its content changed."""
         try:
             if not DASHBOARD_PATH.exists():
                 return
             
-            content = self._generate_dashboard()
-            DASHBOARD_PATH.write_text(content, encoding='utf-8')
+            started = time.perf_counter()
+            body = self._generate_body()
+            if body != self._last_body:
+                self._last_body = body
+                self._last_updated = self._get_datetime()
+            content = self._generate_header() + body
+            
+            existing = DASHBOARD_PATH.read_text(encoding='utf-8')
+            # A fresh process has no previous body; keep the file if only the header would differ
+            unchanged = existing == content or (self.stats['writes'] == 0 and existing.endswith(body))
+            if unchanged:
+                self.stats['writes_skipped'] += 1
+            else:
+                self._write_atomic(content)
+                self.stats['writes'] += 1
+            
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.stats['renders'] += 1
+            self.stats['last_render_ms'] = round(elapsed_ms, 2)
+            self.stats['render_ms_total'] = round(self.stats['render_ms_total'] + elapsed_ms, 2)
         except Exception as e:
             print(f"[ERROR] Dashboard refresh failed: {e}")
     
+    def _write_atomic(self, content: str):
+        """Replace Dashboard.md via a temp file so readers never see a partial note."""
+        tmp_path = DASHBOARD_PATH.with_name(f'.{DASHBOARD_PATH.name}.{os.getpid()}.tmp')
+        try:
+            tmp_path.write_text(content, encoding='utf-8')
+            os.replace(tmp_path, DASHBOARD_PATH)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+    
+    def _render_context(self) -> Dict[str, Any]:
+        """Values besides state that sections depend on."""
+        updated = self.store.updated_times()
+        return {
+            'today': self._get_date(),
+            'action_queue': self._get_action_queue(),
+            'queue_depth': self._get_queue_depth(),
+            'status_times': tuple(self._format_time(updated.get(key)) for key in STATUS_KEYS),
+            'folder_check_time': self._format_time(updated.get('pending_actions')),
+            'ceo_next_run': self._format_time(next_run_time(CEO_BRIEFING_SCHEDULE, datetime.now()).isoformat()),
+        }
+    
+    def _format_time(self, iso_time: Optional[str]) -> Optional[str]:
+        """Format a store timestamp as YYYY-MM-DD HH:MM."""
+        return iso_time[:16].replace('T', ' ') if iso_time else None
+    
+    def _generate_body(self) -> str:
+        """Assemble the dashboard body, re-rendering only sections whose inputs changed."""
+        ctx = self._render_context()
+        parts = []
+        for name, deps in SECTIONS:
+            key = repr(tuple(ctx[d] if d in ctx else self.state.get(d) for d in deps))
+            cached = self._section_cache.get(name)
+            if cached is not None and cached[0] == key:
+                self.stats['sections_cached'] += 1
+                parts.append(cached[1])
+                continue
+            text = getattr(self, f'_section_{name}')(ctx)
+            self._section_cache[name] = (key, text)
+            self.stats['sections_rendered'] += 1
+            parts.append(text)
+        return '\n---\n\n'.join(parts)
+    
+    def _generate_header(self) -> str:
+        """Title block; Last Updated is when the body last changed."""
+        return f"""# 🤖 AI Employee — Gold Tier Dashboard
+> Last Updated: {self._last_updated}
+> System Status: 🟢 All Systems Operational
+
+---
+
+"""
+    
     def _generate_dashboard(self) -> str:
         """Generate the full dashboard content."""
-        now = self._get_datetime()
-        today = self._get_date()
+        return self._generate_header() + self._generate_body()
+    
+    def _section_executive_summary(self, ctx: Dict[str, Any]) -> str:
+        """Metric totals table."""
+        s = self.state
+        return f"""## 📊 Executive Summary
+| Metric | Today | This Week | Total |
+|--------|-------|-----------|-------|
+| ✉️ Emails Processed | {s['emails_processed_today']} | {s['emails_processed_week']} | {s['emails_processed_total']} |
+| 📤 Emails Sent | {s['emails_sent_today']} | {s['emails_sent_week']} | {s['emails_sent_total']} |
+| 💼 LinkedIn Posts | {s['linkedin_posts_today']} | {s['linkedin_posts_week']} | {s['linkedin_posts_total']} |
+| 📘 Facebook Posts | {s['facebook_posts_today']} | {s['facebook_posts_week']} | {s['facebook_posts_total']} |
+| 🧾 Odoo Invoices | {s['odoo_invoices_today']} | {s['odoo_invoices_week']} | {s['odoo_invoices_total']} |
+| ✅ Tasks Completed | {s['tasks_completed_today']} | {s['tasks_completed_week']} | {s['tasks_completed_total']} |
+"""
+    
+    def _section_live_status(self, ctx: Dict[str, Any]) -> str:
+        """Service status table."""
+        s = self.state
+        times = dict(zip(STATUS_KEYS, ctx['status_times']))
         
-        # Get action queue
-        high, medium, low, done_today = self._get_action_queue()
+        def row(label: str, key: str, last_active: Optional[str]) -> str:
+            return f"| {label} | {self._get_status_icon(s[key])} {s[key]} | {last_active or 'Not yet'} |"
         
-        # Calculate totals
-        total_emails = self.state['emails_sent_total']
-        total_linkedin = self.state['linkedin_posts_total']
-        total_facebook = self.state['facebook_posts_total']
-        total_odoo = self.state['odoo_invoices_total']
-        total_tasks = self.state['tasks_completed_total']
+        rows = [
+            row('📧 Gmail Watcher', 'gmail_status', s['gmail_last_checked'] or times['gmail_status']),
+            row('💬 WhatsApp Watcher', 'whatsapp_status', s['whatsapp_last_checked']),
+            row('💼 LinkedIn Poster', 'linkedin_status', times['linkedin_status']),
+            row('📘 Facebook Manager', 'facebook_status', 'N/A'),
+            row('📨 Email MCP Server', 'email_mcp_status', times['email_mcp_status']),
+            row('🏢 Odoo MCP Server', 'odoo_status', times['odoo_status']),
+            row('⏰ Scheduler', 'scheduler_status', times['scheduler_status']),
+            row('🔄 Error Recovery', 'error_recovery_status', times['error_recovery_status']),
+        ]
+        return """## ⚡ Live Status
+| Service | Status | Last Active |
+|---------|--------|-------------|
+""" + '\n'.join(rows) + '\n'
+    
+    def _section_action_queue(self, ctx: Dict[str, Any]) -> str:
+        """Queue depth per priority and folder queue counts."""
+        today = ctx['today']
+        high, medium, low, done_today = ctx['action_queue']
         
-        # Build action queue table
+        labels = {'high': '🔴 High', 'normal': '🟡 Normal', 'low': '🟢 Low'}
         action_rows = []
-        if high > 0:
-            action_rows.append(f"| 🔴 High | {high} file(s) | Action Required | {today} |")
-        else:
-            action_rows.append("| 🔴 High | _None_ | — | — |")
-        if medium > 0:
-            action_rows.append(f"| 🟡 Medium | {medium} file(s) | In Progress | {today} |")
-        else:
-            action_rows.append("| 🟡 Medium | _None_ | — | — |")
-        if low > 0:
-            action_rows.append(f"| 🟢 Low | {low} file(s) | Pending Approval | {today} |")
-        else:
-            action_rows.append("| 🟢 Low | _None_ | — | — |")
-        
+        for priority, depth in zip(PRIORITIES, ctx['queue_depth']):
+            if depth > 0:
+                action_rows.append(f"| {labels[priority]} | {depth} file(s) | Queued for AI | {today} |")
+            else:
+                action_rows.append(f"| {labels[priority]} | _None_ | — | — |")
         action_queue_table = '\n'.join(action_rows)
         
-        # Build alerts section
-        if self.state['alerts']:
-            alerts_content = ""
-            for alert in self.state['alerts'][-5:]:
-                icon = '🚨' if alert['level'] == 'error' else '⚠️'
-                alerts_content += f"\n> {icon} {alert['time']}: {alert['message']}"
-        else:
-            alerts_content = "> 🟢 No alerts at this time"
+        return f"""## 📥 Action Queue
+{action_queue_table}
+
+- **Pending Actions:** {high + medium + low}
+- **Needs Action:** {high}
+- **In Progress:** {medium}
+- **Pending Approvals:** {low}
+- **Completed Today:** {done_today}
+"""
+    
+    def _section_task_progress(self, ctx: Dict[str, Any]) -> str:
+        """Plan checklist progress of each in-progress task."""
+        progress = self.state.get('plan_progress') or {}
+        
+        rows = []
+        for task, plan in sorted(progress.items(), key=lambda item: -item[1]['percent']):
+            filled = plan['percent'] // 10
+            bar = '█' * filled + '░' * (10 - filled)
+            rows.append(f"| {task} | {bar} {plan['percent']}% | {plan['checked']}/{plan['total']} |")
+        if not rows:
+            rows.append("| _No planned tasks in progress_ | — | — |")
+        progress_table = '\n'.join(rows)
         
-        # Build recent activity
+        return f"""## 📋 Task Progress
+| Task | Progress | Steps |
+|------|----------|-------|
+{progress_table}
+"""
+    
+    def _section_gmail(self, ctx: Dict[str, Any]) -> str:
+        """Gmail watcher details."""
+        s = self.state
+        return f"""## 📧 Gmail Activity
+- **Last Checked:** {s['gmail_last_checked'] or 'Not yet'}
+- **New Emails:** {s['gmail_new_emails']}
+- **Processed This Hour:** {s['gmail_processed_hour']}/50
+- **Replies Drafted:** {s['gmail_replies_drafted']}
+- **Replies Sent:** {s['gmail_replies_sent']}
+- **Status:** {self._get_status_icon(s['gmail_status'])} {s['gmail_status']}
+"""
+    
+    def _section_whatsapp(self, ctx: Dict[str, Any]) -> str:
+        """WhatsApp watcher details."""
+        s = self.state
+        return f"""## 💬 WhatsApp Activity
+- **Last Checked:** {s['whatsapp_last_checked'] or 'Not yet'}
+- **Urgent Messages:** {s['whatsapp_urgent']}
+- **Keywords Detected:** {s['whatsapp_keywords']}
+- **Total Processed:** {s['whatsapp_total']}
+- **Status:** {self._get_status_icon(s['whatsapp_status'])} {s['whatsapp_status']}
+"""
+    
+    def _section_linkedin(self, ctx: Dict[str, Any]) -> str:
+        """LinkedIn poster details."""
+        s = self.state
+        return f"""## 💼 LinkedIn Activity
+- **Last Post:** {s['linkedin_last_post']}
+- **Posts This Week:** {s['linkedin_posts_week']}
+- **Posts in Queue:** {s['linkedin_queue']}
+- **Total Posts:** {s['linkedin_posts_total']}
+- **Status:** {self._get_status_icon(s['linkedin_status'])} {s['linkedin_status']}
+- **DRY_RUN:** {'Yes' if s['linkedin_dry_run'] else 'No'}
+"""
+    
+    def _section_facebook(self, ctx: Dict[str, Any]) -> str:
+        """Facebook manager details."""
+        s = self.state
+        return f"""## 📘 Facebook Activity
+- **Status:** {self._get_status_icon(s['facebook_status'])} {s['facebook_status']}
+- **Reason:** {s['facebook_reason']}
+- **Posts This Week:** {s['facebook_posts_week']}
+"""
+    
+    def _section_odoo(self, ctx: Dict[str, Any]) -> str:
+        """Odoo accounting details."""
+        s = self.state
+        return f"""## 🏢 Odoo — Accounting
+- **Connection:** {self._get_status_icon(s['odoo_status'])} {s['odoo_status']}
+- **Server:** {s['odoo_url']}
+- **Database:** {s['odoo_db']}
+- **Draft Invoices:** {s['odoo_draft_invoices']}
+- **Paid This Week:** ${s['odoo_paid_week']}
+- **Total Revenue MTD:** ${s['odoo_revenue_mtd']}
+- **Actions Today:** {s['odoo_actions_today']}
+- **DRY_RUN:** {'Yes' if s['odoo_dry_run'] else 'No'}
+"""
+    
+    def _section_recent_activity(self, ctx: Dict[str, Any]) -> str:
+        """Most recent logged activity."""
         if self.state['last_activity']:
             activity = self.state['last_activity']
             status_icon = '✅' if activity['status'] == 'Success' else '❌'
             activity_table = f"| {activity['time']} | {activity['action']} | {status_icon} {activity['status']} |"
         else:
-            activity_table = f"| {now} | System Started | ✅ Success |"
-        
-        # Build alerts table
-        scheduled_tasks = f"""| Task | Schedule | Last Run | Next Run |
-|------|----------|----------|----------|
-| 📊 Folder Check | Every 2 min | {now} | {now} |
-| 🌅 Daily Briefing | 8:00 AM | {today} | Tomorrow 8AM |
-| 📝 CEO Briefing | Sunday 9PM | {today} | Next Sunday |"""
-        
-        # CEO Briefing info
-        briefing_date = self.state.get('last_briefing_date', today)
-        briefing_path = f"/Briefings/CEO_Briefing_{briefing_date}.md"
+            activity_table = f"| {self._started_at} | System Started | ✅ Success |"
         
-        # Security info
-        security_check = self.state.get('last_security_check', today)
-        
-        dashboard = f"""# 🤖 AI Employee — Gold Tier Dashboard
-> Last Updated: {now}
-> System Status: 🟢 All Systems Operational
-
----
-
-## 📊 Executive Summary
-| Metric | Today | This Week | Total |
-|--------|-------|-----------|-------|
-| ✉️ Emails Processed | {self.state['emails_processed_today']} | {self.state['emails_processed_today']} | {self.state['emails_sent_total']} |
-| 📤 Emails Sent | {self.state['emails_sent_today']} | {self.state['emails_sent_today']} | {self.state['emails_sent_total']} |
-| 💼 LinkedIn Posts | {self.state['linkedin_posts_today']} | {self.state['linkedin_posts_week']} | {self.state['linkedin_posts_total']} |
-| 📘 Facebook Posts | {self.state['facebook_posts_today']} | {self.state['facebook_posts_week']} | {self.state['facebook_posts_total']} |
-| 🧾 Odoo Invoices | {self.state['odoo_invoices_today']} | {self.state['odoo_invoices_week']} | {self.state['odoo_invoices_total']} |
-| ✅ Tasks Completed | {self.state['tasks_completed_today']} | {self.state['tasks_completed_week']} | {self.state['tasks_completed_total']} |
-
----
-
-## ⚡ Live Status
-| Service | Status | Last Active |
-|---------|--------|-------------|
-| 📧 Gmail Watcher | {self._get_status_icon(self.state['gmail_status'])} {self.state['gmail_status']} | {self.state['gmail_last_checked'] or now} |
-| 💬 WhatsApp Watcher | {self._get_status_icon(self.state['whatsapp_status'])} {self.state['whatsapp_status']} | {self.state['whatsapp_last_checked'] or 'Not yet'} |
-| 💼 LinkedIn Poster | {self._get_status_icon(self.state['linkedin_status'])} {self.state['linkedin_status']} | {now} |
-| 📘 Facebook Manager | {self._get_status_icon(self.state['facebook_status'])} {self.state['facebook_status']} | N/A |
-| 📨 Email MCP Server | {self._get_status_icon(self.state['email_mcp_status'])} {self.state['email_mcp_status']} | {now} |
-| 🏢 Odoo MCP Server | {self._get_status_icon(self.state['odoo_status'])} {self.state['odoo_status']} | {now} |
-| ⏰ Scheduler | {self._get_status_icon(self.state['scheduler_status'])} {self.state['scheduler_status']} | {now} |
-| 🔄 Error Recovery | {self._get_status_icon(self.state['error_recovery_status'])} {self.state['error_recovery_status']} | {now} |
-
----
-
-## 📥 Action Queue
-{action_queue_table}
-
-- **Pending Actions:** {high + medium + low}
-- **In Progress:** {medium}
-- **Pending Approvals:** {low}
-- **Completed Today:** {done_today}
-
----
-
-## 📧 Gmail Activity
-- **Last Checked:** {self.state['gmail_last_checked'] or 'Not yet'}
-- **New Emails:** {self.state['gmail_new_emails']}
-- **Processed This Hour:** {self.state['gmail_processed_hour']}/50
-- **Replies Drafted:** {self.state['gmail_replies_drafted']}
-- **Replies Sent:** {self.state['gmail_replies_sent']}
-- **Status:** {self._get_status_icon(self.state['gmail_status'])} {self.state['gmail_status']}
-
----
-
-## 💬 WhatsApp Activity
-- **Last Checked:** {self.state['whatsapp_last_checked'] or 'Not yet'}
-- **Urgent Messages:** {self.state['whatsapp_urgent']}
-- **Keywords Detected:** {self.state['whatsapp_keywords']}
-- **Total Processed:** {self.state['whatsapp_total']}
-- **Status:** {self._get_status_icon(self.state['whatsapp_status'])} {self.state['whatsapp_status']}
-
----
-
-## 💼 LinkedIn Activity
-- **Last Post:** {self.state['linkedin_last_post']}
-- **Posts This Week:** {self.state['linkedin_posts_week']}
-- **Posts in Queue:** {self.state['linkedin_queue']}
-- **Total Posts:** {self.state['linkedin_posts_total']}
-- **Status:** {self._get_status_icon(self.state['linkedin_status'])} {self.state['linkedin_status']}
-- **DRY_RUN:** {'Yes' if self.state['linkedin_dry_run'] else 'No'}
-
----
-
-## 📘 Facebook Activity
-- **Status:** {self._get_status_icon(self.state['facebook_status'])} {self.state['facebook_status']}
-- **Reason:** {self.state['facebook_reason']}
-- **Posts This Week:** {self.state['facebook_posts_week']}
-
----
-
-## 🏢 Odoo — Accounting
-- **Connection:** {self._get_status_icon(self.state['odoo_status'])} {self.state['odoo_status']}
-- **Server:** {self.state['odoo_url']}
-- **Database:** {self.state['odoo_db']}
-- **Draft Invoices:** {self.state['odoo_draft_invoices']}
-- **Paid This Week:** ${self.state['odoo_paid_week']}
-- **Total Revenue MTD:** ${self.state['odoo_revenue_mtd']}
-- **Actions Today:** {self.state['odoo_actions_today']}
-- **DRY_RUN:** {'Yes' if self.state['odoo_dry_run'] else 'No'}
-
----
-
-## 📋 Recent Activity Log
+        return f"""## 📋 Recent Activity Log
 | Time | Action | Status |
 |------|--------|--------|
 | {activity_table}
-
----
-
-## 🚨 Alerts & Errors
+"""
+    
+    def _section_alerts(self, ctx: Dict[str, Any]) -> str:
+        """Latest alerts."""
+        if self.state['alerts']:
+            alerts_content = ""
+            for alert in self.state['alerts'][-5:]:
+                icon = '🚨' if alert['level'] == 'error' else '⚠️'
+                alerts_content += f"\n> {icon} {alert['time']}: {alert['message']}"
+        else:
+            alerts_content = "> 🟢 No alerts at this time"
+        
+        return f"""## 🚨 Alerts & Errors
 {alerts_content}
-
----
-
-## 📅 Scheduled Tasks
-{scheduled_tasks}
-
----
-
-## 📈 Weekly CEO Briefing
+"""
+    
+    def _section_scheduled_tasks(self, ctx: Dict[str, Any]) -> str:
+        """Scheduler task table (timed job times come from the scheduler's job journal)."""
+        last_check = ctx['folder_check_time'] or 'Not yet'
+        jobs = self.state.get('scheduled_jobs') or {}
+        
+        rows = [f"| 📊 Folder Check | Every 2 min | {last_check} | Within 2 min |"]
+        for name, label in (('generate_daily_briefing', '🌅 Daily Briefing'),
+                            ('generate_weekly_summary', '🗓️ Weekly Summary')):
+            job = jobs.get(name)
+            if job:
+                last_run = self._format_time(job['last_run']) or 'Not yet'
+                rows.append(f"| {label} | {job['schedule']} | {last_run} | {self._format_time(job['next_run'])} |")
+        ceo_last = self.state.get('last_briefing_date') or 'Not yet'
+        rows.append(f"| 📝 CEO Briefing | Sunday 9:00 PM | {ceo_last} | {ctx['ceo_next_run']} |")
+        scheduled_table = '\n'.join(rows)
+        
+        return f"""## 📅 Scheduled Tasks
+| Task | Schedule | Last Run | Next Run |
+|------|----------|----------|----------|
+{scheduled_table}
+"""
+    
+    def _section_ceo_briefing(self, ctx: Dict[str, Any]) -> str:
+        """Weekly CEO briefing info."""
+        briefing_date = self.state.get('last_briefing_date') or ctx['today']
+        briefing_path = f"/Briefings/CEO_Briefing_{briefing_date}.md"
+        return f"""## 📈 Weekly CEO Briefing
 - **Last Generated:** {briefing_date}
 - **Location:** {briefing_path}
 - **Next Briefing:** Sunday 9:00 PM
-
----
-
-## 🔒 Security & Audit
+"""
+    
+    def _section_security(self, ctx: Dict[str, Any]) -> str:
+        """Audit and log locations."""
+        security_check = self.state.get('last_security_check') or ctx['today']
+        return f"""## 🔒 Security & Audit
 - **Audit Logs:** /Logs/audit/
 - **Error Logs:** /Logs/errors/
 - **Log Retention:** 90 days
 - **Last Security Check:** {security_check}
+"""
+    
+    def _section_footer(self, ctx: Dict[str, Any]) -> str:
+        """Static footer."""
+        return "*🤖 Powered by AI Employee Gold Tier | Built with Qwen Code*\n"
 
----
 
-*🤖 Powered by AI Employee Gold Tier | Built with Qwen Code*
+class DashboardServer:
+    """
+    Local HTTP view of the dashboard.
+    
+    Routes:
+        /            Lightweight HTML view (live via SSE)
+        /api/state   Current state as JSON
+        /api/events  Server-sent events: 'state' on connect, then 'metric',
+                     'alert' and 'activity' changes
+    
+    Changes made by other service processes are picked up by polling the
+    shared metrics store every DASHBOARD_HTTP_POLL_MS.
+    """
+    
+    def __init__(self, manager: 'DashboardManager', host: str = HTTP_HOST, port: int = HTTP_PORT):
+        self.manager = manager
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
+        self._published: Optional[Dict[str, Any]] = None
+        self._running = False
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.host, self.port = self.httpd.server_address[:2]
+    
+    def start(self):
+        """Serve requests and poll for changes in background threads."""
+        self._running = True
+        self._published = self.manager.get_live_state()['state']
+        threading.Thread(target=self.httpd.serve_forever, name='dashboard-http', daemon=True).start()
+        threading.Thread(target=self._poll_loop, name='dashboard-poll', daemon=True).start()
+        print(f"[INFO] Dashboard server running at http://{self.host}:{self.port}/")
+    
+    def stop(self):
+        """Stop serving and close event streams."""
+        self._running = False
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        with self._subscribers_lock:
+            for subscriber in self._subscribers:
+                self._close(subscriber)
+    
+    def _poll_loop(self):
+        """Pick up changes written by other processes."""
+        while self._running:
+            time.sleep(HTTP_POLL_MS / 1000.0)
+            try:
+                self.manager.reload()
+            except Exception as e:
+                print(f"[WARN] Dashboard poll failed: {e}")
+    
+    def publish_changes(self, live_state: Dict[str, Any]):
+        """Diff against the last published state and broadcast what changed."""
+        previous, self._published = self._published or {}, live_state
+        changes = {key: value for key, value in live_state.items()
+                   if key not in ('alerts', 'last_activity') and previous.get(key) != value}
+        if changes:
+            self._broadcast('metric', {'changes': changes})
+        
+        old_alerts = previous.get('alerts') or []
+        for alert in live_state.get('alerts') or []:
+            if alert not in old_alerts:
+                self._broadcast('alert', alert)
+        
+        activity = live_state.get('last_activity')
+        if activity and activity != previous.get('last_activity'):
+            self._broadcast('activity', activity)
+    
+    def _broadcast(self, event: str, data: Any):
+        """Queue an event for every connected client."""
+        message = f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+        with self._subscribers_lock:
+            for subscriber in list(self._subscribers):
+                try:
+                    subscriber.put_nowait(message)
+                except queue.Full:
+                    # Slow client; drop it rather than buffer without bound
+                    self._subscribers.remove(subscriber)
+                    self._close(subscriber)
+    
+    @staticmethod
+    def _close(subscriber: queue.Queue):
+        """End a client's event stream without blocking: drop its backlog, then queue the end marker."""
+        while True:
+            try:
+                subscriber.get_nowait()
+            except queue.Empty:
+                break
+        try:
+            subscriber.put_nowait(None)
+        except queue.Full:
+            pass
+    
+    def _subscribe(self) -> queue.Queue:
+        subscriber = queue.Queue(maxsize=SSE_QUEUE_SIZE)
+        with self._subscribers_lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+    
+    def _unsubscribe(self, subscriber: queue.Queue):
+        with self._subscribers_lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+    
+    def _make_handler(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+            
+            def _send(self, body: bytes, content_type: str, status: int = 200):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                if path == '/api/state':
+                    body = json.dumps(server.manager.get_live_state(), default=str).encode('utf-8')
+                    self._send(body, 'application/json; charset=utf-8')
+                elif path == '/api/events':
+                    self._stream_events()
+                elif path in ('/', '/index.html'):
+                    self._send(DASHBOARD_HTML.encode('utf-8'), 'text/html; charset=utf-8')
+                else:
+                    self._send(b'Not found', 'text/plain', 404)
+            
+            def _stream_events(self):
+                subscriber = server._subscribe()
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/event-stream')
+                    self.send_header('Cache-Control', 'no-store')
+                    self.end_headers()
+                    snapshot = json.dumps(server.manager.get_live_state(), default=str)
+                    self.wfile.write(f"event: state\ndata: {snapshot}\n\n".encode('utf-8'))
+                    self.wfile.flush()
+                    while server._running:
+                        try:
+                            message = subscriber.get(timeout=SSE_KEEPALIVE_SECONDS)
+                        except queue.Empty:
+                            message = ": keepalive\n\n"
+                        if message is None:
+                            break
+                        self.wfile.write(message.encode('utf-8'))
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    server._unsubscribe(subscriber)
+        
+        return Handler
+
+
+DASHBOARD_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>AI Employee — Gold Tier Dashboard</title>
+<style>
+body { font-family: sans-serif; margin: 2em; background: #fafafa; }
+table { border-collapse: collapse; margin-bottom: 1.5em; }
+td, th { border: 1px solid #ddd; padding: 4px 10px; text-align: left; }
+.changed { background: #fff3b0; transition: background 2s; }
+#alerts li { color: #b00020; }
+</style>
+</head>
+<body>
+<h1>🤖 AI Employee — Gold Tier Dashboard</h1>
+<p>Last event: <span id="updated">connecting…</span></p>
+<h2>🚨 Alerts</h2>
+<ul id="alerts"></ul>
+<h2>📋 Last Activity</h2>
+<p id="activity">—</p>
+<h2>📊 State</h2>
+<table id="state"><tbody></tbody></table>
+<script>
+const rows = {};
+function setValue(key, value) {
+  if (key === 'alerts' || key === 'last_activity') return;
+  let row = rows[key];
+  if (!row) {
+    row = document.querySelector('#state tbody').insertRow();
+    row.insertCell().textContent = key;
+    row.insertCell();
+    rows[key] = row;
+  }
+  row.cells[1].textContent = typeof value === 'object' ? JSON.stringify(value) : value;
+  row.className = 'changed';
+  setTimeout(() => { row.className = ''; }, 2000);
+}
+function addAlert(alert) {
+  const li = document.createElement('li');
+  li.textContent = alert.time + ': ' + alert.message;
+  document.getElementById('alerts').prepend(li);
+}
+function setActivity(activity) {
+  document.getElementById('activity').textContent =
+    activity.time + ' — ' + activity.action + ' (' + activity.status + ')';
+}
+function touch() { document.getElementById('updated').textContent = new Date().toLocaleTimeString(); }
+const events = new EventSource('/api/events');
+events.addEventListener('state', e => {
+  const live = JSON.parse(e.data);
+  Object.entries(live.state).forEach(([k, v]) => setValue(k, v));
+  document.getElementById('alerts').innerHTML = '';
+  (live.state.alerts || []).forEach(addAlert);
+  if (live.state.last_activity) setActivity(live.state.last_activity);
+  touch();
+});
+events.addEventListener('metric', e => {
+  Object.entries(JSON.parse(e.data).changes).forEach(([k, v]) => setValue(k, v));
+  touch();
+});
+events.addEventListener('alert', e => { addAlert(JSON.parse(e.data)); touch(); });
+events.addEventListener('activity', e => { setActivity(JSON.parse(e.data)); touch(); });
+</script>
+</body>
+</html>
 """
-        return dashboard
 
 
 # Singleton instance
@@ -386,6 +982,12 @@ def get_dashboard_manager() -> DashboardManager:
     global _dashboard_manager
     if _dashboard_manager is None:
         _dashboard_manager = DashboardManager()
+        if HTTP_ENABLED:
+            try:
+                _dashboard_manager.start_server()
+            except OSError as e:
+                # Usually another service process is already serving the dashboard
+                print(f"[WARN] Dashboard server not started on {HTTP_HOST}:{HTTP_PORT}: {e}")
     return _dashboard_manager
 
 
@@ -400,6 +1002,11 @@ def increment_metric(metric: str, amount: int = 1):
     get_dashboard_manager().increment_metric(metric, amount)
 
 
+def record_event(metric: str, amount: int = 1):
+    """Record events for a rolling counter metric."""
+    get_dashboard_manager().record_event(metric, amount)
+
+
 def add_alert(alert: str, level: str = 'error'):
     """Add an alert."""
     get_dashboard_manager().add_alert(alert, level)
@@ -420,9 +1027,42 @@ def refresh_dashboard():
     get_dashboard_manager().refresh()
 
 
-if __name__ == '__main__':
+def get_render_stats() -> Dict[str, Any]:
+    """Get dashboard render counters and timings."""
+    return get_dashboard_manager().get_render_stats()
+
+
+def flush_dashboard():
+    """Render any pending dashboard changes immediately."""
+    get_dashboard_manager().flush()
+
+
+def main():
+    """Run the dashboard test, or serve the live dashboard with --serve."""
+    parser = argparse.ArgumentParser(description='Gold Tier dashboard manager')
+    parser.add_argument('--serve', action='store_true', help='Run the live HTTP dashboard until interrupted')
+    parser.add_argument('--host', default=HTTP_HOST)
+    parser.add_argument('--port', type=int, default=HTTP_PORT)
+    args = parser.parse_args()
+    
+    manager = get_dashboard_manager()
+    if args.serve:
+        manager.start_server(args.host, args.port)
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            manager.stop_server()
+            manager.flush()
+        return
+    
     # Test the dashboard manager
-    manager = DashboardManager()
     manager.log_activity("Dashboard Test", "Success")
+    manager.flush()
     print(f"Dashboard refreshed at {manager._get_datetime()}")
     print(f"Dashboard path: {DASHBOARD_PATH}")
+    print(f"Render stats: {manager.get_render_stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -444,22 +444,24 @@ class ErrorRecoverySystem:
     def _update_dashboard(self):
         """Update Dashboard.md with system health."""
         try:
-            # Update service status in dashboard
-            for service, status in self.service_status.items():
-                service_status = 'Running' if status['status'] in ['healthy', 'unknown'] else 'Error'
-                self.dashboard.update_service(service, {
-                    f'{service}_status': service_status
-                })
-            
-            # Log any errors
-            if self.error_queue:
-                last_error = self.error_queue[-1]
-                self.dashboard.add_alert(
-                    f"{last_error['service']}: {last_error['error_type']}",
-                    'error'
-                )
-            
-            self.dashboard.log_activity("Health Check Completed", "Success")
+            # One coalesced render for all services
+            with self.dashboard.batch():
+                # Update service status in dashboard
+                for service, status in self.service_status.items():
+                    service_status = 'Running' if status['status'] in ['healthy', 'unknown'] else 'Error'
+                    self.dashboard.update_service(service, {
+                        f'{service}_status': service_status
+                    })
+                
+                # Log any errors
+                if self.error_queue:
+                    last_error = self.error_queue[-1]
+                    self.dashboard.add_alert(
+                        f"{last_error['service']}: {last_error['error_type']}",
+                        'error'
+                    )
+                
+                self.dashboard.log_activity("Health Check Completed", "Success")
             logger.info("Dashboard updated with health status")
 
         except Exception as e:
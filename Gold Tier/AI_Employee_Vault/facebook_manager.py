@@ -10,7 +10,7 @@ import time
 import logging
 import json
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from dotenv import load_dotenv
 from typing import Optional, Tuple, Dict, Any
 
@@ -237,6 +237,9 @@ class FacebookManager:
                 if success:
                     logger.info(f"Successfully posted via {method}: {post_file.name}")
                     self.posts_published += 1
+                    # API posts are recorded by FacebookPoster itself
+                    if method != 'api':
+                        self.dashboard.record_event('facebook_posts')
                     self._mark_as_posted(post_file.name, method)
                     self._update_dashboard(method)
                 else:
@@ -275,19 +278,11 @@ class FacebookManager:
             now = datetime.now().strftime('%Y-%m-%d %H:%M')
             queue_count = len(list(FACEBOOK_QUEUE.glob('*.md')))
             
-            # Count posts this week
-            this_week = self._count_posts_this_week()
             last_post = self._get_last_post_time()
-            
-            # Increment metrics
-            if self.posts_published > 0:
-                self.dashboard.increment_metric('facebook_posts_total', self.posts_published)
-                self.dashboard.increment_metric('facebook_posts_today', self.posts_published)
-                self.dashboard.increment_metric('facebook_posts_week', self.posts_published)
 
+            # Post counts come from the rolling counters (recorded when posting)
             self.dashboard.update_service('facebook', {
                 'facebook_last_post': now if self.posts_published > 0 else last_post,
-                'facebook_posts_week': this_week,
                 'facebook_status': 'Running' if self.posts_published > 0 else 'Skip',
                 'facebook_reason': 'Anti-bot protection' if self.dashboard.state.get('facebook_status') == 'Skip' else 'Active'
             })
@@ -312,30 +307,6 @@ class FacebookManager:
                 pass
         return "Not yet"
     
-    def _count_posts_this_week(self) -> int:
-        """Count Facebook posts this week."""
-        if not POST_LOG.exists():
-            return 0
-        
-        try:
-            data = json.loads(POST_LOG.read_text(encoding='utf-8'))
-            posts = data.get('posts', [])
-            
-            today = datetime.now()
-            week_start = today - timedelta(days=today.weekday())
-            
-            count = 0
-            for post in posts:
-                posted_at = post.get('posted_at', '')
-                if posted_at:
-                    post_date = datetime.fromisoformat(posted_at).date()
-                    if post_date >= week_start.date():
-                        count += 1
-            
-            return count
-        except:
-            return 0
-    
     def run(self):
         """Main run loop."""
         logger.info(f"Facebook Manager started. Checking every {CHECK_INTERVAL} seconds...")
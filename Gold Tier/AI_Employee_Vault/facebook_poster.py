@@ -316,6 +316,7 @@ class FacebookAPIPoster:
             
             # Increment posts published count
             self.posts_published += 1
+            self.dashboard.record_event('facebook_posts')
             
             # Move file to Done folder
             self._move_file_to_done(post_data['filename'])
@@ -414,18 +415,9 @@ class FacebookAPIPoster:
             now = datetime.now().strftime('%Y-%m-%d %H:%M')
             queue_count = len(list(FACEBOOK_QUEUE.glob('*.md')))
             
-            # Count posts this week
-            this_week = self._count_posts_this_week()
-            
-            # Increment metrics
-            if self.posts_published > 0:
-                self.dashboard.increment_metric('facebook_posts_total', self.posts_published)
-                self.dashboard.increment_metric('facebook_posts_today', self.posts_published)
-                self.dashboard.increment_metric('facebook_posts_week', self.posts_published)
-
+            # Post counts come from the rolling counters (recorded when posting)
             self.dashboard.update_service('facebook', {
                 'facebook_last_post': now if self.posts_published > 0 else self._get_last_post_time(),
-                'facebook_posts_week': this_week,
                 'facebook_status': 'Running',
                 'facebook_reason': 'Active'
             })
@@ -450,30 +442,6 @@ class FacebookAPIPoster:
                 pass
         return "Not yet"
     
-    def _count_posts_this_week(self) -> int:
-        """Count Facebook posts this week."""
-        if not POST_LOG.exists():
-            return 0
-        
-        try:
-            data = json.loads(POST_LOG.read_text(encoding='utf-8'))
-            posts = data.get('posts', [])
-            
-            today = datetime.now()
-            week_start = today - timedelta(days=today.weekday())
-            
-            count = 0
-            for post in posts:
-                posted_at = post.get('posted_at', '')
-                if posted_at:
-                    post_date = datetime.fromisoformat(posted_at).date()
-                    if post_date >= week_start.date():
-                        count += 1
-            
-            return count
-        except:
-            return 0
-    
     def run(self):
         """Main run loop."""
         logger.info(f"Facebook API Poster started. Checking every {CHECK_INTERVAL} seconds...")
@@ -0,0 +1,251 @@
+"""
+Folder Counts - Event-maintained .md file counts for vault folders
+Keeps an in-memory index of the notes in each watched vault folder, updated by
+watchdog file events and reconciled by a periodic full scan. Per-folder counts
+and "completed today" are answered from the index instead of globbing (and
+stat-ing) every note on each dashboard refresh.
+"""
+
+import os
+import time
+import threading
+from collections import Counter
+from datetime import datetime, date
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+VAULT_PATH = Path(__file__).parent
+DEFAULT_FOLDERS = ('Needs_Action', 'In_Progress', 'Pending_Approval', 'Approved', 'Rejected', 'Plans', 'Done')
+DONE_FOLDER = 'Done'
+# Full rescan interval (safety net for missed or coalesced file events)
+RECONCILE_INTERVAL = int(os.getenv('FOLDER_RECONCILE_INTERVAL', '300'))
+# Without watchdog, rescan on access when the index is older than this
+POLL_INTERVAL = int(os.getenv('FOLDER_POLL_INTERVAL', '10'))
+
+
+def _scan_folder(path: Path) -> Dict[str, date]:
+    """Map each .md file in a folder to its modification date."""
+    files = {}
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.md') and entry.is_file():
+                    try:
+                        files[entry.name] = datetime.fromtimestamp(entry.stat().st_mtime).date()
+                    except OSError:
+                        continue
+    except FileNotFoundError:
+        pass
+    return files
+
+
+class _FolderEventHandler(FileSystemEventHandler):
+    """Forwards watchdog events to the cache."""
+
+    def __init__(self, cache: 'FolderCountCache'):
+        self.cache = cache
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.cache._file_added(Path(event.src_path))
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.cache._file_added(Path(event.src_path))
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.cache._file_removed(Path(event.src_path))
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.cache._file_removed(Path(event.src_path))
+            self.cache._file_added(Path(event.dest_path))
+
+
+class FolderCountCache:
+    """Per-folder .md counts kept current by file events plus periodic reconciliation."""
+
+    def __init__(self, vault_path: Path = VAULT_PATH, folders=DEFAULT_FOLDERS):
+        self.vault_path = Path(vault_path).resolve()
+        self._lock = threading.RLock()
+        self._files: Dict[str, Dict[str, date]] = {}
+        self._done_by_day: Counter = Counter()
+        self._watched: Dict[str, object] = {}
+        self._last_scan = 0.0
+        self._handler = _FolderEventHandler(self)
+        self._observer = None
+        if Observer is not None:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.start()
+        self.stats = {'events': 0, 'reconciles': 0, 'drift_corrections': 0}
+
+        for folder in folders:
+            self._add_folder(folder)
+        self._last_scan = time.time()
+
+        if self._observer is not None and RECONCILE_INTERVAL > 0:
+            threading.Thread(target=self._reconcile_loop, name='folder-count-reconcile', daemon=True).start()
+
+    def _folder_key(self, path: Path) -> Optional[str]:
+        """Watched folder name (relative to the vault) containing path, if any."""
+        try:
+            folder = path.parent.relative_to(self.vault_path).as_posix()
+        except ValueError:
+            return None
+        return folder if folder in self._files else None
+
+    def _set_folder(self, folder: str, files: Dict[str, date]):
+        """Replace a folder's index."""
+        self._files[folder] = files
+        if folder == DONE_FOLDER:
+            self._done_by_day = Counter(files.values())
+
+    def _add_folder(self, folder: str):
+        """Start indexing (and watching) a folder; folders created later are picked up on use."""
+        with self._lock:
+            if folder not in self._files:
+                self._set_folder(folder, _scan_folder(self.vault_path / folder))
+            if self._observer is not None and folder not in self._watched and self._watch(folder):
+                # Files may have arrived before the watch existed
+                self._set_folder(folder, _scan_folder(self.vault_path / folder))
+
+    def _watch(self, folder: str) -> bool:
+        """Schedule a non-recursive watch if the folder exists."""
+        path = self.vault_path / folder
+        if not path.is_dir():
+            return False
+        try:
+            self._watched[folder] = self._observer.schedule(self._handler, str(path), recursive=False)
+            return True
+        except Exception as e:
+            print(f"[WARN] Could not watch {path}: {e}")
+            return False
+
+    def _file_added(self, path: Path):
+        """Record a created, modified or moved-in note."""
+        if path.suffix != '.md':
+            return
+        try:
+            day = datetime.fromtimestamp(path.stat().st_mtime).date()
+        except OSError:
+            return
+        with self._lock:
+            folder = self._folder_key(path)
+            if folder is None:
+                return
+            self.stats['events'] += 1
+            previous = self._files[folder].get(path.name)
+            self._files[folder][path.name] = day
+            if folder == DONE_FOLDER:
+                if previous is not None:
+                    self._done_by_day[previous] -= 1
+                self._done_by_day[day] += 1
+
+    def _file_removed(self, path: Path):
+        """Record a deleted or moved-out note."""
+        if path.suffix != '.md':
+            return
+        with self._lock:
+            folder = self._folder_key(path)
+            if folder is None:
+                return
+            self.stats['events'] += 1
+            previous = self._files[folder].pop(path.name, None)
+            if folder == DONE_FOLDER and previous is not None:
+                self._done_by_day[previous] -= 1
+
+    def reconcile(self):
+        """Rescan every folder and correct any drift from missed events."""
+        with self._lock:
+            folders = list(self._files)
+        for folder in folders:
+            files = _scan_folder(self.vault_path / folder)
+            with self._lock:
+                if files != self._files[folder]:
+                    self.stats['drift_corrections'] += 1
+                self._set_folder(folder, files)
+                if self._observer is not None and folder not in self._watched:
+                    self._watch(folder)
+        with self._lock:
+            self.stats['reconciles'] += 1
+            self._last_scan = time.time()
+
+    def _reconcile_loop(self):
+        """Background reconciliation."""
+        while True:
+            time.sleep(RECONCILE_INTERVAL)
+            try:
+                self.reconcile()
+            except Exception as e:
+                print(f"[WARN] Folder count reconciliation failed: {e}")
+
+    def _refresh_if_polling(self):
+        """Without file events, fall back to rescanning stale indexes."""
+        if self._observer is None and time.time() - self._last_scan >= POLL_INTERVAL:
+            self.reconcile()
+
+    def count(self, folder: str) -> int:
+        """Number of .md files in a vault folder (e.g. 'Needs_Action' or 'Pending_Approval/ODOO')."""
+        self._add_folder(folder)
+        self._refresh_if_polling()
+        with self._lock:
+            return len(self._files[folder])
+
+    def names(self, folder: str) -> Set[str]:
+        """Names of the .md files currently in a vault folder."""
+        self._add_folder(folder)
+        self._refresh_if_polling()
+        with self._lock:
+            return set(self._files[folder])
+
+    def counts(self) -> Dict[str, int]:
+        """Counts for every indexed folder."""
+        for folder in list(self._files):
+            self._add_folder(folder)
+        self._refresh_if_polling()
+        with self._lock:
+            return {folder: len(files) for folder, files in self._files.items()}
+
+    def completed_on(self, day: date) -> int:
+        """Number of notes in Done last modified on a given day."""
+        self._add_folder(DONE_FOLDER)
+        self._refresh_if_polling()
+        with self._lock:
+            return self._done_by_day.get(day, 0)
+
+    def completed_today(self) -> int:
+        """Number of notes in Done last modified today."""
+        return self.completed_on(date.today())
+
+    def get_stats(self) -> Dict[str, int]:
+        """Event and reconciliation counters."""
+        with self._lock:
+            return dict(self.stats, watching=len(self._watched))
+
+    def stop(self):
+        """Stop watching for file events."""
+        if self._observer is not None:
+            self._observer.stop()
+
+
+# One cache per vault path, shared by every dashboard writer in the process
+_caches: Dict[Path, FolderCountCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_folder_counts(vault_path: Path = VAULT_PATH) -> FolderCountCache:
+    """Get the shared folder count cache for a vault."""
+    key = Path(vault_path).resolve()
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = FolderCountCache(key)
+        return _caches[key]
@@ -10,6 +10,9 @@ from datetime import datetime, timedelta
 import re
 
 from dashboard_manager import get_dashboard_manager
+from rolling_counters import get_rolling_counters
+from completion_ledger import get_completion_ledger
+from audit_logger import get_audit_logger
 
 # Set UTF-8 encoding for Windows
 sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
@@ -21,7 +24,6 @@ load_dotenv()
 # Configuration
 VAULT_PATH = Path('E:/Hackathone/Gold Tier/AI_Employee_Vault')
 BRIEFINGS_PATH = VAULT_PATH / 'Briefings'
-DONE_PATH = VAULT_PATH / 'Done'
 ACCOUNTING_PATH = VAULT_PATH / 'Accounting'
 SOCIAL_PATH = VAULT_PATH / 'Social'
 LOGS_PATH = VAULT_PATH / 'Logs'
@@ -32,7 +34,6 @@ PENDING_APPROVAL_ODOO_PATH = VAULT_PATH / 'Pending_Approval' / 'ODOO'
 # Activity logs
 FACEBOOK_LOG = LOGS_PATH / 'facebook_posts.json'
 ODOO_LOG = LOGS_PATH / 'odoo_actions.json'
-EMAIL_LOG = LOGS_PATH / 'sent_emails.json'
 LINKEDIN_LOG = LOGS_PATH / 'linkedin_posts.json'
 AUDIT_PATH = LOGS_PATH / 'audit'
 
@@ -65,22 +66,8 @@ def read_business_goals():
 
 
 def get_completed_tasks(week_start, week_end):
-    """Get completed tasks from Done folder."""
-    tasks = []
-    if DONE_PATH.exists():
-        for filepath in DONE_PATH.rglob('*.md'):
-            try:
-                mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
-                if week_start.date() <= mtime.date() <= week_end.date():
-                    tasks.append({
-                        'name': filepath.stem,
-                        'path': str(filepath.relative_to(VAULT_PATH)),
-                        'completed_at': mtime.isoformat()
-                    })
-            except:
-                continue
-    tasks.sort(key=lambda x: x['completed_at'], reverse=True)
-    return tasks
+    """Get completed tasks from the completion ledger (newest first)."""
+    return get_completion_ledger().list_range(week_start, week_end)
 
 
 def get_facebook_activity(week_start, week_end):
@@ -106,17 +93,9 @@ def get_linkedin_activity(week_start, week_end):
     """Get LinkedIn activity."""
     activity = {'posts_count': 0, 'last_post': None}
     
-    # Check LinkedIn_Posted folder
-    linkedin_posted = SOCIAL_PATH / 'LinkedIn_Posted'
-    if linkedin_posted.exists():
-        for filepath in linkedin_posted.glob('*.md'):
-            try:
-                mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
-                if week_start.date() <= mtime.date() <= week_end.date():
-                    activity['posts_count'] += 1
-                    activity['last_post'] = mtime.isoformat()
-            except:
-                continue
+    activity['posts_count'] = get_rolling_counters().count_range('linkedin_posts', week_start, week_end)
+    if activity['posts_count']:
+        activity['last_post'] = get_dashboard_manager().state.get('linkedin_last_post')
     
     return activity
 
@@ -223,18 +202,7 @@ def get_email_activity(week_start, week_end):
     """Get email activity."""
     activity = {'emails_sent': 0}
     
-    if EMAIL_LOG.exists():
-        try:
-            data = json.loads(EMAIL_LOG.read_text(encoding='utf-8'))
-            emails = data.get('sent_emails', [])
-            for email in emails:
-                sent_at = email.get('sent_at', '')
-                if sent_at:
-                    email_date = datetime.fromisoformat(sent_at).date()
-                    if week_start.date() <= email_date <= week_end.date():
-                        activity['emails_sent'] += 1
-        except:
-            pass
+    activity['emails_sent'] = get_rolling_counters().count_range('emails_sent', week_start, week_end)
     
     return activity
 
@@ -243,22 +211,11 @@ def get_audit_summary(week_start, week_end):
     """Get audit log summary."""
     summary = {'total_actions': 0, 'by_type': {}, 'by_result': {}}
     
-    if AUDIT_PATH.exists():
-        for audit_file in AUDIT_PATH.glob('*.json'):
-            try:
-                date_str = audit_file.stem
-                file_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                if week_start.date() <= file_date <= week_end.date():
-                    data = json.loads(audit_file.read_text(encoding='utf-8'))
-                    entries = data.get('entries', [])
-                    summary['total_actions'] += len(entries)
-                    for entry in entries:
-                        action_type = entry.get('action_type', 'unknown')
-                        result = entry.get('result', 'unknown')
-                        summary['by_type'][action_type] = summary['by_type'].get(action_type, 0) + 1
-                        summary['by_result'][result] = summary['by_result'].get(result, 0) + 1
-            except:
-                continue
+    # Per-day rollups: O(days) instead of re-parsing every entry
+    rollup = get_audit_logger().get_summary_for_range(week_start, week_end)
+    summary['total_actions'] = rollup['total_actions']
+    summary['by_type'] = rollup['by_type']
+    summary['by_result'] = rollup['by_result']
     
     return summary
 
@@ -291,6 +291,7 @@ _Add any notes or context here_
                 # Mark as processed (but don't mark as read in Gmail)
                 self._save_processed_id(msg_ref['id'])
                 self.emails_this_hour += 1
+                self.dashboard.record_event('emails_processed')
             
             # Update dashboard
             self._update_dashboard(len(new_messages))
@@ -0,0 +1,152 @@
+"""
+Job Journal - Durable run record for time-of-day scheduled jobs
+Records, per job, the last scheduled period that completed successfully and
+how long it took, in the shared metrics database. A scheduler that was down
+at a job's scheduled time can work out exactly which periods were missed on
+restart, and the dashboard can show real last/next run times.
+
+A schedule is a (weekday, 'HH:MM') pair; weekday is 0 (Monday) to 6
+(Sunday), or None for every day.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from metrics_store import METRICS_DB
+
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+
+def _slot_on(day: datetime, at: str) -> datetime:
+    """The scheduled time on a given day."""
+    hour, minute = (int(part) for part in at.split(':'))
+    return day.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+
+def run_times(spec: tuple, start: datetime, end: datetime) -> List[datetime]:
+    """Scheduled times in (start, end], oldest first."""
+    weekday, at = spec
+    times = []
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day <= end:
+        slot = _slot_on(day, at)
+        if (weekday is None or slot.weekday() == weekday) and start < slot <= end:
+            times.append(slot)
+        day += timedelta(days=1)
+    return times
+
+
+def last_run_time(spec: tuple, now: datetime) -> datetime:
+    """Most recent scheduled time at or before now."""
+    return run_times(spec, now - timedelta(days=7), now)[-1]
+
+
+def next_run_time(spec: tuple, now: datetime) -> datetime:
+    """Next scheduled time after now."""
+    return run_times(spec, now, now + timedelta(days=7))[0]
+
+
+def describe_schedule(spec: tuple) -> str:
+    """Human-readable schedule, e.g. '8:00 AM' or 'Sunday 9:00 PM'."""
+    weekday, at = spec
+    time_of_day = datetime.strptime(at, '%H:%M').strftime('%I:%M %p').lstrip('0')
+    return f"{WEEKDAYS[weekday].title()} {time_of_day}" if weekday is not None else time_of_day
+
+
+class JobJournal:
+    """Last completed period, status and duration of each scheduled job."""
+
+    def __init__(self, db_path: Path = METRICS_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_journal (
+                job TEXT PRIMARY KEY,
+                last_period TEXT,
+                last_success TEXT,
+                last_status TEXT,
+                last_duration_ms REAL,
+                runs INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, job: str) -> Optional[Dict[str, Any]]:
+        """Get a job's journal entry."""
+        with self._lock:
+            cursor = self.conn.execute('SELECT * FROM job_journal WHERE job = ?', (job,))
+            row = cursor.fetchone()
+            columns = [column[0] for column in cursor.description]
+        return dict(zip(columns, row)) if row else None
+
+    def start_from(self, job: str, period: datetime) -> bool:
+        """Give a job with no history a starting period (earlier periods are never caught up)."""
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                'INSERT OR IGNORE INTO job_journal (job, last_period, updated_at) VALUES (?, ?, ?)',
+                (job, period.isoformat(), datetime.now().isoformat())
+            )
+        return cursor.rowcount > 0
+
+    def record(self, job: str, period: datetime, success: bool, duration_ms: float):
+        """Record a run for a period; only successful runs advance the last completed period."""
+        now = datetime.now().isoformat()
+        status = 'success' if success else 'failed'
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO job_journal (job, last_period, last_success, last_status, last_duration_ms, '
+                'runs, failures, updated_at) VALUES (?, ?, ?, ?, ?, 1, ?, ?) '
+                'ON CONFLICT(job) DO UPDATE SET '
+                'last_period = CASE WHEN excluded.last_status = \'success\' THEN excluded.last_period ELSE last_period END, '
+                'last_success = CASE WHEN excluded.last_status = \'success\' THEN excluded.last_success ELSE last_success END, '
+                'last_status = excluded.last_status, last_duration_ms = excluded.last_duration_ms, '
+                'runs = runs + 1, failures = failures + excluded.failures, updated_at = excluded.updated_at',
+                (job, period.isoformat(), now if success else None, status, duration_ms,
+                 0 if success else 1, now)
+            )
+
+    def skip_to(self, job: str, period: datetime):
+        """Treat every period up to and including period as done without running it."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO job_journal (job, last_period, updated_at) VALUES (?, ?, ?) '
+                'ON CONFLICT(job) DO UPDATE SET last_period = MAX(COALESCE(last_period, \'\'), excluded.last_period), '
+                'updated_at = excluded.updated_at',
+                (job, period.isoformat(), datetime.now().isoformat())
+            )
+
+    def due_periods(self, job: str, spec: tuple, now: datetime, limit: int) -> List[datetime]:
+        """
+        Scheduled periods after the job's last completed one, up to now (oldest first).
+
+        Only the newest `limit` are returned, so a long outage costs a bounded catch-up.
+        """
+        entry = self.get(job)
+        if not entry or not entry['last_period'] or limit <= 0:
+            return []
+        return run_times(spec, datetime.fromisoformat(entry['last_period']), now)[-limit:]
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+# Singleton instance
+_job_journal = None
+
+
+def get_job_journal() -> JobJournal:
+    """Get the singleton job journal instance."""
+    global _job_journal
+    if _job_journal is None:
+        _job_journal = JobJournal()
+    return _job_journal
@@ -476,6 +476,7 @@ class LinkedInPoster:
 
             # Increment posts published count
             self.posts_published += 1
+            self.dashboard.record_event('linkedin_posts')
 
             # Move file to Done folder
             self._move_file_to_done(post_data['filename'])
@@ -566,17 +567,10 @@ class LinkedInPoster:
             now = datetime.now().strftime('%Y-%m-%d %H:%M')
             queue_count = len(list(LINKEDIN_QUEUE.glob('*.md')))
             
-            # Add the newly published posts
-            self.dashboard.increment_metric('linkedin_posts_total', self.posts_published)
-            self.dashboard.increment_metric('linkedin_posts_today', self.posts_published)
-            self.dashboard.increment_metric('linkedin_posts_week', self.posts_published)
-            
-            this_week = len([p for p in self.posted_posts if 'post_' in p])
-
+            # Post counts come from the rolling counters (recorded when posting)
             self.dashboard.update_service('linkedin', {
                 'linkedin_last_post': now if self.posts_published > 0 else self.dashboard.state.get('linkedin_last_post', 'Never'),
                 'linkedin_queue': queue_count,
-                'linkedin_posts_week': this_week,
                 'linkedin_dry_run': DRY_RUN,
                 'linkedin_status': 'Running'
             })
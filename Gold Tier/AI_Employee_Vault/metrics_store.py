@@ -0,0 +1,153 @@
+"""
+Metrics Store - Shared, concurrent-safe dashboard state
+SQLite (WAL mode) key/value store used by every service that updates the
+dashboard. Increments are atomic across processes, each key records when and
+by whom it was last written, and snapshot reads are a single cheap SELECT.
+"""
+
+import os
+import sys
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+VAULT_PATH = Path(__file__).parent
+METRICS_DB = VAULT_PATH / '.dashboard_metrics.db'
+LEGACY_STATE_FILE = VAULT_PATH / '.dashboard_state.json'
+
+# Identifies this process as the last writer of a key
+WRITER_ID = f"{Path(sys.argv[0] or 'python').stem}-{os.getpid()}"
+
+
+class MetricsStore:
+    """Key/value metrics with atomic updates, backed by SQLite in WAL mode."""
+
+    def __init__(self, db_path: Path = METRICS_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS metrics (
+                key TEXT PRIMARY KEY,
+                value TEXT,
+                updated_at TEXT NOT NULL,
+                writer TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def _now(self) -> str:
+        """Timestamp recorded with every write."""
+        return datetime.now().isoformat()
+
+    def ensure_defaults(self, defaults: Dict[str, Any]):
+        """Insert default values for keys that don't exist yet (never overwrites)."""
+        now = self._now()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO metrics (key, value, updated_at, writer) VALUES (?, ?, ?, ?)',
+                [(key, json.dumps(value), now, WRITER_ID) for key, value in defaults.items()]
+            )
+
+    def import_legacy_state(self, state_file: Path = LEGACY_STATE_FILE) -> bool:
+        """One-time import of the old .dashboard_state.json into an empty store."""
+        if not state_file.exists():
+            return False
+        with self._lock:
+            if self.conn.execute('SELECT COUNT(*) FROM metrics').fetchone()[0] > 0:
+                return False
+        try:
+            legacy = json.loads(state_file.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.warning(f"Could not import legacy dashboard state: {e}")
+            return False
+        self.set_many(legacy)
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a single value."""
+        with self._lock:
+            row = self.conn.execute('SELECT value FROM metrics WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set(self, key: str, value: Any):
+        """Write a single value."""
+        self.set_many({key: value})
+
+    def set_many(self, values: Dict[str, Any]):
+        """Write several values in one transaction."""
+        now = self._now()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                'INSERT INTO metrics (key, value, updated_at, writer) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET value = excluded.value, '
+                'updated_at = excluded.updated_at, writer = excluded.writer',
+                [(key, json.dumps(value), now, WRITER_ID) for key, value in values.items()]
+            )
+
+    def increment(self, key: str, amount: float = 1) -> Optional[float]:
+        """
+        Atomically add to a numeric value (missing keys start at 0).
+
+        Returns:
+            The new value
+        """
+        now = self._now()
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT INTO metrics (key, value, updated_at, writer) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET value = CAST(CAST(value AS NUMERIC) + ? AS TEXT), '
+                'updated_at = excluded.updated_at, writer = excluded.writer',
+                (key, json.dumps(amount), now, WRITER_ID, amount)
+            )
+            row = self.conn.execute('SELECT value FROM metrics WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def append_to_list(self, key: str, item: Any, max_items: int) -> List[Any]:
+        """Atomically append to a JSON list value, keeping only the newest max_items."""
+        now = self._now()
+        with self._lock, self.conn:
+            self.conn.execute('BEGIN IMMEDIATE')
+            row = self.conn.execute('SELECT value FROM metrics WHERE key = ?', (key,)).fetchone()
+            items = json.loads(row[0]) if row and row[0] else []
+            items = (items + [item])[-max_items:]
+            self.conn.execute(
+                'INSERT OR REPLACE INTO metrics (key, value, updated_at, writer) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(items), now, WRITER_ID)
+            )
+        return items
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Read every value in one consistent query."""
+        with self._lock:
+            rows = self.conn.execute('SELECT key, value FROM metrics').fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def updated_times(self) -> Dict[str, str]:
+        """Get the last write time of every key."""
+        with self._lock:
+            rows = self.conn.execute('SELECT key, updated_at FROM metrics').fetchall()
+        return dict(rows)
+
+    def get_key_info(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the value, last write time and last writer of a key."""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT value, updated_at, writer FROM metrics WHERE key = ?', (key,)
+            ).fetchone()
+        if not row:
+            return None
+        return {'value': json.loads(row[0]), 'updated_at': row[1], 'writer': row[2]}
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
@@ -20,6 +20,8 @@ from dotenv import load_dotenv
 from typing import Optional, Dict, Any, List
 
 from dashboard_manager import get_dashboard_manager
+from folder_counts import get_folder_counts
+from completion_ledger import record_completion
 
 # Import audit logger
 from audit_logger import get_audit_logger
@@ -70,6 +72,7 @@ class OdooMCPServer:
         self.audit_logger = get_audit_logger()
         self.actions_log = []
         self.dashboard = get_dashboard_manager()
+        self.folders = get_folder_counts(VAULT_PATH)
         self._initialize()
     
     def _initialize(self):
@@ -210,6 +213,7 @@ class OdooMCPServer:
             )
             
             logger.info(f"Created draft invoice ID: {invoice_id}")
+            self.dashboard.record_event('odoo_invoices')
             
             # Get invoice details
             invoice_data = self.models.execute_kw(
@@ -485,6 +489,7 @@ class OdooMCPServer:
             done_path = DONE_PATH / filepath.name
             DONE_PATH.mkdir(parents=True, exist_ok=True)
             filepath.rename(done_path)
+            record_completion(done_path, 'odoo_mcp')
             logger.info(f"Moved to Done: {filepath.name}")
         except Exception as e:
             logger.error(f"Error moving file: {e}")
@@ -597,7 +602,7 @@ Create and post a draft invoice in Odoo.
             now = datetime.now().strftime('%Y-%m-%d %H:%M')
             
             # Count pending approvals
-            pending_count = len(list(PENDING_APPROVAL_PATH.glob('*.md')))
+            pending_count = self.folders.count(PENDING_APPROVAL_PATH.relative_to(VAULT_PATH).as_posix())
             
             # Count actions today
             today = datetime.now().strftime('%Y-%m-%d')
@@ -0,0 +1,133 @@
+"""
+Plan Tracker - Incremental checkbox progress for Plans/*.plan.md
+Keeps the checked/total checkbox counts of each plan file keyed by its
+(path, mtime, size). A plan is only re-read when its file changed since the
+last look, so checking every in-progress task costs one stat() per plan. The
+index lives in the shared metrics database and survives restarts.
+"""
+
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+from metrics_store import METRICS_DB
+
+# Markdown task list checkboxes: "[ ]" open, "[x]" / "[X]" done
+CHECKBOX_RE = re.compile(r'\[([ xX])\]')
+
+
+def parse_plan(text: str) -> tuple:
+    """Count (checked, total) checkboxes in a plan in one pass."""
+    total = checked = 0
+    for mark in CHECKBOX_RE.findall(text):
+        total += 1
+        if mark != ' ':
+            checked += 1
+    return checked, total
+
+
+class PlanProgressTracker:
+    """Per-plan checkbox progress, re-parsed only when the plan file changes."""
+
+    def __init__(self, db_path: Path = METRICS_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS plan_progress (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                checked INTEGER NOT NULL,
+                total INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+        rows = self.conn.execute('SELECT path, mtime_ns, size, checked, total FROM plan_progress').fetchall()
+        self._plans: Dict[str, tuple] = {row[0]: row[1:] for row in rows}
+        self.stats = {'lookups': 0, 'parses': 0}
+
+    def get(self, plan_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Get a plan's progress, re-reading the file only if it changed.
+
+        Returns:
+            Dict with checked, total and percent, or None if the plan doesn't exist
+        """
+        key = str(plan_path)
+        try:
+            st = plan_path.stat()
+        except OSError:
+            self.forget(plan_path)
+            return None
+        with self._lock:
+            self.stats['lookups'] += 1
+            cached = self._plans.get(key)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            checked, total = cached[2:]
+        else:
+            try:
+                checked, total = parse_plan(plan_path.read_text(encoding='utf-8'))
+            except OSError:
+                return None
+            with self._lock, self.conn:
+                self.stats['parses'] += 1
+                self._plans[key] = (st.st_mtime_ns, st.st_size, checked, total)
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO plan_progress (path, mtime_ns, size, checked, total, updated_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (key, st.st_mtime_ns, st.st_size, checked, total, datetime.now().isoformat())
+                )
+        return {
+            'checked': checked,
+            'total': total,
+            'percent': round(100 * checked / total) if total else 0,
+        }
+
+    def is_complete(self, progress: Optional[Dict[str, Any]]) -> bool:
+        """A plan is complete once it has checkboxes and all of them are checked."""
+        return bool(progress) and progress['total'] > 0 and progress['checked'] == progress['total']
+
+    def forget(self, plan_path: Path):
+        """Drop a plan (moved or deleted) from the index."""
+        key = str(plan_path)
+        with self._lock, self.conn:
+            if self._plans.pop(key, None) is not None:
+                self.conn.execute('DELETE FROM plan_progress WHERE path = ?', (key,))
+
+    def retain(self, plan_paths: Iterable[Path]):
+        """Drop every indexed plan not in plan_paths."""
+        keep = {str(path) for path in plan_paths}
+        with self._lock, self.conn:
+            stale = [key for key in self._plans if key not in keep]
+            for key in stale:
+                del self._plans[key]
+            self.conn.executemany('DELETE FROM plan_progress WHERE path = ?', [(key,) for key in stale])
+
+    def get_stats(self) -> Dict[str, int]:
+        """Lookup and parse counters."""
+        with self._lock:
+            return dict(self.stats, tracked=len(self._plans))
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+# Singleton instance
+_plan_tracker = None
+
+
+def get_plan_tracker() -> PlanProgressTracker:
+    """Get the singleton plan tracker instance."""
+    global _plan_tracker
+    if _plan_tracker is None:
+        _plan_tracker = PlanProgressTracker()
+    return _plan_tracker
@@ -0,0 +1,250 @@
+"""
+Rolling Counters - Time-bucketed event counts for dashboard metrics
+Each metric keeps fixed-size ring buffers of per-minute, per-hour and per-day
+buckets plus a running total, stored in the shared metrics database. Slots are
+reused as time moves on, so "today", "last 7 days", "month to date" and
+"total" roll over by themselves and are read from a bounded number of rows.
+"""
+
+import os
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterable, Optional
+
+from metrics_store import METRICS_DB
+
+logger = logging.getLogger(__name__)
+
+VAULT_PATH = Path(__file__).parent
+LOGS_PATH = VAULT_PATH / 'Logs'
+
+# Ring buffer sizes (slots per resolution)
+MINUTE_SLOTS = 60
+HOUR_SLOTS = 48
+DAY_SLOTS = int(os.getenv('ROLLING_COUNTER_DAYS', '90'))
+
+RESOLUTIONS = {
+    'minute': MINUTE_SLOTS,
+    'hour': HOUR_SLOTS,
+    'day': DAY_SLOTS,
+}
+
+# Legacy logs used to backfill counters the first time they are created:
+# metric -> (log file, list key, timestamp field, record filter or None)
+LEGACY_LOGS = {
+    'emails_sent': (LOGS_PATH / 'sent_emails.json', 'sent_emails', 'sent_at', None),
+    'linkedin_posts': (LOGS_PATH / 'linkedin_posts.json', 'posts', 'posted_at', None),
+}
+
+
+def register_legacy_log(metric: str, log_file: Path, list_key: str, time_field: str,
+                        record_filter: Optional[Callable[[Dict[str, Any]], bool]] = None):
+    """
+    Backfill a metric from a JSON log (only the records passing record_filter).
+
+    Call before the counters are first created in the process; a metric that
+    already has a counter is never backfilled again.
+    """
+    LEGACY_LOGS[metric] = (log_file, list_key, time_field, record_filter)
+
+
+def _as_number(value: float) -> float:
+    """Whole numbers read back as floats from REAL columns; return them as ints."""
+    return int(value) if float(value).is_integer() else value
+
+
+def _bucket_index(resolution: str, when: datetime) -> int:
+    """Absolute (local time) bucket number of a timestamp."""
+    day = when.date().toordinal()
+    if resolution == 'day':
+        return day
+    hour = day * 24 + when.hour
+    if resolution == 'hour':
+        return hour
+    return hour * 60 + when.minute
+
+
+class RollingCounters:
+    """Per-metric minute/hour/day ring buffers with O(1) rollups."""
+
+    def __init__(self, db_path: Path = METRICS_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS counter_buckets (
+                metric TEXT NOT NULL,
+                resolution TEXT NOT NULL,
+                slot INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                count REAL NOT NULL,
+                PRIMARY KEY (metric, resolution, slot)
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS counter_totals (
+                metric TEXT PRIMARY KEY,
+                total REAL NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self._backfill_legacy_logs()
+
+    def _upsert_buckets(self, metric: str, amount: float, when: datetime):
+        """Add to the current bucket of every resolution, resetting reused slots."""
+        for resolution, slots in RESOLUTIONS.items():
+            bucket = _bucket_index(resolution, when)
+            self.conn.execute(
+                'INSERT INTO counter_buckets (metric, resolution, slot, bucket, count) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT(metric, resolution, slot) DO UPDATE SET '
+                'count = CASE WHEN bucket = excluded.bucket THEN count + excluded.count '
+                'WHEN bucket < excluded.bucket THEN excluded.count ELSE count END, '
+                'bucket = MAX(bucket, excluded.bucket)',
+                (metric, resolution, bucket % slots, bucket, amount)
+            )
+
+    def record(self, metric: str, amount: float = 1, when: Optional[datetime] = None):
+        """Record amount events for a metric (now, or at a given time)."""
+        if not amount:
+            return
+        when = when or datetime.now()
+        with self._lock, self.conn:
+            self._upsert_buckets(metric, amount, when)
+            self.conn.execute(
+                'INSERT INTO counter_totals (metric, total, updated_at) VALUES (?, ?, ?) '
+                'ON CONFLICT(metric) DO UPDATE SET total = total + excluded.total, '
+                'updated_at = excluded.updated_at',
+                (metric, amount, datetime.now().isoformat())
+            )
+
+    def seed_total(self, metric: str, total: float) -> bool:
+        """Set the starting total of a metric that has no counter yet."""
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                'INSERT OR IGNORE INTO counter_totals (metric, total, updated_at) VALUES (?, ?, ?)',
+                (metric, total, datetime.now().isoformat())
+            )
+        return cursor.rowcount > 0
+
+    def _backfill_legacy_logs(self):
+        """Load history from the JSON logs the counters replace (first run only)."""
+        for metric, (log_file, list_key, time_field, record_filter) in LEGACY_LOGS.items():
+            if not log_file.exists():
+                continue
+            with self._lock:
+                exists = self.conn.execute(
+                    'SELECT 1 FROM counter_totals WHERE metric = ?', (metric,)
+                ).fetchone()
+            if exists:
+                continue
+            try:
+                records = json.loads(log_file.read_text(encoding='utf-8')).get(list_key, [])
+            except Exception as e:
+                logger.warning(f"Could not backfill {metric} from {log_file.name}: {e}")
+                continue
+            if record_filter:
+                records = [record for record in records if isinstance(record, dict) and record_filter(record)]
+            oldest_day = date.today() - timedelta(days=DAY_SLOTS - 1)
+            with self._lock, self.conn:
+                for record in records:
+                    try:
+                        when = datetime.fromisoformat(record.get(time_field, ''))
+                    except (TypeError, ValueError):
+                        continue
+                    if when.date() >= oldest_day:
+                        self._upsert_buckets(metric, 1, when)
+                self.conn.execute(
+                    'INSERT OR IGNORE INTO counter_totals (metric, total, updated_at) VALUES (?, ?, ?)',
+                    (metric, len(records), datetime.now().isoformat())
+                )
+
+    def _sum(self, metric: str, resolution: str, first: int, last: int) -> float:
+        """Sum the live buckets of one resolution in [first, last]."""
+        row = self.conn.execute(
+            'SELECT COALESCE(SUM(count), 0) FROM counter_buckets '
+            'WHERE metric = ? AND resolution = ? AND bucket BETWEEN ? AND ?',
+            (metric, resolution, first, last)
+        ).fetchone()
+        return row[0]
+
+    def count_range(self, metric: str, start: date, end: date) -> float:
+        """
+        Count events between two dates (inclusive).
+
+        Only the last ROLLING_COUNTER_DAYS days are kept; older days count as 0.
+        """
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+        with self._lock:
+            return _as_number(self._sum(metric, 'day', start.toordinal(), end.toordinal()))
+
+    def get_counts(self, metric: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Get rolling counts for a metric.
+
+        Returns:
+            Dict with last_hour, last_24h, today, week (last 7 days), month (month to date) and total
+        """
+        now = now or datetime.now()
+        today = now.date().toordinal()
+        minute = _bucket_index('minute', now)
+        hour = _bucket_index('hour', now)
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT total FROM counter_totals WHERE metric = ?', (metric,)
+            ).fetchone()
+            counts = {
+                'last_hour': self._sum(metric, 'minute', minute - MINUTE_SLOTS + 1, minute),
+                'last_24h': self._sum(metric, 'hour', hour - 23, hour),
+                'today': self._sum(metric, 'day', today, today),
+                'week': self._sum(metric, 'day', today - 6, today),
+                'month': self._sum(metric, 'day', now.date().replace(day=1).toordinal(), today),
+                'total': row[0] if row else 0,
+            }
+        return {key: _as_number(value) for key, value in counts.items()}
+
+    def get_all_counts(self, metrics: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get rolling counts for several metrics."""
+        now = datetime.now()
+        return {metric: self.get_counts(metric, now) for metric in metrics}
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+# Singleton instance
+_rolling_counters = None
+
+
+def get_rolling_counters() -> RollingCounters:
+    """Get the singleton rolling counters instance."""
+    global _rolling_counters
+    if _rolling_counters is None:
+        _rolling_counters = RollingCounters()
+    return _rolling_counters
+
+
+def record_event(metric: str, amount: float = 1):
+    """Record events for a metric."""
+    get_rolling_counters().record(metric, amount)
+
+
+def get_counts(metric: str) -> Dict[str, Any]:
+    """Get last_hour/last_24h/today/week/month/total counts for a metric."""
+    return get_rolling_counters().get_counts(metric)
+
+
+def count_range(metric: str, start: date, end: date) -> float:
+    """Count a metric's events between two dates (inclusive)."""
+    return get_rolling_counters().count_range(metric, start, end)
@@ -6,19 +6,38 @@
 # - Every Sunday 9:00 PM: Generate weekly summary
 # - Auto move completed tasks to /Done/
 # - Auto check /Approved/ folder and trigger email sending
+# - Event mode (default): folder checks run as soon as files land (watchdog),
+#   with a slow reconciliation sweep as a safety net
 
 import os
 import time
+import queue
 import logging
+import threading
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
+from typing import Optional
 from dotenv import load_dotenv
 
 from dashboard_manager import get_dashboard_manager
+from rolling_counters import get_rolling_counters
+from folder_counts import get_folder_counts
+from plan_tracker import get_plan_tracker
+from completion_ledger import get_completion_ledger
+from job_journal import get_job_journal, last_run_time, next_run_time, describe_schedule, WEEKDAYS
+from action_queue import get_action_queue, dispatch_order, read_trigger_manifest
 
 import schedule
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 # Load environment variables
 load_dotenv()
 
@@ -46,12 +65,226 @@ DASHBOARD_PATH = VAULT_PATH / 'Dashboard.md'
 HANDBOOK_PATH = VAULT_PATH / 'Company_Handbook.md'
 SCHEDULER_STATE = LOGS_PATH / 'scheduler_state.json'
 CHECK_INTERVAL = int(os.getenv('SCHEDULER_CHECK_INTERVAL', '120'))  # 2 minutes
+# events = react to file notifications (falls back to poll without watchdog), poll = check every CHECK_INTERVAL
+SCHEDULER_MODE = os.getenv('SCHEDULER_MODE', 'events').lower()
+# Quiet period after the last event in a folder before its check runs
+DEBOUNCE_MS = int(os.getenv('SCHEDULER_DEBOUNCE_MS', '200'))
+# Upper bound on how long a steady stream of events can postpone a check
+DEBOUNCE_MAX_MS = int(os.getenv('SCHEDULER_DEBOUNCE_MAX_MS', '2000'))
+# Full folder sweep in event mode, in case a notification was missed
+RECONCILE_INTERVAL = int(os.getenv('SCHEDULER_RECONCILE_INTERVAL', '900'))  # 15 minutes
+TRIGGER_PREFIX = 'SCHEDULER_TRIGGER_'
+
+# Job executor: worker threads, default timeout (seconds) and missed-run policy
+JOB_WORKERS = int(os.getenv('SCHEDULER_WORKERS', '4'))
+JOB_TIMEOUT = int(os.getenv('SCHEDULER_JOB_TIMEOUT', '300'))
+MISSED_RUN_POLICY = os.getenv('SCHEDULER_MISSED_RUN_POLICY', 'coalesce')  # skip, coalesce, catch-up
+# Per-job (timeout seconds, missed-run policy)
+JOB_SETTINGS = {
+    'check_needs_action': (60, 'coalesce'),
+    'check_approved_folder': (60, 'coalesce'),
+    'check_rejected_folder': (60, 'coalesce'),
+    'auto_archive_completed': (120, 'coalesce'),
+    '_update_dashboard': (60, 'coalesce'),
+    'generate_daily_briefing': (600, 'skip'),
+    'generate_weekly_summary': (900, 'skip'),
+}
+
+# Time-of-day jobs: name -> (weekday 0=Monday..6=Sunday or None for daily, HH:MM)
+TIMED_JOBS = {
+    'generate_daily_briefing': (None, '08:00'),
+    'generate_weekly_summary': (6, '21:00'),
+}
+# Missed timed runs are caught up on startup, up to the most recent N per job (0 = skip them)
+CATCHUP_MAX_RUNS = int(os.getenv('SCHEDULER_CATCHUP_MAX_RUNS', '7'))
+
+
+class FolderEventDispatcher(FileSystemEventHandler):
+    """
+    Debounces watchdog events per folder and queues the folder for checking.
+    
+    Events for the scheduler's own trigger files and for files leaving a
+    folder are ignored, so a check never re-triggers itself.
+    """
+    
+    def __init__(self, folders):
+        self.folders = {Path(folder) for folder in folders}
+        self.ready = queue.Queue()
+        self._lock = threading.Lock()
+        self._timers = {}
+        self._first_event = {}
+    
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in ('created', 'modified', 'moved'):
+            return
+        path = Path(getattr(event, 'dest_path', '') or event.src_path)
+        if path.suffix != '.md' or path.name.startswith(TRIGGER_PREFIX):
+            return
+        if path.parent in self.folders:
+            self._schedule(path.parent)
+    
+    def _schedule(self, folder: Path):
+        """(Re)start the folder's debounce timer."""
+        with self._lock:
+            now = time.monotonic()
+            first = self._first_event.setdefault(folder, now)
+            delay = min(DEBOUNCE_MS / 1000.0, max(0.0, first + DEBOUNCE_MAX_MS / 1000.0 - now))
+            if folder in self._timers:
+                self._timers[folder].cancel()
+            timer = threading.Timer(delay, self._fire, [folder])
+            timer.daemon = True
+            self._timers[folder] = timer
+            timer.start()
+    
+    def _fire(self, folder: Path):
+        with self._lock:
+            self._timers.pop(folder, None)
+            self._first_event.pop(folder, None)
+        self.ready.put(folder)
+
+
+class JobExecutor:
+    """
+    Runs scheduler jobs on a thread pool.
+    
+    - A job never overlaps itself; a trigger that arrives while it is running
+      is handled by the job's missed-run policy:
+        skip      drop the trigger
+        coalesce  run once more after the current run (however many triggers arrived)
+        catch-up  run once per missed trigger
+    - A run longer than the job's timeout is marked abandoned and counted as a
+      timeout. Threads cannot be killed, so the run keeps its worker and its
+      job's overlap guard until it returns; only then do missed runs start, so
+      a hanging job holds at most one worker and never overlaps itself.
+    - Per-job duration/latency metrics are written to the scheduler state.
+    """
+    
+    def __init__(self, on_metrics=None, max_workers: int = None):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers or JOB_WORKERS, thread_name_prefix='scheduler-job')
+        self.on_metrics = on_metrics
+        self._lock = threading.Lock()
+        self._running = {}   # job name -> (start time, abandoned after its timeout)
+        self._missed = {}    # job name -> pending reruns
+        self.metrics = {}
+    
+    def _settings(self, name: str) -> tuple:
+        timeout, policy = JOB_SETTINGS.get(name, (JOB_TIMEOUT, MISSED_RUN_POLICY))
+        return timeout, policy
+    
+    def _job_metrics(self, name: str) -> dict:
+        return self.metrics.setdefault(name, {
+            'runs': 0, 'failures': 0, 'timeouts': 0, 'abandoned_finished': 0, 'skipped': 0, 'coalesced': 0,
+            'last_status': None, 'last_start': None, 'last_duration_ms': None,
+            'avg_duration_ms': None, 'max_duration_ms': 0, 'last_latency_ms': None,
+        })
+    
+    def submit(self, job):
+        """Queue a job (a bound Scheduler method) unless the missed-run policy says otherwise."""
+        name = job.__name__
+        queued_at = time.monotonic()
+        with self._lock:
+            if name in self._running:
+                _, policy = self._settings(name)
+                metrics = self._job_metrics(name)
+                if policy == 'skip':
+                    metrics['skipped'] += 1
+                    logger.debug(f"Job {name} still running - trigger skipped")
+                elif policy == 'catch-up':
+                    self._missed[name] = self._missed.get(name, 0) + 1
+                else:
+                    if self._missed.get(name):
+                        metrics['coalesced'] += 1
+                    self._missed[name] = 1
+                return
+            self._running[name] = (queued_at, False)
+        self.pool.submit(self._run, job, queued_at)
+    
+    def _run(self, job, queued_at: float):
+        name = job.__name__
+        started = time.monotonic()
+        started_at = datetime.now().isoformat()
+        with self._lock:
+            self._running[name] = (started, False)
+        status = 'success'
+        try:
+            job()
+        except Exception as e:
+            status = 'failed'
+            logger.error(f"Job {name} failed: {e}")
+        finished = time.monotonic()
+        
+        with self._lock:
+            metrics = self._job_metrics(name)
+            duration_ms = round((finished - started) * 1000, 1)
+            metrics['max_duration_ms'] = max(metrics['max_duration_ms'], duration_ms)
+            if self._running[name][1]:
+                # Already counted as a timeout; only its late finish is recorded
+                metrics['abandoned_finished'] += 1
+                logger.warning(f"Abandoned run of job {name} finished after {duration_ms / 1000:.0f}s ({status})")
+            else:
+                metrics['runs'] += 1
+                if status == 'failed':
+                    metrics['failures'] += 1
+                metrics['last_status'] = status
+                metrics['last_start'] = started_at
+                metrics['last_duration_ms'] = duration_ms
+                previous_avg = metrics['avg_duration_ms'] or duration_ms
+                metrics['avg_duration_ms'] = round(previous_avg + (duration_ms - previous_avg) / metrics['runs'], 1)
+                metrics['last_latency_ms'] = round((started - queued_at) * 1000, 1)
+            
+            # The worker is free again: release the guard, then start a pending missed run
+            del self._running[name]
+            rerun = self._missed.get(name, 0) > 0
+            if rerun:
+                self._missed[name] -= 1
+                self._running[name] = (time.monotonic(), False)
+            snapshot = {job_name: dict(values) for job_name, values in self.metrics.items()}
+        
+        if self.on_metrics:
+            self.on_metrics(snapshot)
+        if rerun:
+            self.pool.submit(self._run, job, time.monotonic())
+    
+    def check_timeouts(self):
+        """Mark runs that have exceeded their job's timeout as abandoned (call periodically)."""
+        now = time.monotonic()
+        overdue = []
+        with self._lock:
+            for name, (started, abandoned) in self._running.items():
+                timeout, _ = self._settings(name)
+                if not abandoned and timeout > 0 and now - started > timeout:
+                    self._running[name] = (started, True)
+                    metrics = self._job_metrics(name)
+                    metrics['timeouts'] += 1
+                    metrics['last_status'] = 'abandoned'
+                    overdue.append((name, now - started))
+            snapshot = {job_name: dict(values) for job_name, values in self.metrics.items()}
+        for name, elapsed in overdue:
+            logger.error(f"Job {name} exceeded its timeout ({elapsed:.0f}s) - run abandoned, "
+                         f"further triggers wait until its worker is free")
+        if overdue and self.on_metrics:
+            self.on_metrics(snapshot)
+        return [name for name, _ in overdue]
+    
+    def shutdown(self):
+        """Stop accepting jobs; running jobs finish in the background."""
+        self.pool.shutdown(wait=False)
+
 
 class Scheduler:
     def __init__(self):
         self.dashboard = get_dashboard_manager()
+        self.counters = get_rolling_counters()
         self._initialize()
+        self.folders = get_folder_counts(VAULT_PATH)
+        self.plans = get_plan_tracker()
+        self.ledger = get_completion_ledger()
+        self.journal = get_job_journal()
+        # Done items the ledger already has, so startup doesn't look each one up
+        self._done_seen = self.ledger.recorded_names('Done')
+        self._state_lock = threading.Lock()
         self._load_state()
+        self.executor = JobExecutor(on_metrics=self._save_job_metrics)
     
     def _initialize(self):
         """Initialize scheduler paths."""
@@ -71,12 +304,19 @@ class Scheduler:
     
     def _save_state(self):
         """Save scheduler state."""
-        SCHEDULER_STATE.write_text(json.dumps(self.state, indent=2), encoding='utf-8')
+        with self._state_lock:
+            SCHEDULER_STATE.write_text(json.dumps(self.state, indent=2), encoding='utf-8')
+    
+    def _save_job_metrics(self, metrics: dict):
+        """Persist per-job duration/latency metrics from the executor."""
+        self.state['jobs'] = metrics
+        self._save_state()
     
     def check_needs_action(self):
-        """Check /Needs_Action/ folder and create trigger file for AI processing."""
+        """Move new items from /Needs_Action/ to /In_Progress/ (highest priority first) and coalesce them into one trigger."""
         try:
-            pending_files = list(NEEDS_ACTION.glob('*.md'))
+            # The trigger lives in Needs_Action too; it is not an item
+            pending_files = dispatch_order(NEEDS_ACTION, exclude_prefix=TRIGGER_PREFIX)
 
             if not pending_files:
                 logger.debug("No pending actions")
@@ -85,38 +325,81 @@ class Scheduler:
             logger.info(f"Found {len(pending_files)} pending action(s)")
 
             # Move files to In_Progress
+            moved = []
             for filepath in pending_files:
                 in_progress_path = IN_PROGRESS / filepath.name
                 if not in_progress_path.exists():
                     filepath.rename(in_progress_path)
+                    moved.append(in_progress_path)
                     logger.info(f"Moved to In_Progress: {filepath.name}")
+                else:
+                    logger.warning(f"Already in In_Progress, left in Needs_Action: {filepath.name}")
 
-            # Create trigger file for AI processing
-            self._create_scheduler_trigger(len(pending_files))
+            # Only real arrivals warrant (re)triggering the AI
+            if moved:
+                self._create_scheduler_trigger(moved)
 
         except Exception as e:
             logger.error(f"Error checking needs action: {e}")
 
-    def _create_scheduler_trigger(self, pending_count: int):
-        """Create a trigger file in /Needs_Action/ for AI processing."""
+    def _needs_action_count(self) -> int:
+        """Items in /Needs_Action/, not counting the scheduler's trigger file."""
+        return sum(1 for name in self.folders.names('Needs_Action') if not name.startswith(TRIGGER_PREFIX))
+
+    def _read_trigger_manifest(self, trigger_path: Path) -> list:
+        """Item paths (relative to the vault) listed in a trigger file."""
+        try:
+            return read_trigger_manifest(trigger_path)
+        except Exception as e:
+            logger.warning(f"Could not read trigger manifest {trigger_path.name}: {e}")
+            return []
+
+    def _create_scheduler_trigger(self, new_items: list):
+        """
+        Create or extend the single outstanding trigger file in /Needs_Action/.
+        
+        If a trigger is still waiting for the AI, the new items are merged into
+        its manifest instead of writing another trigger.
+        """
         try:
             current_time = datetime.now()
-            timestamp = current_time.strftime('%Y-%m-%d-%H-%M')
-            trigger_filename = f"SCHEDULER_TRIGGER_{timestamp}.md"
-            trigger_path = NEEDS_ACTION / trigger_filename
+            outstanding = sorted(NEEDS_ACTION.glob(f'{TRIGGER_PREFIX}*.md'))
+
+            manifest = []
+            for trigger in outstanding:
+                manifest.extend(self._read_trigger_manifest(trigger))
+            for item in new_items:
+                manifest.append(item.relative_to(VAULT_PATH).as_posix())
+            # Drop duplicates and items already finished; list the rest in dispatch order
+            queued = get_action_queue().order(VAULT_PATH / item for item in dict.fromkeys(manifest))
+            manifest = [path.relative_to(VAULT_PATH).as_posix() for path in queued]
+
+            if outstanding:
+                trigger_path = outstanding[0]
+                for extra in outstanding[1:]:
+                    extra.unlink()
+            else:
+                trigger_path = NEEDS_ACTION / f"{TRIGGER_PREFIX}{current_time.strftime('%Y-%m-%d-%H-%M')}.md"
 
+            item_lines = '\n'.join(f"- [ ] {item}" for item in manifest)
             content = f"""---
 type: scheduler_trigger
 time: {current_time.isoformat()}
-pending_files: {pending_count}
+pending_files: {len(manifest)}
 ---
-Scheduler detected {pending_count} pending files.
-Please process all files in /Needs_Action folder.
+Scheduler detected {len(manifest)} pending files.
+Please process the files listed below (moved to /In_Progress), in the order given - most urgent first.
+
+## Items
+{item_lines}
 """
 
             trigger_path.write_text(content, encoding='utf-8')
-            logger.info(f"Trigger file created: {trigger_filename}")
-            print("Trigger file created for AI processing")
+            if outstanding:
+                logger.info(f"Trigger file updated: {trigger_path.name} ({len(manifest)} item(s))")
+            else:
+                logger.info(f"Trigger file created: {trigger_path.name}")
+                print("Trigger file created for AI processing")
 
         except Exception as e:
             logger.error(f"Error creating scheduler trigger: {e}")
@@ -162,22 +445,26 @@ Please process all files in /Needs_Action folder.
         except Exception as e:
             logger.error(f"Error checking rejected folder: {e}")
     
-    def generate_daily_briefing(self):
-        """Generate daily briefing at 8:00 AM."""
+    def generate_daily_briefing(self, day: Optional[date] = None) -> bool:
+        """Generate daily briefing at 8:00 AM (or a missed one for an earlier day)."""
         try:
-            logger.info("Generating daily briefing...")
-            
-            # Count tasks
-            pending_count = len(list(NEEDS_ACTION.glob('*.md')))
-            in_progress_count = len(list(IN_PROGRESS.glob('*.md')))
-            plans_count = len(list(PLANS_PATH.glob('*.md')))
-            done_today = self._count_done_today()
+            today = datetime.combine(day, datetime.min.time()) if day else datetime.now()
+            # A missed day caught up later: completions and emails are read for that day,
+            # but folder snapshots can only be taken now
+            late = today.date() < date.today()
+            logger.info(f"Generating daily briefing for {today.strftime('%Y-%m-%d')}{' (late)' if late else ''}...")
+            
+            # Count tasks (the scheduler's own trigger file is not a task)
+            pending_files = dispatch_order(NEEDS_ACTION, exclude_prefix=TRIGGER_PREFIX)
+            pending_count = len(pending_files)
+            in_progress_count = self.folders.count('In_Progress')
+            plans_count = self.folders.count('Plans')
+            done_today = self.ledger.completed_on(today.date())
             
             # Count emails sent today
-            emails_sent_today = self._count_emails_sent_today()
+            emails_sent_today = self._count_emails_sent_on(today.date())
             
             # Create briefing file
-            today = datetime.now()
             briefing_filename = f"Daily_Briefing_{today.strftime('%Y-%m-%d')}.md"
             briefing_path = BRIEFINGS_PATH / briefing_filename
             
@@ -185,13 +472,14 @@ Please process all files in /Needs_Action folder.
 type: daily_briefing
 date: {today.strftime('%Y-%m-%d')}
 generated: {datetime.now().isoformat()}
+late: {'true' if late else 'false'}
 ---
 
 # Daily Briefing - {today.strftime('%A, %B %d, %Y')}
 
 ## Executive Summary
 
-Good morning! Here's your business overview for today.
+{self._late_briefing_note() if late else "Good morning! Here's your business overview for today."}
 
 ## Task Overview
 
@@ -209,8 +497,7 @@ Good morning! Here's your business overview for today.
 ## Priorities for Today
 
 """
-            # Add priorities based on pending files
-            pending_files = list(NEEDS_ACTION.glob('*.md'))
+            # Add priorities based on pending files (most urgent first)
             if pending_files:
                 briefing_content += "### Pending Items Requiring Attention\n\n"
                 for f in pending_files[:5]:  # Top 5
@@ -224,11 +511,11 @@ Good morning! Here's your business overview for today.
 
 """
             # Add recent done items
-            done_files = sorted(DONE_PATH.glob('*.md'), key=lambda x: x.stat().st_mtime, reverse=True)[:5]
-            if done_files:
-                for f in done_files:
-                    mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                    briefing_content += f"- [x] {f.stem} - Completed {mtime.strftime('%Y-%m-%d %H:%M')}\n"
+            done_items = self.ledger.recent(5, until=today.date())
+            if done_items:
+                for item in done_items:
+                    completed = item['completed_at'][:16].replace('T', ' ')
+                    briefing_content += f"- [x] {item['name']} - Completed {completed}\n"
             else:
                 briefing_content += "_No recent completions._\n"
             
@@ -246,28 +533,32 @@ _Add any additional notes or context here_
             logger.info(f"Daily briefing created: {briefing_filename}")
             
             # Update dashboard
-            self._update_dashboard(briefing_generated=True)
+            self._update_dashboard(briefing_generated=True, briefing_date=today.strftime('%Y-%m-%d'))
+            return True
             
         except Exception as e:
             logger.error(f"Error generating daily briefing: {e}")
+            return False
     
-    def generate_weekly_summary(self):
-        """Generate weekly summary every Sunday at 9:00 PM."""
+    def _late_briefing_note(self) -> str:
+        """Executive summary line for a briefing caught up after its day."""
+        return (f"_Generated late, on {datetime.now().strftime('%Y-%m-%d %H:%M')}, with current data: "
+                f"completions and emails sent are for the briefing's day; Pending Actions, In Progress, "
+                f"Plans Created and the pending items are as of generation._")
+    
+    def generate_weekly_summary(self, week_end: Optional[date] = None) -> bool:
+        """Generate weekly summary every Sunday at 9:00 PM (or a missed one for an earlier week)."""
         try:
             logger.info("Generating weekly summary...")
             
-            today = datetime.now()
+            today = datetime.combine(week_end, datetime.min.time()) if week_end else datetime.now()
             week_start = today - timedelta(days=today.weekday())
             
             # Count tasks completed this week
-            done_this_week = 0
-            for f in DONE_PATH.glob('*.md'):
-                mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                if mtime >= week_start:
-                    done_this_week += 1
+            done_this_week = self.ledger.count_range(week_start, today)
             
             # Count emails sent this week
-            emails_this_week = self._count_emails_this_week()
+            emails_this_week = self._count_emails_between(week_start, today)
             
             # Create summary file
             summary_filename = f"Weekly_Summary_{week_start.strftime('%Y-%m-%d')}_to_{today.strftime('%Y-%m-%d')}.md"
@@ -294,18 +585,16 @@ This week's performance summary.
 |--------|-------|
 | Tasks Completed | {done_this_week} |
 | Emails Sent | {emails_this_week} |
-| Plans Created | {len(list(PLANS_PATH.glob('*.md')))} |
+| Plans Created | {self.folders.count('Plans')} |
 
 ## Completed Tasks This Week
 
 """
             # List completed tasks
-            done_files = sorted(DONE_PATH.glob('*.md'), key=lambda x: x.stat().st_mtime, reverse=True)
-            if done_files:
-                for f in done_files[:20]:  # Top 20
-                    mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                    if mtime >= week_start:
-                        summary_content += f"- [x] {f.stem}\n"
+            done_items = self.ledger.list_range(week_start, today, limit=20)  # Top 20
+            if done_items:
+                for item in done_items:
+                    summary_content += f"- [x] {item['name']}\n"
             else:
                 summary_content += "_No tasks completed this week._\n"
             
@@ -324,38 +613,47 @@ _Add your focus and priorities for next week_
             
             # Update dashboard
             self._update_dashboard(weekly_summary_generated=True)
+            return True
             
         except Exception as e:
             logger.error(f"Error generating weekly summary: {e}")
+            return False
     
     def auto_archive_completed(self):
         """Auto-move completed tasks to /Done/ folder."""
         try:
-            # Check In_Progress for files with completed plans
-            in_progress_files = list(IN_PROGRESS.glob('*.md'))
+            # Check In_Progress for files with completed plans (plans are only
+            # re-read when they changed since the last pass)
+            progress = {}
+            plan_paths = []
             
-            for filepath in in_progress_files:
+            for filepath in IN_PROGRESS.glob('*.md'):
                 # Check if corresponding plan exists and is complete
                 plan_name = f"{filepath.stem}.plan.md"
                 plan_path = PLANS_PATH / plan_name
+                plan = self.plans.get(plan_path)
+                if plan is None:
+                    continue
                 
-                if plan_path.exists():
-                    plan_content = plan_path.read_text(encoding='utf-8')
+                if self.plans.is_complete(plan):
+                    # All tasks complete - move to Done
+                    done_path = DONE_PATH / filepath.name
+                    filepath.rename(done_path)
+                    self.ledger.record(done_path, 'scheduler')
                     
-                    # Check if all checkboxes are marked
-                    unchecked = plan_content.count('[ ]')
-                    checked = plan_content.count('[x]')
+                    # Also move the plan
+                    plan_done_path = DONE_PATH / plan_name
+                    plan_path.rename(plan_done_path)
+                    self.plans.forget(plan_path)
                     
-                    if unchecked == 0 and checked > 0:
-                        # All tasks complete - move to Done
-                        done_path = DONE_PATH / filepath.name
-                        filepath.rename(done_path)
-                        
-                        # Also move the plan
-                        plan_done_path = DONE_PATH / plan_name
-                        plan_path.rename(plan_done_path)
-                        
-                        logger.info(f"Auto-archived: {filepath.name}")
+                    logger.info(f"Auto-archived: {filepath.name}")
+                else:
+                    progress[filepath.stem] = plan
+                    plan_paths.append(plan_path)
+            
+            self.plans.retain(plan_paths)
+            if progress != self.dashboard.state.get('plan_progress'):
+                self.dashboard.state['plan_progress'] = progress
             
             # Update dashboard
             self._update_dashboard()
@@ -363,89 +661,73 @@ _Add your focus and priorities for next week_
         except Exception as e:
             logger.error(f"Error auto-archiving: {e}")
     
-    def _count_done_today(self) -> int:
-        """Count files moved to Done today."""
-        today = datetime.now().date()
-        count = 0
-        for f in DONE_PATH.glob('*.md'):
-            mtime = datetime.fromtimestamp(f.stat().st_mtime).date()
-            if mtime == today:
-                count += 1
-        return count
-    
-    def _count_emails_sent_today(self) -> int:
-        """Count emails sent today."""
-        sent_log = LOGS_PATH / 'sent_emails.json'
-        if not sent_log.exists():
-            return 0
-        
+    def sync_completion_ledger(self):
+        """Record items that reached Done without going through a service (e.g. moved by hand)."""
         try:
-            data = json.loads(sent_log.read_text(encoding='utf-8'))
-            today = datetime.now().strftime('%Y-%m-%d')
-            return len([e for e in data.get('sent_emails', []) if today in e.get('sent_at', '')])
-        except:
-            return 0
-    
-    def _count_emails_this_week(self) -> int:
-        """Count emails sent this week."""
-        sent_log = LOGS_PATH / 'sent_emails.json'
-        if not sent_log.exists():
-            return 0
-        
-        try:
-            data = json.loads(sent_log.read_text(encoding='utf-8'))
-            today = datetime.now()
-            week_start = today - timedelta(days=today.weekday())
-            
-            count = 0
-            for email in data.get('sent_emails', []):
-                sent_at = email.get('sent_at', '')
-                if sent_at:
-                    email_date = datetime.fromisoformat(sent_at).date()
-                    if email_date >= week_start.date():
-                        count += 1
-            return count
-        except:
-            return 0
+            names = self.folders.names('Done')
+            new_items = [DONE_PATH / name for name in names - self._done_seen
+                         if not name.endswith('.plan.md')]
+            self._done_seen = names
+            added = self.ledger.record_missing(new_items, 'vault')
+            if added:
+                logger.info(f"Completion ledger: recorded {added} item(s) found in Done")
+                self._update_dashboard()
+        except Exception as e:
+            logger.error(f"Error syncing completion ledger: {e}")
+    
+    def _count_done_today(self) -> int:
+        """Count items completed today."""
+        return self.ledger.completed_today()
+    
+    def _count_emails_sent_on(self, day: date) -> int:
+        """Count emails sent on a given day."""
+        return self.counters.count_range('emails_sent', day, day)
+    
+    def _count_emails_between(self, start: datetime, end: datetime) -> int:
+        """Count emails sent between two dates (inclusive)."""
+        return self.counters.count_range('emails_sent', start, end)
     
     def _update_dashboard(self, rejected_count: int = 0,
                           briefing_generated: bool = False,
-                          weekly_summary_generated: bool = False):
+                          weekly_summary_generated: bool = False,
+                          briefing_date: Optional[str] = None):
         """Update the Dashboard.md with current status."""
         try:
             now = datetime.now().strftime('%Y-%m-%d %H:%M')
             today = datetime.now().strftime('%Y-%m-%d')
             
             # Count various items
-            pending_count = len(list(NEEDS_ACTION.glob('*.md'))) + len(list(IN_PROGRESS.glob('*.md')))
-            plans_count = len(list(PLANS_PATH.glob('*.md')))
-            pending_approvals = len(list(APPROVED_PATH.glob('*.md')))
+            pending_count = self._needs_action_count() + self.folders.count('In_Progress')
+            plans_count = self.folders.count('Plans')
+            pending_approvals = self.folders.count('Approved')
             done_today = self._count_done_today()
-            emails_today = self._count_emails_sent_today()
             
-            # Count LinkedIn posts this week
-            linkedin_posts = self._count_linkedin_posts_this_week()
+            # Count tasks completed in the last 7 days
+            today_date = datetime.now().date()
+            done_week = self.ledger.count_range(today_date - timedelta(days=6), today_date)
             
-            # Update dashboard manager state
-            self.dashboard.state['pending_actions'] = pending_count
-            self.dashboard.state['tasks_completed_today'] = done_today
-            self.dashboard.state['tasks_completed_week'] = linkedin_posts
-            self.dashboard.state['emails_sent_today'] = emails_today
-            
-            if briefing_generated:
-                self.dashboard.state['last_briefing_date'] = today
-            
-            # Log activity
-            if briefing_generated:
-                self.dashboard.log_activity("Daily Briefing Generated", "Success")
-            elif weekly_summary_generated:
-                self.dashboard.log_activity("Weekly Summary Generated", "Success")
-            
-            # Add alerts if needed
-            if rejected_count > 0:
-                self.dashboard.add_alert(f"{rejected_count} item(s) rejected", "warning")
-            
-            self.dashboard.refresh()
+            # Update dashboard manager state (one coalesced render for the whole pass)
+            with self.dashboard.batch():
+                self.dashboard.state['pending_actions'] = pending_count
+                self.dashboard.state['tasks_completed_today'] = done_today
+                self.dashboard.state['tasks_completed_week'] = done_week
+                self.dashboard.state['tasks_completed_total'] = self.ledger.count()
+                
+                if briefing_generated:
+                    # The day the briefing covers (a caught-up briefing is for an earlier day)
+                    self.dashboard.state['last_briefing_date'] = briefing_date or today
+                
+                # Log activity
+                if briefing_generated:
+                    self.dashboard.log_activity("Daily Briefing Generated", "Success")
+                elif weekly_summary_generated:
+                    self.dashboard.log_activity("Weekly Summary Generated", "Success")
+                
+                # Add alerts if needed
+                if rejected_count > 0:
+                    self.dashboard.add_alert(f"{rejected_count} item(s) rejected", "warning")
+                
+                self.dashboard.refresh()
             logger.info("Dashboard updated")
 
         except Exception as e:
@@ -456,10 +738,9 @@ _Add your focus and priorities for next week_
         activity = []
         
         # Recent done items
-        done_files = sorted(DONE_PATH.glob('*.md'), key=lambda x: x.stat().st_mtime, reverse=True)[:3]
-        for f in done_files:
-            mtime = datetime.fromtimestamp(f.stat().st_mtime).strftime('%Y-%m-%d %H:%M')
-            activity.append(f"- **{mtime}:** {f.stem} → Completed")
+        for item in self.ledger.recent(3):
+            completed = item['completed_at'][:16].replace('T', ' ')
+            activity.append(f"- **{completed}:** {item['name']} → Completed")
         
         # Recent plans
         plan_files = sorted(PLANS_PATH.glob('*.md'), key=lambda x: x.stat().st_mtime, reverse=True)[:2]
@@ -471,58 +752,164 @@ _Add your focus and priorities for next week_
             return '\n'.join(activity)
         return ""
     
-    def _count_linkedin_posts_this_week(self) -> int:
-        """Count LinkedIn posts this week."""
-        linkedin_log = LOGS_PATH / 'linkedin_posts.json'
-        if not linkedin_log.exists():
-            return 0
+    def _folder_checks(self):
+        """Folder checks to run when a watched folder changes."""
+        return {
+            NEEDS_ACTION: [self.check_needs_action],
+            APPROVED_PATH: [self.check_approved_folder],
+            REJECTED_PATH: [self.check_rejected_folder],
+            IN_PROGRESS: [self.auto_archive_completed],
+            PLANS_PATH: [self.auto_archive_completed],
+            DONE_PATH: [self.sync_completion_ledger],
+        }
+    
+    def run_all_checks(self):
+        """Queue every folder check (reconciliation sweep)."""
+        for check in (self.check_needs_action, self.check_approved_folder,
+                      self.check_rejected_folder, self.auto_archive_completed,
+                      self.sync_completion_ledger):
+            self.executor.submit(check)
+    
+    def _timed_job(self, name: str):
+        """Executor job that runs a timed job for every period it is due (named after the job)."""
+        def run():
+            self.run_due_periods(name)
+        run.__name__ = name
+        return run
+    
+    def run_due_periods(self, name: str):
+        """
+        Run a timed job once per period since its last completed one, oldest first.
         
-        try:
-            data = json.loads(linkedin_log.read_text(encoding='utf-8'))
-            today = datetime.now()
-            week_start = today - timedelta(days=today.weekday())
-            
-            count = 0
-            for post in data.get('posts', []):
-                posted_at = post.get('posted_at', '')
-                if posted_at:
-                    post_date = datetime.fromisoformat(posted_at).date()
-                    if post_date >= week_start.date():
-                        count += 1
-            return count
-        except:
-            return 0
+        Each successful run is journaled, so a restart resumes where this left off;
+        a failed run stops the sequence and is retried on the next trigger.
+        """
+        spec = TIMED_JOBS[name]
+        job = getattr(self, name)
+        periods = self.journal.due_periods(name, spec, datetime.now(), max(CATCHUP_MAX_RUNS, 1))
+        for period in periods:
+            started = time.monotonic()
+            success = job(period.date())
+            self.journal.record(name, period, success, round((time.monotonic() - started) * 1000, 1))
+            if not success:
+                break
+        self._publish_schedule()
+    
+    def catch_up_missed_runs(self):
+        """Queue timed jobs whose scheduled time passed while the scheduler was down."""
+        now = datetime.now()
+        for name, spec in TIMED_JOBS.items():
+            latest = last_run_time(spec, now)
+            if self.journal.start_from(name, latest):
+                continue  # no history yet - nothing counts as missed
+            if CATCHUP_MAX_RUNS <= 0:
+                self.journal.skip_to(name, latest)
+                continue
+            missed = self.journal.due_periods(name, spec, now, CATCHUP_MAX_RUNS)
+            if missed:
+                logger.info(f"Catching up {name}: {len(missed)} missed run(s) from {missed[0]:%Y-%m-%d %H:%M}")
+                self.executor.submit(self._timed_job(name))
+        self._publish_schedule()
+    
+    def _publish_schedule(self):
+        """Expose timed jobs' last completed and next run times to the dashboard."""
+        now = datetime.now()
+        jobs = {}
+        for name, spec in TIMED_JOBS.items():
+            entry = self.journal.get(name) or {}
+            jobs[name] = {
+                'schedule': describe_schedule(spec),
+                'last_run': entry.get('last_success'),
+                'last_duration_ms': entry.get('last_duration_ms'),
+                'next_run': next_run_time(spec, now).isoformat(),
+            }
+        if jobs != self.dashboard.state.get('scheduled_jobs'):
+            self.dashboard.state['scheduled_jobs'] = jobs
     
     def run_scheduled_jobs(self):
         """Run the schedule loop."""
         logger.info("Scheduler started")
         
-        # Schedule jobs
-        schedule.every(2).minutes.do(self.check_needs_action)
-        schedule.every(2).minutes.do(self.check_approved_folder)
-        schedule.every(2).minutes.do(self.check_rejected_folder)
-        schedule.every(2).minutes.do(self.auto_archive_completed)
-        schedule.every().day.at("08:00").do(self.generate_daily_briefing)
-        schedule.every().sunday.at("21:00").do(self.generate_weekly_summary)
+        event_mode = SCHEDULER_MODE == 'events' and Observer is not None
+        if SCHEDULER_MODE == 'events' and Observer is None:
+            logger.warning("watchdog not installed - falling back to polling")
+        
+        # Schedule jobs (the schedule loop only queues them; the executor runs them)
+        submit = self.executor.submit
+        if event_mode:
+            schedule.every(RECONCILE_INTERVAL).seconds.do(self.run_all_checks)
+        else:
+            schedule.every(CHECK_INTERVAL).seconds.do(submit, self.check_needs_action)
+            schedule.every(CHECK_INTERVAL).seconds.do(submit, self.check_approved_folder)
+            schedule.every(CHECK_INTERVAL).seconds.do(submit, self.check_rejected_folder)
+            schedule.every(CHECK_INTERVAL).seconds.do(submit, self.auto_archive_completed)
+        for name, (weekday, at) in TIMED_JOBS.items():
+            every = getattr(schedule.every(), WEEKDAYS[weekday]) if weekday is not None else schedule.every().day
+            every.at(at).do(submit, self._timed_job(name))
         
         logger.info("Scheduled jobs:")
-        logger.info("  - Check folders: Every 2 minutes")
+        if event_mode:
+            logger.info(f"  - Check folders: On file events (debounce {DEBOUNCE_MS} ms), full sweep every {RECONCILE_INTERVAL}s")
+        else:
+            logger.info(f"  - Check folders: Every {CHECK_INTERVAL}s")
         logger.info("  - Daily briefing: 8:00 AM")
         logger.info("  - Weekly summary: Sunday 9:00 PM")
         
+        self.catch_up_missed_runs()
+        
+        try:
+            if event_mode:
+                self._run_event_loop()
+            else:
+                self._run_poll_loop()
+        finally:
+            self.executor.shutdown()
+    
+    def _run_poll_loop(self):
+        """Interval-driven loop."""
         # Initial run
-        self.check_needs_action()
-        self.check_approved_folder()
-        self.check_rejected_folder()
-        self._update_dashboard()
+        self.run_all_checks()
+        self.executor.submit(self._update_dashboard)
         
         # Run schedule loop
         while True:
             try:
                 schedule.run_pending()
+                self.executor.check_timeouts()
                 time.sleep(1)
             except Exception as e:
                 logger.error(f"Error in schedule loop: {e}")
+    
+    def _run_event_loop(self):
+        """Event-driven loop: folder checks are queued on the executor as events arrive."""
+        checks = self._folder_checks()
+        dispatcher = FolderEventDispatcher(checks.keys())
+        observer = Observer()
+        for folder in checks:
+            observer.schedule(dispatcher, str(folder), recursive=False)
+        observer.start()
+        
+        # Initial sweep picks up anything that arrived while stopped
+        self.run_all_checks()
+        self.executor.submit(self._update_dashboard)
+        
+        try:
+            while True:
+                try:
+                    schedule.run_pending()
+                    self.executor.check_timeouts()
+                    try:
+                        folder = dispatcher.ready.get(timeout=1)
+                    except queue.Empty:
+                        continue
+                    logger.info(f"Change detected in {folder.name}")
+                    for check in checks[folder]:
+                        self.executor.submit(check)
+                except Exception as e:
+                    logger.error(f"Error in schedule loop: {e}")
+        finally:
+            observer.stop()
+            observer.join()
 
 
 def main():
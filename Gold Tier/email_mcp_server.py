@@ -16,6 +16,8 @@ from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
 
 from dashboard_manager import get_dashboard_manager
+from completion_ledger import record_completion
+from rolling_counters import register_legacy_log
 
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -53,6 +55,15 @@ SCOPES = [
     'https://www.googleapis.com/auth/gmail.modify'
 ]
 
+def is_reply_subject(subject: str) -> bool:
+    """Whether a sent email's subject marks it as a reply (counted as email_replies_sent)."""
+    subject = (subject or '').lower()
+    return 'reply' in subject or 're:' in subject
+
+# Reply counts before the rolling counters existed come from the sent log
+register_legacy_log('email_replies_sent', SENT_LOG, 'sent_emails', 'sent_at',
+                    lambda record: is_reply_subject(record.get('subject', '')))
+
 class EmailMCPServer:
     def __init__(self):
         self.service = None
@@ -91,6 +102,12 @@ class EmailMCPServer:
         }
         SENT_LOG.write_text(json.dumps(data, indent=2), encoding='utf-8')
     
+    def _record_sent_metrics(self, email_data: dict):
+        """Record a sent email (and whether it was a reply) in the rolling counters."""
+        self.dashboard.record_event('emails_sent')
+        if is_reply_subject(email_data.get('subject', '')):
+            self.dashboard.record_event('email_replies_sent')
+    
     def _authenticate(self):
         """Authenticate with Gmail API for sending."""
         try:
@@ -209,6 +226,7 @@ class EmailMCPServer:
                 'status': 'dry_run'
             }
             self._save_sent_email(email_record)
+            self._record_sent_metrics(email_data)
 
             # Move file to Done folder
             done_path = VAULT_PATH / 'Done' / email_data['filename']
@@ -216,6 +234,7 @@ class EmailMCPServer:
             filepath = APPROVED_PATH / email_data['filename']
             if filepath.exists():
                 filepath.rename(done_path)
+                record_completion(done_path, 'email_mcp')
 
             self._update_dashboard('sent_dry_run')
             return True
@@ -241,6 +260,7 @@ class EmailMCPServer:
                 'status': 'sent'
             }
             self._save_sent_email(email_record)
+            self._record_sent_metrics(email_data)
 
             # Move file to Done folder
             done_path = VAULT_PATH / 'Done' / email_data['filename']
@@ -248,6 +268,7 @@ class EmailMCPServer:
             filepath = APPROVED_PATH / email_data['filename']
             if filepath.exists():
                 filepath.rename(done_path)
+                record_completion(done_path, 'email_mcp')
 
             self._update_dashboard('sent')
             return True
@@ -401,16 +422,9 @@ status: failed
     def _update_dashboard(self, action: str = None):
         """Update the Dashboard.md with email status."""
         try:
-            now = datetime.now().strftime('%Y-%m-%d %H:%M')
-            
-            # Count emails sent today
-            today = datetime.now().strftime('%Y-%m-%d')
-            emails_today = len([e for e in self.sent_emails if today in e.get('sent_at', '')])
-            
+            # Sent counts come from the rolling counters (recorded in send_email)
             self.dashboard.update_service('email_mcp', {
-                'email_mcp_status': 'Running',
-                'emails_sent_today': emails_today,
-                'emails_sent_total': len(self.sent_emails)
+                'email_mcp_status': 'Running'
             })
             logger.info("Dashboard updated")
 
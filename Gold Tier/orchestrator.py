@@ -1,26 +1,71 @@
 # orchestrator.py
 # Triggers Qwen Code to process the Needs_Action folder
+# (or another AI backend: an in-process callable or an offline stub, see llm_backend.py)
+# - pool mode (default): one `qwen -p` run per action file, several at a time,
+#   each with its own timeout; results and exit codes are collected into a summary
+# - batch mode: a single `qwen -p` run told to process the whole folder
+# - pool mode reuses cached plans for repeat items (see plan_cache.py)
+# - items are dispatched most urgent first (see AI_Employee_Vault/action_queue.py)
+# - pool mode also picks up the items the scheduler has moved to In_Progress,
+#   via the trigger file it leaves in Needs_Action, and checks them off there
+# - small items of the same type are packed into one prompt (up to a character
+#   budget) so they share one agent startup; results are unpacked per item
 
 import subprocess
+import argparse
+import json
+import time
+import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 
+from plan_cache import PlanCache, CACHE_ENABLED, find_plan, has_new_approval
+from llm_backend import LLMBackend, LLM_BACKEND, BACKENDS, get_backend
+
 VAULT_PATH = Path("./AI_Employee_Vault")
+# The dispatch queue is shared with the vault services
+sys.path.append(str(VAULT_PATH))
+from action_queue import dispatch_order, get_action_queue, read_trigger_manifest, CONTROL_TYPES
 NEEDS_ACTION = VAULT_PATH / "Needs_Action"
+PLANS_PATH = VAULT_PATH / "Plans"
+PENDING_APPROVAL = VAULT_PATH / "Pending_Approval"
+LOGS_PATH = VAULT_PATH / "Logs"
+RUN_SUMMARY = LOGS_PATH / "orchestrator_last_run.json"
+
+ORCHESTRATOR_MODE = os.getenv("ORCHESTRATOR_MODE", "pool")  # pool, batch
+# Concurrent qwen processes in pool mode
+WORKERS = int(os.getenv("ORCHESTRATOR_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Seconds a single run (one item, or one pack of small items) may take before its qwen process is killed
+ITEM_TIMEOUT = int(os.getenv("ORCHESTRATOR_ITEM_TIMEOUT", "600"))
+# Characters of each run's output kept in the summary
+OUTPUT_TAIL = 2000
+# Prompt packing: items up to PACK_ITEM_CHARS are grouped with others of the same
+# type into one run of at most PACK_CHARS item characters (~4 per token) and
+# PACK_MAX_ITEMS items. Bigger packs mean fewer agent startups (throughput) but
+# every item in a pack waits for the whole run (latency). PACK_CHARS=0 disables packing.
+PACK_CHARS = int(os.getenv("ORCHESTRATOR_PACK_CHARS", "6000"))
+PACK_MAX_ITEMS = int(os.getenv("ORCHESTRATOR_PACK_MAX_ITEMS", "8"))
+PACK_ITEM_CHARS = int(os.getenv("ORCHESTRATOR_PACK_ITEM_CHARS", "1500"))
 
-def trigger_qwen():
+def trigger_qwen(backend: LLMBackend = None):
     """Trigger Qwen Code to process pending action files."""
-    pending_files = list(NEEDS_ACTION.glob("*.md"))
+    pending_files = dispatch_order(NEEDS_ACTION)
     
     if not pending_files:
         print("No pending actions.")
         return
     
     print(f"Found {len(pending_files)} pending action(s). Triggering Qwen Code...")
+    order = "\n".join(f"- {action_file.name}" for action_file in pending_files)
     
     prompt = f"""You are a Personal AI Employee. 
     
-Read all files in the /Needs_Action folder of the AI_Employee_Vault.
+Read all files in the /Needs_Action folder of the AI_Employee_Vault,
+in this order (most urgent first):
+{order}
+
 For each file:
 1. Create a Plan.md in /Plans with step-by-step checkboxes
 2. If any action requires sending emails or payments, create an approval file in /Pending_Approval
@@ -30,8 +75,303 @@ For each file:
 Start processing now."""
     
     # Run Qwen Code with the prompt
-    os.chdir(VAULT_PATH)
-    subprocess.run(["qwen", "-p", prompt], check=True)
+    backend = backend or get_backend()
+    backend.run(prompt, cwd=VAULT_PATH, capture=False).check_returncode()
+
+def vault_location(action_file: Path) -> str:
+    """Where an action file is in the vault, e.g. In_Progress/EMAIL_1.md."""
+    return f"{action_file.parent.name}/{action_file.name}"
+
+def pending_work() -> tuple:
+    """
+    Action files to process, most urgent first, and the scheduler triggers they came from.
+
+    The scheduler moves new items to /In_Progress and leaves a trigger file in
+    /Needs_Action listing them; those items are expanded from its manifest.
+    Returns (action files, {trigger path: listed item paths}).
+    """
+    queue = get_action_queue()
+    items, triggers = [], {}
+    for path in dispatch_order(NEEDS_ACTION):
+        item = queue.item(path)
+        if item and item["type"] in CONTROL_TYPES:
+            try:
+                listed = [VAULT_PATH / entry for entry in read_trigger_manifest(path)]
+            except OSError as e:
+                print(f"[WARN] Could not read trigger {path.name}: {e}")
+                continue
+            triggers[path] = listed
+            items.extend(listed)
+        else:
+            items.append(path)
+    # Listed items may have been finished (or listed twice) since the trigger was written
+    items = [path for path in dict.fromkeys(items) if path.is_file()]
+    return queue.order(items), triggers
+
+def check_off_triggers(triggers: dict, handled: set):
+    """
+    Tick the trigger manifest entries of handled items (the scheduler only
+    merges unticked ones) and delete triggers with nothing left to do.
+    """
+    for trigger_path, listed in triggers.items():
+        done = {vault_location(path) for path in listed if path.name in handled or not path.exists()}
+        try:
+            lines = trigger_path.read_text(encoding="utf-8").splitlines(keepends=True)
+            lines = ["- [x] " + line[6:] if line.startswith("- [ ] ") and line[6:].strip() in done else line
+                     for line in lines]
+            if any(line.startswith("- [ ] ") for line in lines):
+                trigger_path.write_text("".join(lines), encoding="utf-8")
+            else:
+                trigger_path.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            print(f"[WARN] Could not update trigger {trigger_path.name}: {e}")
+
+def item_prompt(action_file: Path) -> str:
+    """Prompt that limits one Qwen run to a single action file."""
+    return f"""You are a Personal AI Employee.
+
+Process ONLY this file in the AI_Employee_Vault: {vault_location(action_file)}
+Other agents are handling the other files in /Needs_Action and /In_Progress at the same time - do not touch them.
+
+1. Create /Plans/{action_file.stem}.plan.md with step-by-step checkboxes
+2. If the action requires sending emails or payments, create an approval file in /Pending_Approval
+   named APPROVAL_{action_file.stem}.md
+3. Follow all rules in Company_Handbook.md
+4. Do not edit Dashboard.md - it is updated automatically
+
+Start processing now."""
+
+def pack_prompt(action_files: list) -> str:
+    """Prompt that hands one Qwen run several small action files, each delimited with its own output paths."""
+    sections = []
+    for number, action_file in enumerate(action_files, 1):
+        content = action_file.read_text(encoding="utf-8", errors="replace").strip()
+        sections.append(f"""===== ITEM {number} of {len(action_files)}: {vault_location(action_file)} =====
+Plan file: /Plans/{action_file.stem}.plan.md
+Approval file (only if needed): /Pending_Approval/APPROVAL_{action_file.stem}.md
+{content}
+===== END ITEM {number} =====""")
+    items = "\n\n".join(sections)
+    return f"""You are a Personal AI Employee.
+
+Process ONLY the {len(action_files)} files below in the AI_Employee_Vault.
+Each file's content is included between its ITEM and END ITEM lines.
+Other agents are handling the other files in /Needs_Action and /In_Progress at the same time - do not touch them.
+
+Handle every item on its own, as if it were the only one:
+1. Create its plan file (named in its header) with step-by-step checkboxes
+2. If the action requires sending emails or payments, create its approval file (named in its header)
+3. Follow all rules in Company_Handbook.md
+4. Do not edit Dashboard.md - it is updated automatically
+
+{items}
+
+Start processing now."""
+
+def pack_items(action_files: list, pack_chars: int = PACK_CHARS, max_items: int = PACK_MAX_ITEMS,
+               item_chars: int = PACK_ITEM_CHARS) -> list:
+    """
+    Group action files into runs: small items of the same type share a run,
+    within the character budget and item limit; others run alone.
+
+    Runs keep dispatch order (a pack goes where its first item was).
+    """
+    queue = get_action_queue()
+    runs = []
+    open_packs = {}  # type -> (pack, characters)
+    for action_file in action_files:
+        try:
+            size = action_file.stat().st_size
+        except OSError:
+            continue
+        if pack_chars <= 0 or max_items <= 1 or size > min(item_chars, pack_chars):
+            runs.append([action_file])
+            continue
+        item = queue.item(action_file)
+        item_type = item["type"] if item else "unknown"
+        pack, chars = open_packs.get(item_type, (None, 0))
+        if pack is None or len(pack) >= max_items or chars + size > pack_chars:
+            pack, chars = [], 0
+            runs.append(pack)
+        pack.append(action_file)
+        open_packs[item_type] = (pack, chars + size)
+    return runs
+
+def run_items(action_files: list, timeout: int, cache: PlanCache = None, backend: LLMBackend = None) -> list:
+    """
+    Run Qwen Code once for one or more action files (reusing cached plans
+    where possible) and collect each item's outcome.
+
+    Items that already have a plan (an earlier run or cache hit, possibly
+    ticked off since) are reported as "planned" and neither re-run nor
+    overwritten.
+
+    An item in a pack counts as done when its own plan file was written.
+    Only an item's own <item>.plan.md is cached, never another item's plan
+    that happens to contain its name.
+    """
+    backend = backend or get_backend()
+    started = time.monotonic()
+    results, to_run, keys = [], [], {}
+    for action_file in action_files:
+        if (PLANS_PATH / f"{action_file.stem}.plan.md").exists():
+            results.append({"item": action_file.name, "status": "planned", "exit_code": None, "output": "",
+                            "duration_s": 0.0})
+            continue
+        key = cache.key_for(action_file) if cache else None
+        if key and cache.materialize(action_file, key, PLANS_PATH / f"{action_file.stem}.plan.md"):
+            results.append({"item": action_file.name, "status": "cached", "exit_code": None, "output": "",
+                            "duration_s": round(time.monotonic() - started, 1)})
+        else:
+            to_run.append(action_file)
+            keys[action_file.stem] = key
+    if not to_run:
+        return results
+
+    run_results = [{"item": action_file.name, "status": "ok", "exit_code": None, "output": ""}
+                   for action_file in to_run]
+    if len(to_run) > 1:
+        for result in run_results:
+            result["pack_size"] = len(to_run)
+    prompt = item_prompt(to_run[0]) if len(to_run) == 1 else pack_prompt(to_run)
+    run_started = time.time()
+    try:
+        completed = backend.run(prompt, cwd=VAULT_PATH, timeout=timeout)
+        output = ((completed.stdout or "") + (completed.stderr or ""))[-OUTPUT_TAIL:]
+        for action_file, result in zip(to_run, run_results):
+            result["exit_code"] = completed.returncode
+            result["output"] = output
+            # Only the item's own <item>.plan.md counts, for success and for caching: concurrent
+            # runs write plans for other items (FILE_report_v2 must not be taken for FILE_report)
+            new_plan = find_plan(PLANS_PATH, action_file.stem, run_started, exact=True)
+            if completed.returncode != 0 or (len(to_run) > 1 and not new_plan):
+                result["status"] = "failed"
+            elif keys[action_file.stem] and new_plan:
+                # Cache the plan unless the run also had side effects (an approval request)
+                if not has_new_approval(PENDING_APPROVAL, action_file.stem, run_started):
+                    cache.put(keys[action_file.stem], action_file.stem, new_plan.read_text(encoding="utf-8"))
+    except subprocess.TimeoutExpired as e:
+        # subprocess.run kills the process before raising (the cli backend)
+        output = e.stdout or b""
+        output = (output.decode(errors="replace") if isinstance(output, bytes) else output)[-OUTPUT_TAIL:]
+        for result in run_results:
+            result["status"] = "timeout"
+            result["output"] = output
+    except Exception as e:
+        # OSError from the cli backend, anything from an in-process callable
+        for result in run_results:
+            result["status"] = "error"
+            result["output"] = str(e)
+    duration = round(time.monotonic() - started, 1)
+    for result in run_results:
+        result["duration_s"] = duration
+    return results + run_results
+
+def run_item(action_file: Path, timeout: int, cache: PlanCache = None, backend: LLMBackend = None) -> dict:
+    """Run Qwen Code on one action file (or reuse a cached plan) and collect its outcome."""
+    return run_items([action_file], timeout, cache, backend)[0]
+
+def process_pending(workers: int = WORKERS, timeout: int = ITEM_TIMEOUT, use_cache: bool = CACHE_ENABLED,
+                    backend: LLMBackend = None, pack_chars: int = PACK_CHARS,
+                    pack_max_items: int = PACK_MAX_ITEMS) -> dict:
+    """
+    Dispatch each pending action file (or pack of small ones) to its own Qwen
+    run, `workers` at a time, most urgent first.
+
+    Items the scheduler has handed off to /In_Progress are taken from its
+    trigger files, which are checked off as their items are handled.
+
+    A slow or crashing run only affects its own items. Returns the run summary,
+    which is also written to Logs/orchestrator_last_run.json.
+    """
+    pending_files, triggers = pending_work()
+
+    if not pending_files:
+        check_off_triggers(triggers, set())
+        print("No pending actions.")
+        return {}
+
+    backend = backend or get_backend()
+    if not backend.available():
+        print(f"[ERROR] AI backend '{backend.name}' is not available (for cli: install Qwen Code and put it on PATH).")
+        return {}
+
+    runs = pack_items(pending_files, pack_chars, pack_max_items)
+    workers = max(1, min(workers, len(runs)))
+    print(f"Found {len(pending_files)} pending action(s) in {len(runs)} run(s). "
+          f"Running {backend.name} backend with {workers} worker(s)...")
+
+    cache = PlanCache(VAULT_PATH, namespace="orchestrator-item") if use_cache else None
+    started_at = datetime.now()
+    started = time.monotonic()
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_items, action_files, timeout, cache, backend) for action_files in runs]
+        for future in as_completed(futures):
+            for result in future.result():
+                results.append(result)
+                packed = f", packed x{result['pack_size']}" if result.get("pack_size") else ""
+                print(f"  [{result['status'].upper()}] {result['item']} ({result['duration_s']}s{packed})")
+    check_off_triggers(triggers, {result["item"] for result in results if result["status"] in ("ok", "cached", "planned")})
+
+    statuses = [result["status"] for result in results]
+    summary = {
+        "started_at": started_at.isoformat(),
+        "duration_s": round(time.monotonic() - started, 1),
+        "backend": backend.name,
+        "workers": workers,
+        "item_timeout_s": timeout,
+        "pack_chars": pack_chars,
+        "pack_max_items": pack_max_items,
+        "runs": len(runs),
+        "total": len(results),
+        "ok": statuses.count("ok"),
+        "cached": statuses.count("cached"),
+        "planned": statuses.count("planned"),
+        "failed": statuses.count("failed"),
+        "timeout": statuses.count("timeout"),
+        "error": statuses.count("error"),
+        "packed": sum(1 for result in results if result.get("pack_size")),
+        "results": sorted(results, key=lambda result: result["item"]),
+    }
+    summary["items_per_minute"] = round(len(results) * 60 / summary["duration_s"], 1) if summary["duration_s"] else None
+    if cache:
+        summary["plan_cache"] = cache.get_stats()
+        cache.close()
+
+    try:
+        LOGS_PATH.mkdir(parents=True, exist_ok=True)
+        RUN_SUMMARY.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    except OSError as e:
+        print(f"[WARN] Could not write run summary: {e}")
+
+    print(f"Done in {summary['duration_s']}s ({summary['runs']} run(s)): {summary['ok']} ok, {summary['cached']} from cache, "
+          f"{summary['planned']} already planned, {summary['failed']} failed, "
+          f"{summary['timeout']} timed out, {summary['error']} error(s)")
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Trigger Qwen Code on the Needs_Action folder")
+    parser.add_argument("--mode", choices=["pool", "batch"], default=ORCHESTRATOR_MODE,
+                        help="pool: one run per item in parallel; batch: one run for everything")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="concurrent qwen runs (pool mode)")
+    parser.add_argument("--timeout", type=int, default=ITEM_TIMEOUT, help="seconds per run (pool mode)")
+    parser.add_argument("--pack-chars", type=int, default=PACK_CHARS,
+                        help="character budget for packing small items into one run, 0 = one run per item (pool mode)")
+    parser.add_argument("--pack-max-items", type=int, default=PACK_MAX_ITEMS, help="items per packed run (pool mode)")
+    parser.add_argument("--no-cache", action="store_true", help="always run qwen, ignoring cached plans")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default=LLM_BACKEND,
+                        help="cli: the qwen CLI; callable: LLM_CALLABLE in-process; stub: offline load-test agent")
+    args = parser.parse_args()
+
+    backend = get_backend(args.backend)
+    if args.mode == "batch":
+        trigger_qwen(backend)
+    else:
+        process_pending(args.workers, args.timeout, CACHE_ENABLED and not args.no_cache, backend,
+                        args.pack_chars, args.pack_max_items)
 
 if __name__ == "__main__":
-    trigger_qwen()
+    main()
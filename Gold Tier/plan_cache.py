@@ -0,0 +1,215 @@
+"""
+Plan Cache - Content-addressed cache of AI-generated plans
+The same kinds of items reach Needs_Action again and again (duplicate file
+drops, repeated WhatsApp nudges, re-sent emails). Plans are cached under a
+hash of the action file's normalized content plus the Company_Handbook.md
+version, so a repeat item gets its plan written straight from the cache
+instead of costing another `qwen` run. Entries expire after a TTL and the
+least recently used ones are evicted beyond a size limit.
+"""
+
+import os
+import re
+import glob
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+VAULT_PATH = Path(os.getenv('VAULT_PATH', './AI_Employee_Vault'))
+CACHE_TTL_HOURS = float(os.getenv('PLAN_CACHE_TTL_HOURS', '168'))  # 7 days
+CACHE_MAX_ENTRIES = int(os.getenv('PLAN_CACHE_MAX_ENTRIES', '500'))
+CACHE_ENABLED = os.getenv('PLAN_CACHE_ENABLED', 'true').lower() == 'true'
+
+# Fields that differ between otherwise identical items (frontmatter keys, or
+# "**Key:**" lines in the body) and are left out of the content hash
+VOLATILE_FIELDS = {
+    'received', 'processed', 'status', 'id', 'email_id', 'message_id',
+    'created', 'created_at', 'timestamp', 'generated', 'date', 'sent_at',
+}
+# Item names shorter than this are not templated out of cached plans
+MIN_TEMPLATE_NAME = 6
+ITEM_PLACEHOLDER = '{{item}}'
+# Tolerance when comparing file mtimes with a run's start time (coarse filesystem clocks)
+MTIME_SLACK = 2.0
+
+_FIELD_RE = re.compile(r'^\s*(?:\*\*)?([A-Za-z][\w ]*?):(?:\*\*)?\s')
+
+
+def _is_volatile(line: str) -> bool:
+    """Whether a frontmatter or "**Key:** value" line carries a volatile field."""
+    match = _FIELD_RE.match(line)
+    return bool(match) and match.group(1).strip().lower().replace(' ', '_') in VOLATILE_FIELDS
+
+
+def normalize_item(text: str) -> str:
+    """Action file content with volatile fields removed and whitespace collapsed."""
+    lines = [line for line in text.splitlines() if not _is_volatile(line)]
+    return re.sub(r'\s+', ' ', '\n'.join(lines)).strip()
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's bytes ('' if it doesn't exist)."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ''
+
+
+class PlanCache:
+    """Plans keyed by normalized item content + handbook version, with TTL and LRU eviction."""
+
+    def __init__(self, vault_path: Path = VAULT_PATH, namespace: str = 'plan',
+                 ttl_hours: float = CACHE_TTL_HOURS, max_entries: int = CACHE_MAX_ENTRIES):
+        self.vault_path = Path(vault_path)
+        self.namespace = namespace
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.handbook_version = file_digest(self.vault_path / 'Company_Handbook.md')[:16]
+        self._lock = threading.Lock()
+        db_path = self.vault_path / 'Logs' / '.plan_cache.db'
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS plans (
+                key TEXT PRIMARY KEY,
+                plan TEXT NOT NULL,
+                source_item TEXT,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS plan_cache_stats (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def _count(self, name: str, amount: int = 1):
+        """Add to a persistent stats counter (caller holds the lock)."""
+        self.conn.execute(
+            'INSERT INTO plan_cache_stats (name, value) VALUES (?, ?) '
+            'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value',
+            (name, amount)
+        )
+
+    def key_for(self, action_file: Path) -> Optional[str]:
+        """Cache key of an action file (None if it can't be read)."""
+        try:
+            content = action_file.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            return None
+        payload = f"{self.namespace}\n{self.handbook_version}\n{normalize_item(content)}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, item_name: str) -> Optional[str]:
+        """Cached plan for key, written for item_name (None on a miss or expired entry)."""
+        now = time.time()
+        with self._lock, self.conn:
+            row = self.conn.execute('SELECT plan, created_at FROM plans WHERE key = ?', (key,)).fetchone()
+            if row and now - row[1] > self.ttl:
+                self.conn.execute('DELETE FROM plans WHERE key = ?', (key,))
+                self._count('expired')
+                row = None
+            if not row:
+                self._count('misses')
+                return None
+            self.conn.execute('UPDATE plans SET last_used = ?, hits = hits + 1 WHERE key = ?', (now, key))
+            self._count('hits')
+        return row[0].replace(ITEM_PLACEHOLDER, item_name)
+
+    def put(self, key: str, item_name: str, plan: str):
+        """Cache the plan generated for an item, then evict expired and least recently used entries."""
+        if len(item_name) >= MIN_TEMPLATE_NAME:
+            plan = plan.replace(item_name, ITEM_PLACEHOLDER)
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO plans (key, plan, source_item, created_at, last_used, hits) '
+                'VALUES (?, ?, ?, ?, ?, 0)',
+                (key, plan, item_name, now, now)
+            )
+            self._count('stores')
+            expired = self.conn.execute('DELETE FROM plans WHERE created_at < ?', (now - self.ttl,)).rowcount
+            evicted = self.conn.execute(
+                'DELETE FROM plans WHERE key IN (SELECT key FROM plans ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            ).rowcount
+            if expired:
+                self._count('expired', expired)
+            if evicted:
+                self._count('evicted', evicted)
+
+    def materialize(self, action_file: Path, key: str, plan_path: Path) -> bool:
+        """
+        Write the cached plan for an action file to plan_path.
+
+        Returns False on a miss, or if plan_path already exists: a plan that may
+        have been ticked off or edited is never overwritten.
+        """
+        if plan_path.exists():
+            return False
+        plan = self.get(key, action_file.stem)
+        if plan is None:
+            return False
+        plan_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(plan_path, 'x', encoding='utf-8') as f:
+                f.write(plan)
+        except FileExistsError:
+            return False
+        return True
+
+    def get_stats(self) -> Dict[str, float]:
+        """Hits, misses, stores, evictions, entry count and hit rate."""
+        with self._lock:
+            stats = dict(self.conn.execute('SELECT name, value FROM plan_cache_stats').fetchall())
+            stats['entries'] = self.conn.execute('SELECT COUNT(*) FROM plans').fetchone()[0]
+        for name in ('hits', 'misses', 'stores', 'expired', 'evicted'):
+            stats.setdefault(name, 0)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+def find_plan(plans_dir: Path, item_name: str, since: float = 0, exact: bool = False) -> Optional[Path]:
+    """
+    Plan for an item (written since a time, if given): <item>.plan.md, or a Plans file naming the item.
+
+    With exact, only <item>.plan.md counts (when several items run together,
+    a plan for FILE_ab must not be taken for FILE_a).
+    """
+    exact_path = plans_dir / f"{item_name}.plan.md"
+    if exact_path.exists() or exact:
+        candidates = [exact_path]
+    else:
+        candidates = list(plans_dir.glob(f"*{glob.escape(item_name)}*.md"))
+    for path in candidates:
+        try:
+            if path.stat().st_mtime >= since - MTIME_SLACK:
+                return path
+        except OSError:
+            continue
+    return None
+
+
+def has_new_approval(approvals_dir: Path, item_name: str, since: float) -> bool:
+    """Whether a run created an approval file for an item (such runs have side effects and aren't cached)."""
+    for path in approvals_dir.glob(f"*{glob.escape(item_name)}*"):
+        try:
+            if path.stat().st_mtime >= since - MTIME_SLACK:
+                return True
+        except OSError:
+            continue
+    return False
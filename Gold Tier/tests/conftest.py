@@ -0,0 +1,8 @@
+# Test setup: make the Gold Tier scripts and the vault modules importable
+import sys
+from pathlib import Path
+
+GOLD_TIER = Path(__file__).resolve().parent.parent
+for path in (GOLD_TIER, GOLD_TIER / "AI_Employee_Vault"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,91 @@
+# Tests for AI_Employee_Vault/action_queue.py dispatch ordering
+from datetime import datetime, timedelta
+
+import pytest
+
+import action_queue
+from action_queue import ActionQueue, dispatch_order
+
+NOW = datetime(2026, 10, 1, 12, 0)
+
+
+def write_item(folder, name, item_type="email", priority=None, minutes_ago=0):
+    lines = ["---", f"type: {item_type}", f"received: {(NOW - timedelta(minutes=minutes_ago)).isoformat()}"]
+    if priority:
+        lines.append(f"priority: {priority}")
+    path = folder / name
+    path.write_text("\n".join(lines + ["---", "", "Body"]) + "\n", encoding="utf-8")
+    return path
+
+
+def names(paths):
+    return [path.name for path in paths]
+
+
+def test_priority_then_oldest_first(tmp_path):
+    paths = [
+        write_item(tmp_path, "normal_new.md", minutes_ago=1),
+        write_item(tmp_path, "low.md", priority="low", minutes_ago=30),
+        write_item(tmp_path, "urgent.md", priority="urgent"),
+        write_item(tmp_path, "normal_old.md", minutes_ago=20),
+    ]
+    queue = ActionQueue(aging_minutes=0, source_quota=0)
+    assert names(queue.order(paths, now=NOW.timestamp())) == ["urgent.md", "normal_old.md", "normal_new.md", "low.md"]
+
+
+def test_aged_item_goes_behind_native_items_of_its_tier(tmp_path):
+    paths = [
+        write_item(tmp_path, "high_fresh.md", priority="high"),
+        write_item(tmp_path, "normal_aged.md", minutes_ago=90),
+        write_item(tmp_path, "low_twice_aged.md", priority="low", minutes_ago=150),
+        write_item(tmp_path, "normal_fresh.md", minutes_ago=5),
+    ]
+    queue = ActionQueue(aging_minutes=60, source_quota=0)
+    assert names(queue.order(paths, now=NOW.timestamp())) == [
+        "high_fresh.md", "low_twice_aged.md", "normal_aged.md", "normal_fresh.md"]
+
+
+def test_aging_never_promotes_past_high(tmp_path):
+    paths = [
+        write_item(tmp_path, "high_fresh.md", priority="high"),
+        write_item(tmp_path, "high_ancient.md", priority="high", minutes_ago=10000),
+    ]
+    queue = ActionQueue(aging_minutes=60, source_quota=0)
+    assert names(queue.order(paths, now=NOW.timestamp())) == ["high_ancient.md", "high_fresh.md"]
+
+
+def test_quota_applies_within_a_tier_only(tmp_path):
+    paths = [write_item(tmp_path, f"email_{n}.md", minutes_ago=10 - n) for n in range(3)]
+    paths.append(write_item(tmp_path, "whatsapp.md", item_type="whatsapp"))
+    paths.append(write_item(tmp_path, "low_file.md", item_type="file_drop", priority="low"))
+    queue = ActionQueue(aging_minutes=0, source_quota=1, source_quotas={"email": 2})
+    assert names(queue.order(paths, now=NOW.timestamp())) == [
+        "email_0.md", "email_1.md", "whatsapp.md", "email_2.md", "low_file.md"]
+
+
+def test_metadata_is_reparsed_only_on_change(tmp_path):
+    path = write_item(tmp_path, "item.md")
+    queue = ActionQueue()
+    assert queue.item(path)["priority"] == "normal"
+    assert queue.item(path)["priority"] == "normal"
+    assert queue.stats == {"parses": 1, "cache_hits": 1}
+
+    write_item(tmp_path, "item.md", priority="high")
+    assert queue.item(path)["priority"] == "high"
+    path.unlink()
+    assert queue.item(path) is None
+
+
+@pytest.fixture
+def fresh_queue(monkeypatch):
+    monkeypatch.setattr(action_queue, "_action_queue", ActionQueue(aging_minutes=0, source_quota=0))
+
+
+def test_dispatch_order_skips_control_files_for_work(tmp_path, fresh_queue):
+    write_item(tmp_path, "EMAIL_1.md")
+    write_item(tmp_path, "SCHEDULER_TRIGGER_1.md", item_type="scheduler_trigger")
+    write_item(tmp_path, "TEMPLATE_email.md")
+    (tmp_path / "notes.txt").write_text("not an action file", encoding="utf-8")
+
+    assert names(dispatch_order(tmp_path)) == ["EMAIL_1.md", "TEMPLATE_email.md", "SCHEDULER_TRIGGER_1.md"]
+    assert names(dispatch_order(tmp_path, exclude_prefix="TEMPLATE_", work_only=True)) == ["EMAIL_1.md"]
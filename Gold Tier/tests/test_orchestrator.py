@@ -0,0 +1,157 @@
+# Tests for orchestrator.py runs of single items and packs, with offline backends
+import pytest
+
+import orchestrator
+from llm_backend import CallableBackend, LLMBackend, StubBackend
+from plan_cache import PlanCache
+
+
+@pytest.fixture
+def vault(tmp_path, monkeypatch):
+    monkeypatch.setattr(orchestrator, "VAULT_PATH", tmp_path)
+    monkeypatch.setattr(orchestrator, "PLANS_PATH", tmp_path / "Plans")
+    monkeypatch.setattr(orchestrator, "PENDING_APPROVAL", tmp_path / "Pending_Approval")
+    (tmp_path / "Needs_Action").mkdir()
+    return tmp_path
+
+
+def write_item(vault, name, body="Please file this document."):
+    path = vault / "Needs_Action" / name
+    path.write_text(f"---\ntype: file_drop\n---\n\n{body}\n", encoding="utf-8")
+    return path
+
+
+def statuses(results):
+    return {result["item"]: result["status"] for result in results}
+
+
+def test_pack_success_writes_each_plan(vault):
+    items = [write_item(vault, "FILE_a.md"), write_item(vault, "FILE_b.md")]
+    results = orchestrator.run_items(items, timeout=30, backend=StubBackend(latency="fixed:0"))
+
+    assert statuses(results) == {"FILE_a.md": "ok", "FILE_b.md": "ok"}
+    assert all(result["pack_size"] == 2 for result in results)
+    assert (vault / "Plans" / "FILE_a.plan.md").exists()
+    assert (vault / "Plans" / "FILE_b.plan.md").exists()
+
+
+def test_pack_failure_marks_every_item(vault):
+    items = [write_item(vault, "FILE_a.md"), write_item(vault, "FILE_b.md")]
+    backend = StubBackend(latency="fixed:0", failure_rate=1)
+    results = orchestrator.run_items(items, timeout=30, backend=backend)
+
+    assert statuses(results) == {"FILE_a.md": "failed", "FILE_b.md": "failed"}
+    assert all(result["exit_code"] == 1 for result in results)
+
+
+def test_pack_item_without_its_own_plan_fails(vault):
+    items = [write_item(vault, "FILE_a.md"), write_item(vault, "FILE_ab.md")]
+
+    def plan_only_ab(prompt, cwd):
+        (cwd / "Plans").mkdir(exist_ok=True)
+        (cwd / "Plans" / "FILE_ab.plan.md").write_text("- [ ] File it\n", encoding="utf-8")
+        return "done"
+
+    cache = PlanCache(vault_path=vault)
+    try:
+        results = orchestrator.run_items(items, timeout=30, cache=cache,
+                                         backend=CallableBackend(func=plan_only_ab))
+        assert statuses(results) == {"FILE_a.md": "failed", "FILE_ab.md": "ok"}
+        assert cache.get_stats()["stores"] == 1
+    finally:
+        cache.close()
+
+
+def test_existing_plan_is_not_rerun(vault):
+    item = write_item(vault, "FILE_a.md")
+    (vault / "Plans").mkdir()
+    (vault / "Plans" / "FILE_a.plan.md").write_text("- [x] Filed\n", encoding="utf-8")
+
+    def never_called(prompt, cwd):
+        raise AssertionError("backend ran for an already planned item")
+
+    result = orchestrator.run_item(item, timeout=30, backend=CallableBackend(func=never_called))
+    assert result["status"] == "planned"
+    assert (vault / "Plans" / "FILE_a.plan.md").read_text(encoding="utf-8") == "- [x] Filed\n"
+
+
+def test_repeat_item_uses_cached_plan(vault):
+    first = write_item(vault, "FILE_first.md")
+    cache = PlanCache(vault_path=vault)
+    try:
+        backend = StubBackend(latency="fixed:0")
+        assert orchestrator.run_item(first, timeout=30, cache=cache, backend=backend)["status"] == "ok"
+        repeat = write_item(vault, "FILE_repeat.md")
+        assert orchestrator.run_item(repeat, timeout=30, cache=cache, backend=backend)["status"] == "cached"
+        assert "FILE_repeat" in (vault / "Plans" / "FILE_repeat.plan.md").read_text(encoding="utf-8")
+    finally:
+        cache.close()
+
+
+def test_pack_items_groups_small_items_by_type(vault):
+    small = [write_item(vault, f"FILE_{n}.md") for n in range(3)]
+    big = write_item(vault, "FILE_big.md", body="x" * 2000)
+    email = vault / "Needs_Action" / "EMAIL_1.md"
+    email.write_text("---\ntype: email\n---\n\nHello\n", encoding="utf-8")
+
+    runs = orchestrator.pack_items(small[:2] + [big, email, small[2]], pack_chars=6000,
+                                   max_items=8, item_chars=1500)
+    assert runs == [small, [big], [email]]
+    assert orchestrator.pack_items(small, pack_chars=0) == [[path] for path in small]
+
+
+def test_single_item_ignores_a_neighbours_plan(vault):
+    item = write_item(vault, "FILE_report.md")
+
+    def plan_for_neighbour(prompt, cwd):
+        # Another worker's run finishes FILE_report_v2 while this one writes nothing
+        (cwd / "Plans").mkdir(exist_ok=True)
+        (cwd / "Plans" / "FILE_report_v2.plan.md").write_text("- [ ] File v2\n", encoding="utf-8")
+        return "done"
+
+    cache = PlanCache(vault_path=vault)
+    try:
+        orchestrator.run_item(item, timeout=30, cache=cache, backend=CallableBackend(func=plan_for_neighbour))
+        assert cache.get_stats()["stores"] == 0
+        assert cache.get(cache.key_for(item), "FILE_report") is None
+    finally:
+        cache.close()
+
+
+def test_pool_mode_processes_scheduler_hand_off(vault, monkeypatch):
+    monkeypatch.setattr(orchestrator, "NEEDS_ACTION", vault / "Needs_Action")
+    monkeypatch.setattr(orchestrator, "LOGS_PATH", vault / "Logs")
+    monkeypatch.setattr(orchestrator, "RUN_SUMMARY", vault / "Logs" / "orchestrator_last_run.json")
+    (vault / "In_Progress").mkdir()
+    for name in ("FILE_moved.md", "FILE_done.md"):
+        (vault / "In_Progress" / name).write_text("---\ntype: file_drop\n---\n\nFile this.\n", encoding="utf-8")
+    (vault / "In_Progress" / "FILE_done.md").unlink()
+    trigger = vault / "Needs_Action" / "SCHEDULER_TRIGGER_2026-10-01-09-00.md"
+    trigger.write_text("---\ntype: scheduler_trigger\n---\n\n## Items\n"
+                       "- [ ] In_Progress/FILE_moved.md\n- [ ] In_Progress/FILE_done.md\n", encoding="utf-8")
+    write_item(vault, "FILE_new.md")
+
+    prompts = []
+
+    def plan_each(prompt, cwd):
+        prompts.append(prompt)
+        (cwd / "Plans").mkdir(exist_ok=True)
+        for name in ("FILE_moved", "FILE_new"):
+            if f"/{name}.md" in prompt:
+                (cwd / "Plans" / f"{name}.plan.md").write_text("- [ ] File it\n", encoding="utf-8")
+        return "done"
+
+    summary = orchestrator.process_pending(workers=1, use_cache=False, pack_chars=0,
+                                           backend=CallableBackend(func=plan_each))
+    assert {result["item"]: result["status"] for result in summary["results"]} == {
+        "FILE_moved.md": "ok", "FILE_new.md": "ok"}
+    assert any("In_Progress/FILE_moved.md" in prompt for prompt in prompts)
+    assert not trigger.exists()
+
+
+def test_incomplete_backend_fails_when_created():
+    class NoRun(LLMBackend):
+        name = "no-run"
+
+    with pytest.raises(TypeError):
+        NoRun()
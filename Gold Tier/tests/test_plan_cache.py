@@ -0,0 +1,125 @@
+# Tests for plan_cache.py (cache keys, hits and misses, never overwriting plans)
+import time
+from pathlib import Path
+
+import pytest
+
+import plan_cache
+from plan_cache import PlanCache, normalize_item, find_plan
+
+GOLD_TIER = Path(__file__).resolve().parent.parent
+SILVER_TIER = GOLD_TIER.parent / "Silver Tier"
+
+ITEM = """---
+type: email
+from: client@example.com
+received: {received}
+status: pending
+---
+
+**Subject:** Invoice request
+**Date:** {received}
+
+Please send the invoice for March.
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = PlanCache(vault_path=tmp_path)
+    yield cache
+    cache.close()
+
+
+def write_item(folder: Path, name: str, received: str = "2026-03-01T09:00:00") -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / name
+    path.write_text(ITEM.format(received=received), encoding="utf-8")
+    return path
+
+
+def test_normalize_item_drops_volatile_fields():
+    first = normalize_item(ITEM.format(received="2026-03-01T09:00:00"))
+    second = normalize_item(ITEM.format(received="2026-03-05T17:30:00"))
+    assert first == second
+    assert "received" not in first
+    assert "**Date:**" not in first
+    assert "Please send the invoice for March." in first
+
+
+def test_key_for_ignores_volatile_fields_but_not_content(cache, tmp_path):
+    first = write_item(tmp_path / "Needs_Action", "EMAIL_one.md")
+    second = write_item(tmp_path / "Needs_Action", "EMAIL_two.md", received="2026-03-09T08:15:00")
+    assert cache.key_for(first) == cache.key_for(second)
+
+    third = write_item(tmp_path / "Needs_Action", "EMAIL_three.md")
+    third.write_text(third.read_text(encoding="utf-8").replace("March", "April"), encoding="utf-8")
+    assert cache.key_for(third) != cache.key_for(first)
+    assert cache.key_for(tmp_path / "Needs_Action" / "missing.md") is None
+
+
+def test_key_for_changes_with_handbook(tmp_path):
+    item = write_item(tmp_path / "Needs_Action", "EMAIL_one.md")
+    before = PlanCache(vault_path=tmp_path)
+    (tmp_path / "Company_Handbook.md").write_text("Reply within 24 hours.", encoding="utf-8")
+    after = PlanCache(vault_path=tmp_path)
+    try:
+        assert before.key_for(item) != after.key_for(item)
+    finally:
+        before.close()
+        after.close()
+
+
+def test_get_put_hit_and_miss(cache):
+    assert cache.get("key", "EMAIL_second") is None
+    cache.put("key", "EMAIL_first", "# Plan: EMAIL_first\n- [ ] Reply to EMAIL_first\n")
+    assert cache.get("key", "EMAIL_second") == "# Plan: EMAIL_second\n- [ ] Reply to EMAIL_second\n"
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["stores"], stats["entries"]) == (1, 1, 1, 1)
+
+
+def test_expired_entries_miss(tmp_path):
+    cache = PlanCache(vault_path=tmp_path, ttl_hours=0)
+    try:
+        cache.put("key", "EMAIL_first", "plan")
+        time.sleep(0.01)
+        assert cache.get("key", "EMAIL_first") is None
+    finally:
+        cache.close()
+
+
+def test_materialize_writes_cached_plan(cache, tmp_path):
+    item = write_item(tmp_path / "Needs_Action", "EMAIL_second.md")
+    key = cache.key_for(item)
+    plan_path = tmp_path / "Plans" / "EMAIL_second.plan.md"
+    assert not cache.materialize(item, key, plan_path)
+    assert not plan_path.exists()
+
+    cache.put(key, "EMAIL_first", "# Plan: EMAIL_first\n")
+    assert cache.materialize(item, key, plan_path)
+    assert plan_path.read_text(encoding="utf-8") == "# Plan: EMAIL_second\n"
+
+
+def test_materialize_never_overwrites(cache, tmp_path):
+    item = write_item(tmp_path / "Needs_Action", "EMAIL_second.md")
+    key = cache.key_for(item)
+    cache.put(key, "EMAIL_first", "# Plan: EMAIL_first\n")
+    plan_path = tmp_path / "Plans" / "EMAIL_second.plan.md"
+    plan_path.parent.mkdir()
+    plan_path.write_text("- [x] Already replied\n", encoding="utf-8")
+
+    assert not cache.materialize(item, key, plan_path)
+    assert plan_path.read_text(encoding="utf-8") == "- [x] Already replied\n"
+
+
+def test_find_plan_exact(tmp_path):
+    (tmp_path / "FILE_ab.plan.md").write_text("plan", encoding="utf-8")
+    assert find_plan(tmp_path, "FILE_a") == tmp_path / "FILE_ab.plan.md"
+    assert find_plan(tmp_path, "FILE_a", exact=True) is None
+    assert find_plan(tmp_path, "FILE_ab", exact=True) == tmp_path / "FILE_ab.plan.md"
+
+
+@pytest.mark.parametrize("module", ["plan_cache.py", "llm_backend.py"])
+def test_tier_copies_match(module):
+    # Gold and Silver each ship their own copy; they must not drift apart
+    assert (GOLD_TIER / module).read_bytes() == (SILVER_TIER / module).read_bytes()
@@ -0,0 +1,303 @@
+"""
+LLM Backend - How the orchestrator and scheduler invoke the AI
+Every AI run goes through a backend's run(prompt, cwd, timeout), which
+returns a subprocess.CompletedProcess and raises subprocess.TimeoutExpired
+on timeout, whatever actually does the work:
+
+- cli: an external agent CLI (default `qwen -p <prompt>`)
+- callable: a Python function "module:function" called in-process with
+  (prompt, cwd) and returning its output, or an (exit_code, output) pair
+- stub: a deterministic offline stand-in that writes realistic plan and
+  approval files after a sampled latency, and fails or times out at
+  configurable rates, for benchmarking the pipeline without the CLI or a
+  network
+
+Choose one with LLM_BACKEND.
+"""
+
+import os
+import re
+import time
+import shlex
+import random
+import shutil
+import hashlib
+import importlib
+import subprocess
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+LLM_BACKEND = os.getenv('LLM_BACKEND', 'cli')  # cli, callable, stub
+LLM_CLI_COMMAND = os.getenv('LLM_CLI_COMMAND', 'qwen -p')
+LLM_CALLABLE = os.getenv('LLM_CALLABLE', '')  # module:function
+# Stub latency distribution in ms: fixed:<ms>, uniform:<min>-<max>, exp:<mean> or lognormal:<median>,<sigma>
+LLM_STUB_LATENCY = os.getenv('LLM_STUB_LATENCY', 'lognormal:2000,0.5')
+LLM_STUB_FAILURE_RATE = float(os.getenv('LLM_STUB_FAILURE_RATE', '0'))
+LLM_STUB_TIMEOUT_RATE = float(os.getenv('LLM_STUB_TIMEOUT_RATE', '0'))
+LLM_STUB_SEED = os.getenv('LLM_STUB_SEED', '0')
+
+# Item files a prompt refers to: "- NAME.md" list entries, or Needs_Action/NAME.md and In_Progress/NAME.md
+_ITEM_RE = re.compile(r'(?:^\s*- (?:\[ \] )?(?:(?:Needs_Action|In_Progress)/)?|\b(?:Needs_Action|In_Progress)/)'
+                      r'([^\n/]+?\.md)\b', re.MULTILINE)
+# Words in an item that mean its plan involves sending something or paying
+_APPROVAL_RE = re.compile(r'\b(reply|send|email back|invoice|payment|pay|transfer|quote)\b', re.IGNORECASE)
+# Item types that are instructions to the AI, not work items
+CONTROL_TYPES = {'scheduler_trigger'}
+
+
+class LLMBackend(ABC):
+    """Runs a prompt in a working directory."""
+
+    name = 'base'
+
+    def available(self) -> bool:
+        """Whether the backend can run here."""
+        return True
+
+    @abstractmethod
+    def run(self, prompt: str, cwd: Path, timeout: Optional[float] = None,
+            capture: bool = True) -> subprocess.CompletedProcess:
+        """
+        Run a prompt.
+
+        Args:
+            prompt: Instructions for the agent
+            cwd: Directory the agent works in (the vault)
+            timeout: Seconds before the run is abandoned (None = no limit)
+            capture: Return the output instead of printing it
+
+        Raises:
+            subprocess.TimeoutExpired: The run took longer than timeout
+        """
+
+    def _finish(self, args, code: int, output: str, capture: bool) -> subprocess.CompletedProcess:
+        """Wrap an in-process result like a finished subprocess."""
+        if not capture:
+            print(output)
+        return subprocess.CompletedProcess(args, code, output if capture else None, '' if capture else None)
+
+
+class CLIBackend(LLMBackend):
+    """An agent CLI run as a subprocess with the prompt as its last argument."""
+
+    name = 'cli'
+
+    def __init__(self, command: str = LLM_CLI_COMMAND):
+        self.command = shlex.split(command)
+
+    def available(self) -> bool:
+        return shutil.which(self.command[0]) is not None
+
+    def run(self, prompt: str, cwd: Path, timeout: Optional[float] = None,
+            capture: bool = True) -> subprocess.CompletedProcess:
+        return subprocess.run(self.command + [prompt], cwd=cwd, capture_output=capture,
+                              text=True, timeout=timeout)
+
+
+class CallableBackend(LLMBackend):
+    """A Python function called in-process: fn(prompt, cwd) -> output or (exit_code, output)."""
+
+    name = 'callable'
+
+    def __init__(self, target: str = LLM_CALLABLE, func=None):
+        self.target = target
+        self.func = func
+
+    def _load(self):
+        """Import the configured function on first use."""
+        if self.func is None:
+            module_name, _, func_name = self.target.partition(':')
+            if not module_name or not func_name:
+                raise ValueError(f"LLM_CALLABLE must be module:function, got {self.target!r}")
+            self.func = getattr(importlib.import_module(module_name), func_name)
+        return self.func
+
+    def available(self) -> bool:
+        try:
+            self._load()
+            return True
+        except (ImportError, AttributeError, ValueError) as e:
+            print(f"[WARN] LLM callable backend unavailable: {e}")
+            return False
+
+    def run(self, prompt: str, cwd: Path, timeout: Optional[float] = None,
+            capture: bool = True) -> subprocess.CompletedProcess:
+        # Runs in-process, so the timeout is only checked afterwards
+        started = time.monotonic()
+        result = self._load()(prompt, Path(cwd))
+        code, output = result if isinstance(result, tuple) else (0, result or '')
+        if timeout is not None and time.monotonic() - started > timeout:
+            raise subprocess.TimeoutExpired(self.target, timeout, output=output)
+        return self._finish(self.target, code, output, capture)
+
+
+def sample_latency(spec: str, rng: random.Random) -> float:
+    """Draw a latency in seconds from a distribution spec such as 'uniform:100-800' (ms)."""
+    kind, _, params = spec.partition(':')
+    kind = kind.strip().lower()
+    if kind == 'fixed':
+        ms = float(params)
+    elif kind == 'uniform':
+        low, high = (float(value) for value in params.split('-'))
+        ms = rng.uniform(low, high)
+    elif kind == 'exp':
+        ms = rng.expovariate(1.0 / float(params))
+    elif kind == 'lognormal':
+        median, sigma = (float(value) for value in params.split(','))
+        ms = median * rng.lognormvariate(0.0, sigma)
+    else:
+        raise ValueError(f"Unknown latency distribution: {spec!r}")
+    return max(0.0, ms) / 1000.0
+
+
+def _read_frontmatter(text: str) -> dict:
+    """Frontmatter key/value pairs of a note."""
+    fields = {}
+    if text.startswith('---'):
+        for line in text.splitlines()[1:]:
+            if line.strip() == '---':
+                break
+            key, sep, value = line.partition(':')
+            if sep and not key.startswith(' '):
+                fields[key.strip()] = value.strip()
+    return fields
+
+
+class StubBackend(LLMBackend):
+    """
+    Deterministic offline agent for load tests.
+
+    For every item file the prompt names (in Needs_Action or In_Progress) it
+    writes Plans/<item>.plan.md, plus Pending_Approval/APPROVAL_<item>.md when
+    the item asks for a reply, invoice or payment. Latency, failures and
+    timeouts are drawn from a generator seeded with LLM_STUB_SEED and the
+    prompt, so the same prompt always behaves the same way.
+    """
+
+    name = 'stub'
+
+    def __init__(self, latency: str = LLM_STUB_LATENCY, failure_rate: float = LLM_STUB_FAILURE_RATE,
+                 timeout_rate: float = LLM_STUB_TIMEOUT_RATE, seed: str = LLM_STUB_SEED):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.timeout_rate = timeout_rate
+        self.seed = seed
+
+    def _rng(self, prompt: str) -> random.Random:
+        digest = hashlib.sha256(f"{self.seed}\n{prompt}".encode('utf-8')).hexdigest()
+        return random.Random(int(digest[:16], 16))
+
+    def _items(self, prompt: str, cwd: Path) -> list:
+        """Existing item files named in the prompt, in prompt order."""
+        items = []
+        for match in _ITEM_RE.finditer(prompt):
+            name = match.group(1).strip()
+            for folder in ('Needs_Action', 'In_Progress'):
+                path = cwd / folder / name
+                if path.is_file() and path not in items:
+                    items.append(path)
+                    break
+        return items
+
+    def _plan(self, item: Path, fields: dict, needs_approval: bool) -> str:
+        """A plan note shaped like the ones the real agent writes."""
+        item_type = fields.get('type', 'task')
+        steps = {
+            'email': ['Read the email and identify what is being asked',
+                      'Check Company_Handbook.md for the matching policy',
+                      'Draft a reply'],
+            'whatsapp': ['Read the message and identify the request',
+                         'Check Company_Handbook.md for the matching policy',
+                         'Prepare a response'],
+            'file_drop': ['Open the dropped file and summarize its contents',
+                          'Decide where the file belongs',
+                          'File it and note any follow-up'],
+        }.get(item_type, ['Review the item', 'Check Company_Handbook.md', 'Carry out the task'])
+        if needs_approval:
+            steps.append(f'Wait for approval of APPROVAL_{item.stem}.md')
+        steps.append('Move the item to /Done')
+        checklist = '\n'.join(f'- [ ] {step}' for step in steps)
+        return f"""---
+type: plan
+item: {item.name}
+created: {datetime.now().isoformat()}
+status: in_progress
+generated_by: stub
+---
+
+# Plan: {item.stem}
+
+## Objective
+Handle the {item_type} item {item.name}{' from ' + fields['from'] if fields.get('from') else ''}.
+
+## Steps
+{checklist}
+
+## Estimated Completion
+{len(steps) * 5} minutes
+
+## Dependencies
+{'Human approval in /Pending_Approval' if needs_approval else 'None'}
+"""
+
+    def _approval(self, item: Path, fields: dict) -> str:
+        """An approval request for an item's outgoing action."""
+        return f"""---
+type: approval_request
+action: {'send_email' if fields.get('type') == 'email' else 'review_action'}
+item: {item.name}
+created: {datetime.now().isoformat()}
+status: pending
+generated_by: stub
+---
+
+# Approval Required: {item.stem}
+
+The plan for {item.name} involves sending a reply or making a payment.
+Move this file to /Approved to proceed or /Rejected to cancel.
+"""
+
+    def run(self, prompt: str, cwd: Path, timeout: Optional[float] = None,
+            capture: bool = True) -> subprocess.CompletedProcess:
+        cwd = Path(cwd)
+        rng = self._rng(prompt)
+        latency = sample_latency(self.latency, rng)
+        roll = rng.random()
+        if roll < self.timeout_rate or (timeout is not None and latency > timeout):
+            time.sleep(timeout if timeout is not None else latency)
+            raise subprocess.TimeoutExpired('stub', timeout, output='stub: timed out')
+        time.sleep(latency)
+        if roll < self.timeout_rate + self.failure_rate:
+            return self._finish('stub', 1, 'stub: simulated failure', capture)
+
+        plans = approvals = 0
+        for item in self._items(prompt, cwd):
+            text = item.read_text(encoding='utf-8', errors='ignore')
+            fields = _read_frontmatter(text)
+            if fields.get('type') in CONTROL_TYPES:
+                continue
+            needs_approval = bool(_APPROVAL_RE.search(text))
+            plan_path = cwd / 'Plans' / f'{item.stem}.plan.md'
+            plan_path.parent.mkdir(parents=True, exist_ok=True)
+            plan_path.write_text(self._plan(item, fields, needs_approval), encoding='utf-8')
+            plans += 1
+            if needs_approval:
+                approval_path = cwd / 'Pending_Approval' / f'APPROVAL_{item.stem}.md'
+                approval_path.parent.mkdir(parents=True, exist_ok=True)
+                approval_path.write_text(self._approval(item, fields), encoding='utf-8')
+                approvals += 1
+        output = f'stub: {plans} plan(s), {approvals} approval request(s) in {latency:.2f}s'
+        return self._finish('stub', 0, output, capture)
+
+
+BACKENDS = {'cli': CLIBackend, 'callable': CallableBackend, 'stub': StubBackend}
+
+
+def get_backend(name: str = LLM_BACKEND) -> LLMBackend:
+    """Create the backend named by LLM_BACKEND (or the given name)."""
+    try:
+        return BACKENDS[name.strip().lower()]()
+    except KeyError:
+        raise ValueError(f"Unknown LLM backend {name!r} (choose from {', '.join(BACKENDS)})")
@@ -18,6 +18,9 @@ from dotenv import load_dotenv
 
 import schedule
 
+from plan_cache import PlanCache, CACHE_ENABLED, find_plan, has_new_approval
+from llm_backend import get_backend
+
 # Load environment variables
 load_dotenv()
 
@@ -36,6 +39,7 @@ VAULT_PATH = Path(os.getenv('VAULT_PATH', './AI_Employee_Vault'))
 NEEDS_ACTION = VAULT_PATH / 'Needs_Action'
 IN_PROGRESS = VAULT_PATH / 'In_Progress'
 PLANS_PATH = VAULT_PATH / 'Plans'
+PENDING_APPROVAL = VAULT_PATH / 'Pending_Approval'
 DONE_PATH = VAULT_PATH / 'Done'
 APPROVED_PATH = VAULT_PATH / 'Approved'
 REJECTED_PATH = VAULT_PATH / 'Rejected'
@@ -50,6 +54,8 @@ class Scheduler:
     def __init__(self):
         self._initialize()
         self._load_state()
+        self.plan_cache = PlanCache(VAULT_PATH, namespace='silver-batch') if CACHE_ENABLED else None
+        self.backend = get_backend()
     
     def _initialize(self):
         """Initialize scheduler paths."""
@@ -99,11 +105,34 @@ class Scheduler:
             logger.error(f"Error checking needs action: {e}")
     
     def _trigger_qwen_processing(self):
-        """Trigger Qwen Code to process pending files."""
+        """Trigger Qwen Code to process pending files (repeat items get their plan from the cache)."""
         try:
-            prompt = """You are a Personal AI Employee (Silver Tier).
+            # Items with a plan already (e.g. served from the cache) need no new one
+            items = [f for f in IN_PROGRESS.glob('*.md') if not find_plan(PLANS_PATH, f.stem)]
+            
+            keys = {}
+            if self.plan_cache:
+                for filepath in list(items):
+                    key = self.plan_cache.key_for(filepath)
+                    # Same plan name and hand-back as the agent path in the prompt below
+                    plan_path = PLANS_PATH / f"PLAN_{filepath.stem}_{datetime.now().strftime('%Y-%m-%d')}.md"
+                    if key and self.plan_cache.materialize(filepath, key, plan_path):
+                        logger.info(f"Plan served from cache: {filepath.name}")
+                        items.remove(filepath)
+                        if not (NEEDS_ACTION / filepath.name).exists():
+                            filepath.rename(NEEDS_ACTION / filepath.name)
+                    else:
+                        keys[filepath.stem] = key
+            
+            if not items:
+                logger.info("No items need Qwen Code processing")
+                return
+            
+            file_list = '\n'.join(f"- {filepath.name}" for filepath in items)
+            prompt = f"""You are a Personal AI Employee (Silver Tier).
 
-Read all files in the /In_Progress folder of the AI_Employee_Vault.
+Read these files in the /In_Progress folder of the AI_Employee_Vault:
+{file_list}
 
 For each file:
 1. Create a PLAN_<taskname>_<date>.md file in /Plans/ with step-by-step checkboxes
@@ -120,27 +149,19 @@ After creating plans, move the original files back to /Needs_Action/ for process
 
 Start processing now."""
             
-            # Change to vault directory
-            original_dir = os.getcwd()
-            os.chdir(VAULT_PATH)
-            
-            # Run Qwen Code with the prompt
-            logger.info("Triggering Qwen Code for processing...")
-            result = subprocess.run(
-                ['qwen', '-p', prompt],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            # Run Qwen Code (or the configured LLM_BACKEND) with the prompt, in the vault directory
+            logger.info(f"Triggering Qwen Code for {len(items)} item(s) ({self.backend.name} backend)...")
+            run_started = time.time()
+            result = self.backend.run(prompt, cwd=VAULT_PATH, timeout=300)  # 5 minute timeout
             
             if result.returncode == 0:
                 logger.info("Qwen Code processing completed")
+                if self.plan_cache:
+                    self._cache_new_plans(keys, run_started)
             else:
                 logger.warning(f"Qwen Code returned: {result.returncode}")
                 logger.debug(f"Stderr: {result.stderr}")
             
-            os.chdir(original_dir)
-            
         except subprocess.TimeoutExpired:
             logger.error("Qwen Code processing timed out")
         except FileNotFoundError:
@@ -148,6 +169,16 @@ Start processing now."""
         except Exception as e:
             logger.error(f"Error triggering Qwen: {e}")
     
+    def _cache_new_plans(self, keys: dict, since: float):
+        """Cache the plans a Qwen run wrote, except for items that also needed an approval."""
+        for stem, key in keys.items():
+            if not key:
+                continue
+            plan_path = find_plan(PLANS_PATH, stem, since)
+            if plan_path and not has_new_approval(PENDING_APPROVAL, stem, since):
+                self.plan_cache.put(key, stem, plan_path.read_text(encoding='utf-8'))
+        logger.info(f"Plan cache: {self.plan_cache.get_stats()}")
+    
     def check_approved_folder(self):
         """Check /Approved/ folder and trigger email sending."""
         try: